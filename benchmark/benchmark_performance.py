@@ -0,0 +1,241 @@
+import json
+import logging
+import os
+import platform
+import threading
+import time
+from abc import ABC
+from datetime import datetime
+from itertools import product
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import psutil
+from fedot.core.data.data import InputData
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+from benchmark.abstract_bench import AbstractBenchmark
+from fedot_ind.core.repository.IndustrialOperationParameters import IndustrialOperationParameters
+from fedot_ind.core.repository.model_repository import AtomizedModel, TEMPORARY_EXCLUDED
+
+PERFORMANCE_OPERATIONS = ['quantile_extractor',
+                          'eigen_basis',
+                          'wavelet_basis',
+                          'fourier_basis',
+                          'recurrence_extractor',
+                          'topological_extractor',
+                          'minirocket_extractor',
+                          'inception_model',
+                          'omniscale_model',
+                          'resnet_model',
+                          'tst_model',
+                          'xcm_model']
+CASE_COLUMNS = ['operation', 'n_samples', 'series_length', 'n_channels']
+TIME_COLUMNS = ['fit_time', 'transform_time']
+RESULT_COLUMNS = CASE_COLUMNS + TIME_COLUMNS + ['peak_rss_mb', 'throughput', 'error']
+
+
+class PeakMemorySampler:
+    """Context manager which samples resident set size of the process in a background thread.
+
+    Args:
+        interval: sampling interval in seconds.
+
+    Attributes:
+        peak_rss: peak resident set size in bytes observed inside the context.
+
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak_rss = 0
+        self._process = psutil.Process(os.getpid())
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.peak_rss = self._process.memory_info().rss
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+
+
+class BenchmarkPerformance(AbstractBenchmark, ABC):
+    """Benchmark of speed and memory consumption of industrial operations on synthetic data.
+
+    Every operation is fitted and applied to random multichannel series for each combination of the grid of
+    sample counts, series lengths and channel counts. Wall time of fit and transform (or predict for the NN
+    models), peak RSS growth of the first run and transform throughput are written to ``performance_report.json``
+    and ``performance_report.csv``. When a baseline report is given, results are compared with it and slowdowns
+    or growth of peak RSS above ``tolerance`` are reported as regressions.
+
+    Args:
+        operations: names of the operations from the industrial model repository.
+        n_samples: grid of the numbers of samples.
+        series_length: grid of the series lengths.
+        n_channels: grid of the numbers of channels.
+        n_repeats: number of runs of every case, median time is reported. Memory is taken from the first run,
+            since the following ones reuse memory already allocated by the process.
+        operation_params: dict of hyperparameters of the operations by their names, default ones are used
+            for the rest.
+        baseline_path: path to the report of the previous run to compare with.
+        tolerance: relative slowdown or memory growth which is considered as regression.
+        output_dir: folder of the reports.
+
+    Example:
+        Compare extractors with the report of the previous release::
+
+            benchmark = BenchmarkPerformance(operations=['quantile_extractor', 'fourier_basis'],
+                                             baseline_path='./performance/baseline_report.json')
+            results = benchmark.run()
+            regressions = benchmark.compare_with_baseline(results)
+
+    """
+
+    def __init__(self,
+                 operations: Sequence[str] = None,
+                 n_samples: Sequence[int] = (100, 500),
+                 series_length: Sequence[int] = (100, 500),
+                 n_channels: Sequence[int] = (1, 3),
+                 n_repeats: int = 3,
+                 operation_params: Optional[dict] = None,
+                 baseline_path: Optional[str] = None,
+                 tolerance: float = 0.2,
+                 output_dir: str = './performance/benchmark_results'):
+
+        super(BenchmarkPerformance, self).__init__(output_dir=output_dir)
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.operations = PERFORMANCE_OPERATIONS if operations is None else list(operations)
+        self.grid = list(product(n_samples, series_length, n_channels))
+        self.n_repeats = n_repeats
+        self.operation_params = operation_params or {}
+        self.baseline_path = baseline_path
+        self.tolerance = tolerance
+        # slowdowns shorter than this number of seconds are treated as noise
+        self.time_resolution = 0.01
+        # growth of peak RSS smaller than this number of megabytes is treated as noise
+        self.memory_resolution = 1.0
+
+    @staticmethod
+    def operation_class(operation: str):
+        registries = [model_group.value for model_group in AtomizedModel] + list(TEMPORARY_EXCLUDED.values())
+        for registry in registries:
+            if operation in registry:
+                return registry[operation]
+        raise ValueError(f'Operation {operation} is absent in the industrial model repository')
+
+    @staticmethod
+    def generate_data(n_samples: int, series_length: int, n_channels: int, seed: int = 0) -> InputData:
+        rng = np.random.default_rng(seed)
+        features = np.cumsum(rng.normal(size=(n_samples, n_channels, series_length)), axis=-1)
+        return InputData(idx=np.arange(n_samples),
+                         features=features,
+                         target=rng.integers(0, 2, size=(n_samples, 1)),
+                         task=Task(TaskTypesEnum.classification),
+                         data_type=DataTypesEnum.image)
+
+    def _run_once(self, operation: str, input_data: InputData) -> dict:
+        params = IndustrialOperationParameters.from_operation_type(operation,
+                                                                   **self.operation_params.get(operation, {}))
+        model = self.operation_class(operation)(params)
+        apply = model.transform if hasattr(model, 'transform') else model.predict
+        with PeakMemorySampler() as sampler:
+            start_rss = sampler.peak_rss
+            start = time.perf_counter()
+            model.fit(input_data)
+            fit_time = time.perf_counter() - start
+            start = time.perf_counter()
+            apply(input_data)
+            transform_time = time.perf_counter() - start
+        return {'fit_time': fit_time,
+                'transform_time': transform_time,
+                'peak_rss_mb': (sampler.peak_rss - start_rss) / 2 ** 20}
+
+    def evaluate_case(self, operation: str, n_samples: int, series_length: int, n_channels: int) -> dict:
+        case = dict(zip(CASE_COLUMNS, (operation, n_samples, series_length, n_channels)))
+        input_data = self.generate_data(n_samples, series_length, n_channels)
+        try:
+            runs = pd.DataFrame([self._run_once(operation, input_data) for _ in range(self.n_repeats)])
+        except Exception as ex:
+            self.logger.warning(f'{operation} failed on {case}: {ex}')
+            return {**case, 'error': repr(ex)}
+        result = {**case,
+                  'fit_time': runs['fit_time'].median(),
+                  'transform_time': runs['transform_time'].median(),
+                  'peak_rss_mb': runs['peak_rss_mb'].iloc[0],
+                  'error': None}
+        # transform of small cases may be faster than resolution of the timer
+        result['throughput'] = n_samples / result['transform_time'] if result['transform_time'] > 0 else np.nan
+        self.logger.info(f'{operation} on {case}: fit {result["fit_time"]:.3f} s, '
+                         f'transform {result["transform_time"]:.3f} s')
+        return result
+
+    def run(self) -> pd.DataFrame:
+        self.logger.info('Performance benchmark started')
+        # failed cases have no measurements, so columns are fixed to keep them when every case fails
+        results = pd.DataFrame([self.evaluate_case(operation, *case)
+                                for operation in self.operations for case in self.grid]).reindex(columns=RESULT_COLUMNS)
+        self._create_report(results)
+        if self.baseline_path is not None:
+            comparison = self.compare_with_baseline(results)
+            comparison.to_csv(os.path.join(self.output_dir, 'baseline_comparison.csv'), index=False)
+            regressions = comparison[comparison['regression']]
+            for _, row in regressions.iterrows():
+                self.logger.warning(f'Performance regression of {row["operation"]} on '
+                                    f'{row[CASE_COLUMNS[1:]].to_dict()}')
+        self.logger.info('Performance benchmark finished')
+        return results
+
+    def _create_report(self, results: pd.DataFrame):
+        report = {'created': datetime.now().isoformat(),
+                  'environment': {'python': platform.python_version(),
+                                  'platform': platform.platform(),
+                                  'cpu_count': os.cpu_count(),
+                                  'numpy': np.__version__},
+                  # NaN of failed cases is not valid json
+                  'results': json.loads(results.to_json(orient='records'))}
+        with open(os.path.join(self.output_dir, 'performance_report.json'), 'w') as file:
+            json.dump(report, file, indent=2)
+        results.to_csv(os.path.join(self.output_dir, 'performance_report.csv'), index=False)
+        return report
+
+    def compare_with_baseline(self, results: pd.DataFrame, baseline_path: Optional[str] = None) -> pd.DataFrame:
+        """Compares results with the baseline report.
+
+        Args:
+            results: results of :meth:`run`.
+            baseline_path: path to ``performance_report.json`` of the baseline run, ``baseline_path`` of the
+                benchmark by default.
+
+        Returns:
+            results joined with the baseline, ratios of the times and peak RSS to the baseline ones and
+            ``regression`` flag.
+
+        """
+        with open(baseline_path or self.baseline_path, 'r') as file:
+            baseline = pd.DataFrame(json.load(file)['results'])
+        baseline = baseline.reindex(columns=CASE_COLUMNS + TIME_COLUMNS + ['peak_rss_mb'])
+        results = results.reindex(columns=RESULT_COLUMNS)
+        comparison = results.merge(baseline, on=CASE_COLUMNS, how='left', suffixes=('', '_baseline'))
+        comparison['regression'] = False
+        resolutions = {**dict.fromkeys(TIME_COLUMNS, self.time_resolution), 'peak_rss_mb': self.memory_resolution}
+        for column, resolution in resolutions.items():
+            comparison[f'{column}_ratio'] = comparison[column] / comparison[f'{column}_baseline']
+            growth = comparison[column] - comparison[f'{column}_baseline']
+            comparison['regression'] |= (comparison[f'{column}_ratio'] > 1 + self.tolerance) & (growth > resolution)
+        return comparison
@@ -0,0 +1,17 @@
+from benchmark.benchmark_performance import BenchmarkPerformance
+
+operation_params = {'inception_model': {'epochs': 5},
+                    'omniscale_model': {'epochs': 5},
+                    'resnet_model': {'epochs': 5},
+                    'tst_model': {'epochs': 5},
+                    'xcm_model': {'epochs': 5}}
+
+if __name__ == "__main__":
+    benchmark = BenchmarkPerformance(n_samples=[100, 500],
+                                     series_length=[100, 500],
+                                     n_channels=[1, 3],
+                                     n_repeats=3,
+                                     operation_params=operation_params,
+                                     baseline_path=None)
+    results = benchmark.run()
+    print(results)
@@ -14,8 +14,9 @@ from golem.core.tuning.simultaneous import SimultaneousTuner
 
 from fedot_ind.api.utils.checkers_collections import DataCheck
 from fedot_ind.api.utils.path_lib import DEFAULT_PATH_RESULTS as default_path_to_save_results
-from fedot_ind.core.architecture.abstraction.decorators import DaskServer
-from fedot_ind.core.architecture.settings.computational import BackendMethods
+from fedot_ind.core.architecture.abstraction.decorators import DaskServer, use_own_precision
+from fedot_ind.core.architecture.pipelines.compiled_pipeline import CompiledPipeline
+from fedot_ind.core.architecture.settings.computational import BackendMethods, set_core_budget
 from fedot_ind.core.ensemble.random_automl_forest import RAFensembler
 from fedot_ind.core.operation.transformation.splitter import TSTransformer
 from fedot_ind.core.optimizer.IndustrialEvoOptimizer import IndustrialEvoOptimizer
@@ -25,6 +26,7 @@ from fedot_ind.core.repository.constanst_repository import BATCH_SIZE_FOR_FEDOT_
 from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
 from fedot_ind.core.repository.model_repository import default_industrial_availiable_operation
 from fedot_ind.tools.explain.explain import PointExplainer
+from fedot_ind.tools.model_artifact import ModelArtifact
 from fedot_ind.tools.synthetic.anomaly_generator import AnomalyGenerator
 from fedot_ind.tools.synthetic.ts_generator import TimeSeriesGenerator
 
@@ -37,6 +39,11 @@ class FedotIndustrial(Fedot):
     Args:
         input_config: dictionary with the parameters of the experiment.
         output_folder: path to the folder where the results will be saved.
+        precision: floating point precision of the data passed between extractors, decompositions
+            and converters, ``'float64'`` (default) or ``'float32'``. It's applied only while methods of this
+            instance run, so other instances keep their own precision.
+        n_cores: total number of cores shared by parallel workers and their BLAS, OpenMP and torch thread
+            pools, all cores of the machine by default.
 
     Example:
         First, configure experiment and instantiate FedotIndustrial class::
@@ -69,6 +76,8 @@ class FedotIndustrial(Fedot):
         self.preprocessing = kwargs.get('industrial_preprocessing', False)
         self.backend_method = kwargs.get('backend', 'cpu')
         self.RAF_workers = kwargs.get('RAF_workers', None)
+        self.precision = kwargs.get('precision', 'float64')
+        self.n_cores = kwargs.get('n_cores', None)
 
         if self.output_folder is None:
             self.output_folder = default_path_to_save_results
@@ -111,6 +120,7 @@ class FedotIndustrial(Fedot):
             self.backend_method).backend
         globals()['backend_methods'] = backend_method_current
         globals()['backend_scipy'] = backend_scipy_current
+        set_core_budget(self.n_cores)
 
     def __init_solver(self):
         self.logger.info('Initialising Industrial Repository')
@@ -163,6 +173,7 @@ class FedotIndustrial(Fedot):
         self.logger.info(
             f'Number of AutoMl models in ensemble - {self.solver.n_splits}')
 
+    @use_own_precision
     def fit(self,
             input_data: tuple,
             **kwargs):
@@ -183,6 +194,7 @@ class FedotIndustrial(Fedot):
             self._preprocessing_strategy(self.train_data)
         self.solver.fit(self.train_data)
 
+    @use_own_precision
     def predict(self,
                 predict_data: tuple,
                 **kwargs):
@@ -209,6 +221,7 @@ class FedotIndustrial(Fedot):
         self.predicted_labels = predict
         return self.predicted_labels
 
+    @use_own_precision
     def predict_proba(self,
                       predict_data: tuple,
                       **kwargs):
@@ -233,6 +246,31 @@ class FedotIndustrial(Fedot):
         self.predicted_probs = predict
         return self.predicted_probs
 
+    def compile(self,
+                input_shape: tuple = None,
+                max_batch_size: int = 1) -> CompiledPipeline:
+        """
+        Method to export fitted Industrial model into low-latency inference object.
+
+        Args:
+            input_shape: shape of a single sample, ``(n_channels, series_length)``. If None, it is taken
+                from the first batch passed for prediction.
+            max_batch_size: number of samples the inference buffers are preallocated for.
+
+        Returns:
+            CompiledPipeline which takes raw numpy arrays straight to predictions
+
+        """
+        if isinstance(self.solver, list):
+            raise ValueError(f'Only a single fitted pipeline can be compiled, got {type(self.solver).__name__} '
+                             f'of {len(self.solver)} pipelines of RAF ensemble')
+        pipeline = self.solver.current_pipeline if isinstance(self.solver, Fedot) else self.solver
+        return CompiledPipeline(pipeline=pipeline,
+                                problem=self.config_dict['problem'],
+                                input_shape=input_shape,
+                                max_batch_size=max_batch_size)
+
+    @use_own_precision
     def finetune(self,
                  train_data,
                  tuning_params=None,
@@ -327,11 +365,17 @@ class FedotIndustrial(Fedot):
         """Loads saved Industrial model from disk
 
         Args:
-            path (str): path to the model
+            path (str): path to the model, either folder of saved pipelines or artifact created with
+                :meth:`save_artifact`
 
         """
         self.repo = IndustrialModels().setup_repository()
 
+        if ModelArtifact.is_artifact(path):
+            pipelines = list(ModelArtifact(path).load().values())
+            self.solver = pipelines if len(pipelines) > 1 else pipelines[0]
+            return
+
         dir_list = os.listdir(path)
         if len(dir_list) > 1:
             self.solver = []
@@ -357,6 +401,34 @@ class FedotIndustrial(Fedot):
         return self.solver.current_pipeline.save(path=self.output_folder, create_subdir=True,
                                                  is_datetime_in_path=True)
 
+    def save_artifact(self, path: str = None) -> str:
+        """Saves fitted model to a single file artifact which is loaded back with :meth:`load`.
+
+        Fitted arrays and torch weights are stored as binary blobs which are memory-mapped on load, and fitted
+        operation of every node is restored only when it's used for the first time.
+
+        Args:
+            path: path to the artifact file, ``model.fedotind`` in the output folder by default.
+
+        Returns:
+            path to the saved artifact.
+
+        """
+        path = path or os.path.join(self.output_folder, 'model.fedotind')
+        if isinstance(self.solver, Fedot):
+            pipelines = {'pipeline': self.solver.current_pipeline}
+        elif isinstance(self.solver, Pipeline):
+            pipelines = {'pipeline': self.solver}
+        elif isinstance(self.solver, list):
+            pipelines = {f'{idx}_pipeline': pipeline for idx, pipeline in enumerate(self.solver)}
+        else:
+            # head goes first as in the list of pipelines of the loaded ensemble
+            pipelines = {'ensemble_head': Pipeline(self.solver.ensemble_head)}
+            for idx, branch in enumerate(self.solver.ensemble_branches):
+                pipelines[f'{idx}_ensemble_branch'] = Pipeline(branch)
+        ModelArtifact(path).save(pipelines, metadata={'problem': self.config_dict.get('problem')})
+        return path
+
     def plot_fitness_by_generation(self, **kwargs):
         """Plot prediction of the model"""
         self.solver.history.show.fitness_box(save_path=f'{self.output_folder}/fitness_by_gen.png', best_fraction=0.5,
@@ -372,6 +444,7 @@ class FedotIndustrial(Fedot):
                 save_path=f'{self.output_folder}/history_animated_bars.gif',
                 show_fitness=True, dpi=100)
 
+    @use_own_precision
     def explain(self, **kwargs):
         """ Explain model's prediction via time series points perturbation
 
@@ -381,6 +454,9 @@ class FedotIndustrial(Fedot):
             metric: str ``default='rmse'``. Distance metric for perturbation impact assessment.
             threshold: int, ``default=90``. Threshold for perturbation impact assessment.
             name: str, ``default='test'``. Name of the dataset to be placed on plot.
+            batched: bool, ``default=False``. Predict all perturbed variants with a few chunked calls.
+            batch_size: int, ``default=256``. Number of perturbed variants in one predict call.
+            max_evaluations: int, ``default=None``. Budget of perturbed variants, windows are enlarged to fit it.
 
         """
         methods = {'point': PointExplainer,
@@ -396,7 +472,12 @@ class FedotIndustrial(Fedot):
         threshold = kwargs.get('threshold', 90)
         name = kwargs.get('name', 'test')
 
-        explainer.explain(n_samples=samples, window=window, method=metric)
+        explainer.explain(n_samples=samples,
+                          window=window,
+                          method=metric,
+                          batched=kwargs.get('batched', False),
+                          batch_size=kwargs.get('batch_size', 256),
+                          max_evaluations=kwargs.get('max_evaluations', None))
         explainer.visual(threshold=threshold, name=name)
 
     def generate_ts(self, ts_config: dict):
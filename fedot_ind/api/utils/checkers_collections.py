@@ -7,8 +7,9 @@ from fedot.core.repository.dataset_types import DataTypesEnum
 from sklearn.preprocessing import LabelEncoder
 
 from fedot_ind.api.utils.data import check_multivariate_data
-from fedot_ind.core.architecture.preprocessing.data_convertor import NumpyConverter
+from fedot_ind.core.architecture.preprocessing.data_convertor import NumpyConverter, convert_to_dense_array
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.architecture.settings.computational import get_default_dtype, to_default_dtype
 from fedot_ind.core.repository.constanst_repository import FEDOT_TASK
 
 
@@ -40,7 +41,7 @@ class DataCheck:
         multi_target = len(y.shape) > 1 and y.shape[1] > 2
 
         if multi_features:
-            features = np.array(X.tolist()).astype(float)
+            features = convert_to_dense_array(X, dtype=get_default_dtype())
         else:
             features = X
 
@@ -100,15 +101,15 @@ class DataCheck:
         """Checks and preprocesses the features in the input data.
 
         - Replaces NaN and infinite values with 0.
-        - Converts features to torch format using NumpyConverter.
+        - Converts features to torch format using NumpyConverter and casts them to default precision.
 
         """
         self.input_data.features = np.where(
             np.isnan(self.input_data.features), 0, self.input_data.features)
         self.input_data.features = np.where(
             np.isinf(self.input_data.features), 0, self.input_data.features)
-        self.input_data.features = NumpyConverter(
-            data=self.input_data.features).convert_to_torch_format()
+        self.input_data.features = to_default_dtype(NumpyConverter(
+            data=self.input_data.features).convert_to_torch_format())
 
     def _check_input_data_target(self):
         """Checks and preprocesses the features in the input data.
@@ -12,3 +12,7 @@ DS_INFO_PATH = os.path.join(PROJECT_PATH, 'fedot_ind', 'core',
                             'architecture', 'postprocessing', 'ucr_datasets.json')
 
 DEFAULT_PATH_RESULTS = os.path.join(PROJECT_PATH, 'results_of_experiments')
+
+# Binary cache of parsed datasets is kept out of the source tree
+DEFAULT_DATASET_CACHE_PATH = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.join(Path.home(), '.cache')),
+                                          'fedot_ind', 'datasets')
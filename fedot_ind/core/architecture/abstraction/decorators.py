@@ -1,10 +1,10 @@
-from distributed import Client, LocalCluster
 from fedot.core.data.data import InputData
 from fedot.core.repository.dataset_types import DataTypesEnum
 
 from fedot_ind.core.architecture.preprocessing.data_convertor import CustomDatasetCLF, CustomDatasetTS, DataConverter, \
     TensorConverter
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.architecture.settings.computational import default_precision, get_core_budget
 
 from weakref import WeakValueDictionary
 
@@ -27,6 +27,16 @@ def fedot_data_type(func):
     return decorated_func
 
 
+def use_own_precision(func):
+    """Runs method in floating point precision ``self.precision`` of the object, so objects of different
+    precision don't change it for each other."""
+    def decorated_func(self, *args, **kwargs):
+        with default_precision(self.precision):
+            return func(self, *args, **kwargs)
+
+    return decorated_func
+
+
 def convert_to_3d_torch_array(func):
     def decorated_func(self, *args):
         init_data = args[0]
@@ -102,10 +112,14 @@ class Singleton(type):
 
 class DaskServer(metaclass=Singleton):
     def __init__(self):
+        # distributed is imported here as it noticeably slows down the import of the whole package
+        from distributed import Client, LocalCluster
+
         print('Creating Dask Server')
+        # in-process cluster shares the core budget with the rest of the project
         cluster = LocalCluster(processes=False,
-                               # n_workers=4,
-                               # threads_per_worker=4,
+                               n_workers=1,
+                               threads_per_worker=get_core_budget(),
                                # memory_limit='3GB'
                                )
         # connect client to your cluster
@@ -0,0 +1,184 @@
+from copy import copy
+from typing import List, Optional, Union
+
+from fedot.core.data.data import InputData, OutputData
+from fedot.core.data.merge.data_merger import DataMerger
+from fedot.core.pipelines.node import PipelineNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.repository.constanst_repository import FEDOT_TASK
+
+
+class CompiledPipeline:
+    """Low-latency inference object exported from a fitted FEDOT pipeline.
+
+    The graph traversal, the creation of evaluation strategies and the input validation are
+    performed once at compile time. Each call of :meth:`predict` then only copies the raw
+    array into a preallocated buffer and runs the fitted operations in the frozen order.
+
+    Args:
+        pipeline: fitted pipeline to compile.
+        problem: task of the pipeline, ``'classification'`` or ``'regression'``.
+        input_shape: shape of a single sample, ``(n_channels, series_length)``.
+        max_batch_size: number of samples the input buffer is preallocated for. The buffer is
+            grown automatically if a bigger batch is passed.
+
+    Note:
+        The input buffer is shared between calls, so a single instance must not be used from several
+        threads simultaneously.
+
+    Example:
+        Compile the pipeline once after fit and reuse it for every request::
+
+            industrial.fit(train_data)
+            compiled = industrial.compile(input_shape=train_data[0].shape[1:])
+            labels = compiled.predict(single_series)
+
+    """
+
+    def __init__(self,
+                 pipeline: Pipeline,
+                 problem: str = 'classification',
+                 input_shape: tuple = None,
+                 max_batch_size: int = 1):
+        if problem not in ('classification', 'regression'):
+            raise ValueError(
+                f'Compiled inference is not supported for {problem} task')
+        if not pipeline.is_fitted:
+            raise ValueError('Pipeline must be fitted before compilation')
+        self.pipeline = pipeline
+        self.problem = problem
+        self.task = FEDOT_TASK[problem]
+        self.input_shape = tuple(input_shape) if input_shape is not None else None
+        self.nodes = self._freeze_node_order(pipeline.root_node)
+        self.parents = [[self.nodes.index(parent) for parent in node.nodes_from]
+                        for node in self.nodes]
+        self.last_consumer = [max([child for child, parents in enumerate(self.parents) if index in parents],
+                                  default=len(self.nodes))
+                              for index in range(len(self.nodes))]
+        self.strategies = {}
+        self._buffer = None
+        self._idx = None
+        self._allocate(max_batch_size)
+
+    @staticmethod
+    def _freeze_node_order(root_node: PipelineNode) -> List[PipelineNode]:
+        """Returns pipeline nodes in topological order (every parent before its children)."""
+        ordered_nodes = []
+
+        def visit(node):
+            if node in ordered_nodes:
+                return
+            for parent in node.nodes_from:
+                visit(parent)
+            ordered_nodes.append(node)
+
+        visit(root_node)
+        return ordered_nodes
+
+    def _allocate(self, batch_size: int):
+        if self.input_shape is None:
+            return
+        self._buffer = np.zeros((batch_size, *self.input_shape), dtype=float)
+        self._idx = np.arange(batch_size)
+
+    def _to_input_data(self, features: np.ndarray) -> InputData:
+        """Copies raw samples into the preallocated buffer. Only NaN and infinite values are replaced,
+        as the rest of ``DataCheck`` validation was already applied to the training data."""
+        if features.ndim == 2:
+            features = features[:, None, :]
+        if self.input_shape is None:
+            self.input_shape = features.shape[1:]
+            self._allocate(features.shape[0])
+        elif features.shape[1:] != self.input_shape:
+            raise ValueError(
+                f'Expected samples of shape {self.input_shape}, got {features.shape[1:]}')
+        n_samples = features.shape[0]
+        if n_samples > self._buffer.shape[0]:
+            self._allocate(n_samples)
+        buffer = self._buffer[:n_samples]
+        np.copyto(buffer, features, casting='unsafe')
+        np.nan_to_num(buffer, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        return InputData(idx=self._idx[:n_samples],
+                         features=buffer,
+                         target=None,
+                         task=self.task,
+                         data_type=DataTypesEnum.image)
+
+    def _node_strategy(self, node_index: int, output_mode: str):
+        """Creates evaluation strategy of the node once per output mode and reuses it for the next calls."""
+        node = self.nodes[node_index]
+        if (node_index, output_mode) not in self.strategies:
+            # strategy is initialised on a copy, so the compiled pipeline doesn't change state of the original one
+            operation = copy(node.operation)
+            operation._init(self.task,
+                            output_mode=output_mode,
+                            params=node.parameters,
+                            n_samples_data=self._buffer.shape[0])
+            self.strategies[node_index, output_mode] = operation._eval_strategy
+        return self.strategies[node_index, output_mode]
+
+    def _predict_node(self, node_index: int, input_data: InputData, output_mode: str) -> OutputData:
+        node = self.nodes[node_index]
+        strategy = self._node_strategy(node_index, output_mode)
+        prediction = strategy.predict(trained_operation=node.fitted_operation,
+                                      predict_data=input_data,
+                                      output_mode=output_mode)
+        return node.operation.assign_tabular_column_types(prediction, output_mode)
+
+    def _run(self, features: np.ndarray, output_mode: str) -> np.ndarray:
+        input_data = self._to_input_data(np.asarray(features))
+        outputs = [None] * len(self.nodes)
+        root_index = len(self.nodes) - 1
+        for node_index, parents in enumerate(self.parents):
+            node_mode = output_mode if node_index == root_index else 'default'
+            if parents:
+                node_input = DataMerger.get([outputs[parent] for parent in parents]).merge()
+            else:
+                node_input = input_data
+            outputs[node_index] = self._predict_node(node_index, node_input, node_mode)
+            # intermediate results are released as soon as all their children were evaluated
+            for parent in parents:
+                if self.last_consumer[parent] == node_index:
+                    outputs[parent] = None
+        return outputs[root_index].predict
+
+    def predict(self, features: Union[np.ndarray, list]) -> np.ndarray:
+        """Obtains predictions for raw samples.
+
+        Args:
+            features: array of shape ``(n_samples, n_channels, series_length)``, ``(n_samples, series_length)``
+                or a single series of shape ``(series_length,)``.
+
+        Returns:
+            array with predicted labels for classification or predicted values for regression.
+
+        """
+        features = np.asarray(features)
+        if features.ndim == 1:
+            features = features[None, :]
+        output_mode = 'labels' if self.problem == 'classification' else 'default'
+        return self._run(features, output_mode)
+
+    def predict_proba(self, features: Union[np.ndarray, list]) -> Optional[np.ndarray]:
+        """Obtains class probabilities for raw samples.
+
+        Args:
+            features: array of shape ``(n_samples, n_channels, series_length)``, ``(n_samples, series_length)``
+                or a single series of shape ``(series_length,)``.
+
+        Returns:
+            array with predicted probabilities.
+
+        """
+        if self.problem != 'classification':
+            raise ValueError('Probabilities are available only for classification task')
+        features = np.asarray(features)
+        if features.ndim == 1:
+            features = features[None, :]
+        return self._run(features, 'probs')
+
+    def __call__(self, features: Union[np.ndarray, list]) -> np.ndarray:
+        return self.predict(features)
@@ -0,0 +1,184 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Union
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+
+
+class _Request:
+    __slots__ = ('features', 'future', 'arrival_time')
+
+    def __init__(self, features: np.ndarray):
+        self.features = features
+        self.future = Future()
+        self.arrival_time = time.perf_counter()
+
+
+class MicroBatchPredictor:
+    """Thread-safe front-end which coalesces many small concurrent requests into batched predict calls.
+
+    Incoming series are queued and a background worker flushes the queue either when ``max_batch_size``
+    samples were collected or when the oldest request has waited for ``max_latency`` seconds. The batch
+    is passed to the model with a single predict call and the result is split back per request.
+
+    Args:
+        model: fitted model which accepts raw arrays of shape ``(n_samples, n_channels, series_length)``,
+            e.g. :class:`CompiledPipeline` obtained from ``FedotIndustrial.compile``.
+        max_batch_size: maximum number of samples in one batched call.
+        max_latency: maximum time in seconds the first request of a batch waits for the batch to fill.
+        output_mode: ``'labels'`` to call ``model.predict`` or ``'probs'`` to call ``model.predict_proba``.
+
+    Example:
+        Wrap compiled pipeline and submit requests from any number of threads::
+
+            compiled = industrial.compile(input_shape=(1, 100))
+            with MicroBatchPredictor(compiled, max_batch_size=64, max_latency=0.005) as batcher:
+                labels = batcher.predict(series)
+                print(batcher.metrics)
+
+    """
+
+    def __init__(self,
+                 model,
+                 max_batch_size: int = 64,
+                 max_latency: float = 0.005,
+                 output_mode: str = 'labels'):
+        if output_mode not in ('labels', 'probs'):
+            raise ValueError(f'Unknown output mode {output_mode}')
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.predict_method = model.predict if output_mode == 'labels' else model.predict_proba
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._queue = queue.Queue()
+        self._pending = None
+        self._stop_event = threading.Event()
+        self._metrics_lock = threading.Lock()
+        self._n_requests = 0
+        self._n_samples = 0
+        self._n_batches = 0
+        self._total_wait_time = 0.0
+        self._worker = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        """Starts background worker which flushes queued requests."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stop_event.clear()
+        self._worker = threading.Thread(target=self._serve, name=self.__class__.__name__, daemon=True)
+        self._worker.start()
+
+    def stop(self):
+        """Processes already queued requests and stops background worker."""
+        self._stop_event.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def submit(self, features: Union[np.ndarray, list]) -> Future:
+        """Queues request and returns future with its prediction.
+
+        Args:
+            features: single series of shape ``(series_length,)``, ``(n_channels, series_length)`` or a
+                small batch of shape ``(n_samples, n_channels, series_length)``.
+
+        Returns:
+            future which is resolved with predictions for the samples of this request.
+
+        """
+        if self._worker is None:
+            raise RuntimeError(f'{self.__class__.__name__} is not started')
+        features = np.asarray(features, dtype=float)
+        if features.ndim == 1:
+            features = features[None, None, :]
+        elif features.ndim == 2:
+            features = features[None, :, :]
+        request = _Request(features)
+        self._queue.put(request)
+        return request.future
+
+    def predict(self, features: Union[np.ndarray, list], timeout: float = None) -> np.ndarray:
+        """Blocking version of :meth:`submit`."""
+        return self.submit(features).result(timeout=timeout)
+
+    @property
+    def metrics(self) -> dict:
+        """Returns serving statistics: queue depth, number of batches and average batch fill."""
+        with self._metrics_lock:
+            n_batches = max(self._n_batches, 1)
+            n_requests = max(self._n_requests, 1)
+            return {'queue_depth': self._queue.qsize(),
+                    'processed_requests': self._n_requests,
+                    'processed_batches': self._n_batches,
+                    'mean_batch_size': self._n_samples / n_batches,
+                    'mean_batch_fill': self._n_samples / (n_batches * self.max_batch_size),
+                    'mean_queue_wait': self._total_wait_time / n_requests}
+
+    def _next_request(self, timeout: float):
+        if self._pending is not None:
+            request, self._pending = self._pending, None
+            return request
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _collect_batch(self) -> List[_Request]:
+        first_request = self._next_request(timeout=0.1)
+        if first_request is None:
+            return []
+        batch, n_samples = [first_request], first_request.features.shape[0]
+        deadline = first_request.arrival_time + self.max_latency
+        while n_samples < self.max_batch_size:
+            request = self._next_request(timeout=max(deadline - time.perf_counter(), 0))
+            if request is None:
+                break
+            if request.features.shape[1:] != first_request.features.shape[1:] or \
+                    n_samples + request.features.shape[0] > self.max_batch_size:
+                # request can't be fused with current batch, so it opens the next one
+                self._pending = request
+                break
+            batch.append(request)
+            n_samples += request.features.shape[0]
+        return batch
+
+    def _process_batch(self, batch: List[_Request]):
+        start_time = time.perf_counter()
+        # any failure is passed to the futures of the batch, so the worker keeps serving the next ones
+        try:
+            features = np.concatenate([request.features for request in batch], axis=0)
+            prediction = np.asarray(self.predict_method(features))
+            offsets = np.cumsum([0] + [request.features.shape[0] for request in batch])
+            if prediction.ndim == 0 or len(prediction) != offsets[-1]:
+                raise ValueError(f'Model returned prediction of shape {prediction.shape} '
+                                 f'for batch of {offsets[-1]} samples')
+            for request, start, end in zip(batch, offsets[:-1], offsets[1:]):
+                request.future.set_result(prediction[start:end])
+        except Exception as ex:
+            self.logger.error(f'Batched prediction failed - {ex}')
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(ex)
+            return
+        with self._metrics_lock:
+            self._n_batches += 1
+            self._n_requests += len(batch)
+            self._n_samples += features.shape[0]
+            self._total_wait_time += sum(start_time - request.arrival_time for request in batch)
+
+    def _serve(self):
+        while not (self._stop_event.is_set() and self._queue.empty() and self._pending is None):
+            batch = self._collect_batch()
+            if batch:
+                self._process_batch(batch)
@@ -7,15 +7,71 @@ import torch.nn as nn
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum
-from pymonad.list import ListMonad
 from sklearn.preprocessing import LabelEncoder
 
 from fedot_ind.api.utils.data import check_multivariate_data
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
-from fedot_ind.core.architecture.settings.computational import default_device
+from fedot_ind.core.architecture.settings.computational import default_device, get_default_dtype
 from fedot_ind.core.repository.constanst_repository import MATRIX, MULTI_ARRAY
 
 
+def _is_memmap(data) -> bool:
+    return isinstance(data, np.memmap)
+
+
+def _is_dask(data) -> bool:
+    return hasattr(data, 'compute')
+
+
+def _is_zarr(data) -> bool:
+    return hasattr(data, 'oindex')
+
+
+def convert_to_dense_array(data, dtype=None):
+    """Converts features to dense array avoiding intermediate python lists.
+
+    Nested ``pd.DataFrame`` (or object array) with series, arrays or lists in cells is written channel by channel
+    into one preallocated contiguous buffer of shape ``(n_samples, n_channels, series_length)``, series of unequal
+    length are padded with NaN. Dense arrays are passed through without copy if their dtype already matches,
+    ``np.memmap``, dask and zarr arrays are returned as is to avoid loading them into memory.
+
+    Args:
+        data: nested or flat ``pd.DataFrame``, numpy array, memory-mapped, dask or zarr array.
+        dtype: dtype of the result, by default precision set with ``set_default_dtype`` for nested data
+            and unchanged dtype for dense arrays.
+
+    Returns:
+        dense array or lazy array of the same type as input.
+
+    """
+    if _is_memmap(data) or _is_dask(data) or _is_zarr(data):
+        return data
+    if isinstance(data, pd.DataFrame):
+        if data.shape[1] == 0 or not isinstance(data.iat[0, 0], (pd.Series, np.ndarray, list)):
+            return data.to_numpy(dtype=dtype)
+        data = data.values
+    if not isinstance(data, np.ndarray):
+        data = np.asarray(data)
+    if data.dtype != object:
+        return data if dtype is None else data.astype(dtype, copy=False)
+
+    if data.ndim == 1:
+        data = data[:, None]
+    lengths = np.vectorize(len, otypes=[int])(data)
+    dense = np.empty((*data.shape, lengths.max()), dtype=get_default_dtype() if dtype is None else dtype)
+    equal_length = (lengths == lengths[0, 0]).all()
+    if not equal_length:
+        dense.fill(np.nan)
+    for channel in range(data.shape[1]):
+        for sample, series in enumerate(data[:, channel]):
+            series = np.asarray(series)
+            if series.ndim != 1:
+                raise ValueError(f'Cell of sample {sample} and channel {channel} must hold one-dimensional series, '
+                                 f'got {type(data[sample, channel]).__name__} of shape {series.shape}')
+            dense[sample, channel, :series.shape[0]] = series
+    return dense
+
+
 class CustomDatasetTS:
     def __init__(self, ts):
         self.x = torch.from_numpy(DataConverter(
@@ -102,8 +158,7 @@ class FedotConverter:
                      'regression': Task(TaskTypesEnum.regression)}
         if is_multivariate_data:
             input_data = InputData(idx=np.arange(len(features)),
-                                   features=np.array(
-                                       features.values.tolist()).astype(float),
+                                   features=convert_to_dense_array(features, dtype=get_default_dtype()),
                                    target=target.astype(
                                        float).reshape(-1, 1),
                                    task=task_dict[task],
@@ -427,15 +482,15 @@ class DataConverter(TensorConverter, NumpyConverter):
 
     @property
     def is_zarr(self):
-        return hasattr(self.data, 'oindex')
+        return _is_zarr(self.data)
 
     @property
     def is_dask(self):
-        return hasattr(self.data, 'compute')
+        return _is_dask(self.data)
 
     @property
     def is_memmap(self):
-        return isinstance(self.data, np.memmap)
+        return _is_memmap(self.data)
 
     @property
     def is_slice(self):
@@ -463,6 +518,11 @@ class DataConverter(TensorConverter, NumpyConverter):
         elif isinstance(self.data, np.ndarray):
             self.data = self.data.astype(np.ndarray)
 
+    def convert_to_dense(self, dtype=None):
+        if self.is_fedot_data:
+            return convert_to_dense_array(self.data.features, dtype)
+        return convert_to_dense_array(self.data, dtype)
+
     def convert_to_list(self):
         if isinstance(self.data, list):
             return self.data
@@ -500,11 +560,7 @@ class DataConverter(TensorConverter, NumpyConverter):
             return self.convert_to_3d_tensor()
 
     def convert_to_monad_data(self):
-        if self.is_fedot_data:
-            features = np.array(ListMonad(*self.data.features.tolist()).value)
-        else:
-            features = np.array(ListMonad(*self.data.tolist()).value)
-
+        features = self.convert_to_dense()
         if len(features.shape) == 2 and features.shape[1] == 1:
             features = features.reshape(1, -1)
         elif len(features.shape) == 3 and features.shape[1] == 1:
@@ -515,7 +571,7 @@ class DataConverter(TensorConverter, NumpyConverter):
         if self.is_fedot_data:
             features = self.data.features
         else:
-            features = np.array(ListMonad(*self.data.values.tolist()).value)
+            features = self.convert_to_dense()
             features = np.array([series[~np.isnan(series)]
                                  for series in features])
         return features
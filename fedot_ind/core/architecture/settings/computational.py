@@ -1,5 +1,15 @@
+import os
+from contextlib import contextmanager
+from functools import partial
+from typing import Optional, Tuple
+
+import numpy
 import torch
 from fastcore.basics import defaults
+import joblib
+from joblib import parallel_backend
+from joblib.parallel import get_active_backend
+from threadpoolctl import threadpool_limits
 
 
 class BackendMethods:
@@ -29,6 +39,162 @@ def _has_mps():
 backend_methods, backend_scipy = BackendMethods('cpu').backend
 
 
+_DEFAULT_DTYPE = numpy.dtype(os.environ.get('FEDOT_IND_PRECISION', 'float64'))
+
+
+def set_default_dtype(dtype):
+    """Sets floating point precision of the data passed between converters, decompositions and extractors.
+
+    Args:
+        dtype: ``'float32'`` or ``'float64'``. Initial value is taken from ``FEDOT_IND_PRECISION`` environment
+            variable, ``'float64'`` if it is not set.
+
+    """
+    global _DEFAULT_DTYPE
+    dtype = numpy.dtype(dtype)
+    if dtype not in (numpy.float32, numpy.float64):
+        raise ValueError(f'Unsupported precision {dtype}, use float32 or float64')
+    _DEFAULT_DTYPE = dtype
+
+
+def get_default_dtype() -> numpy.dtype:
+    """Returns floating point precision of the data set with :func:`set_default_dtype`."""
+    return _DEFAULT_DTYPE
+
+
+@contextmanager
+def default_precision(dtype):
+    """Context manager which temporary changes floating point precision of the data.
+
+    Examples:
+        Do this::
+            with default_precision('float32'):
+                features = extractor.transform(input_data)
+
+    """
+    previous_dtype = get_default_dtype()
+    set_default_dtype(dtype)
+    try:
+        yield
+    finally:
+        set_default_dtype(previous_dtype)
+
+
+def to_default_dtype(array):
+    """Casts floating point array to the default precision, array of this precision is returned without copy.
+    Integer, boolean and complex arrays (labels, indices, spectra) are returned as they are. Numerically
+    sensitive computations may upcast locally, but should return the results in this precision."""
+    array = numpy.asarray(array)
+    if array.dtype == _DEFAULT_DTYPE or array.dtype.kind != 'f':
+        return array
+    return array.astype(_DEFAULT_DTYPE)
+
+
+_CORE_BUDGET = int(os.environ.get('FEDOT_IND_N_CORES', 0)) or os.cpu_count() or 1
+
+
+def set_core_budget(n_cores: Optional[int] = None):
+    """Sets total number of cores shared by all parallel work of the project: joblib workers, BLAS and OpenMP
+    pools and intra-op pool of torch.
+
+    Args:
+        n_cores: number of cores, all cores of the machine if None. Initial value is taken from
+            ``FEDOT_IND_N_CORES`` environment variable.
+
+    """
+    global _CORE_BUDGET
+    if n_cores is not None and n_cores < 1:
+        raise ValueError(f'Core budget must be positive, got {n_cores}')
+    _CORE_BUDGET = n_cores or os.cpu_count() or 1
+
+
+def get_core_budget() -> int:
+    """Returns total number of cores set with :func:`set_core_budget`."""
+    return _CORE_BUDGET
+
+
+def allocate_workers(n_jobs: Optional[int] = None) -> Tuple[int, int]:
+    """Splits the core budget between parallel workers.
+
+    Args:
+        n_jobs: requested number of workers, the whole budget if None or negative.
+
+    Returns:
+        number of workers and number of native threads each of them may use.
+
+    """
+    budget = get_core_budget()
+    n_workers = budget if n_jobs is None or n_jobs < 0 else max(min(n_jobs, budget), 1)
+    return n_workers, max(budget // n_workers, 1)
+
+
+@contextmanager
+def limit_threads(n_threads: int):
+    """Context manager which limits BLAS and OpenMP pools and intra-op pool of torch in the current process."""
+    previous_threads = torch.get_num_threads()
+    torch.set_num_threads(n_threads)
+    try:
+        with threadpool_limits(limits=n_threads):
+            yield
+    finally:
+        torch.set_num_threads(previous_threads)
+
+
+def _call_in_precision(function, dtype: str, *args, **kwargs):
+    with default_precision(dtype):
+        return function(*args, **kwargs)
+
+
+def delayed_in_precision(function):
+    """Version of ``joblib.delayed`` which passes the default precision of the caller with the call, so process
+    workers run the function in the same precision whenever they were started.
+
+    Examples:
+        Do this::
+            with compute_budget(self.n_processes) as n_jobs:
+                result = Parallel(n_jobs=n_jobs)(delayed_in_precision(func)(sample) for sample in features)
+
+    """
+    return partial(joblib.delayed(_call_in_precision), function, get_default_dtype().name)
+
+
+@contextmanager
+def compute_budget(n_jobs: Optional[int] = None, prefer: str = 'processes'):
+    """Context manager for launching parallel work within the core budget.
+
+    The number of workers is capped by the budget and the rest of the budget is split between native thread
+    pools of the workers, so nested pools don't oversubscribe the machine. Process workers get the limit
+    through joblib, thread workers share the limit of the current process. The default precision is passed to
+    process workers with :func:`delayed_in_precision`. If joblib backend was already
+    configured by the caller (e.g. dask backend of the optimizer), it is kept and only native pools of the
+    current process are limited. Inside a worker of another parallel call the work runs in one worker.
+
+    Args:
+        n_jobs: requested number of workers, the whole budget if None or negative.
+        prefer: ``'processes'`` or ``'threads'``.
+
+    Examples:
+        Do this::
+            with compute_budget(self.n_processes) as n_jobs:
+                result = Parallel(n_jobs=n_jobs)(delayed_in_precision(func)(sample) for sample in features)
+
+    """
+    n_workers, n_threads = allocate_workers(n_jobs)
+    active_backend, active_n_jobs = get_active_backend()
+    if getattr(active_backend, 'nesting_level', 0):
+        # cores are already allocated to the outer workers
+        yield 1
+    elif active_n_jobs is not None:
+        with limit_threads(n_threads):
+            yield n_workers
+    elif prefer == 'threads':
+        with parallel_backend('threading', n_jobs=n_workers), limit_threads(n_threads):
+            yield n_workers
+    else:
+        with parallel_backend('loky', n_jobs=n_workers, inner_max_num_threads=n_threads):
+            yield n_workers
+
+
 def global_imports(object_name: str,
                    short_name: str = None,
                    context_module_name: str = None):
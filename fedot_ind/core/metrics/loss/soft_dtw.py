@@ -1,6 +1,11 @@
-from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from typing import Optional
 
+import torch
 from sklearn.metrics.pairwise import euclidean_distances
+from torch import Tensor
+from torch.nn.modules import Module
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
 
 
 class SoftDTWLoss:
@@ -113,6 +118,136 @@ class SoftDTWLoss:
         return euclidean_distances(self.X, self.Y, squared=True)
 
 
+def _diagonal_cells(diagonal: int, size_x: int, size_y: int, bandwidth: Optional[int], device) -> tuple:
+    """Returns indices of the cost matrix cells ``(i, j)`` with ``i + j == diagonal`` (indexed from 1)
+    which lie inside the Sakoe-Chiba band."""
+    i = torch.arange(max(1, diagonal - size_y), min(size_x, diagonal - 1) + 1, device=device)
+    j = diagonal - i
+    if bandwidth is not None:
+        in_band = (i - j).abs() <= bandwidth
+        i, j = i[in_band], j[in_band]
+    return i, j
+
+
+def _soft_dtw_forward(cost: Tensor, gamma: float, bandwidth: Optional[int]) -> Tensor:
+    """Soft-DTW recursion over anti-diagonals, all the cells of a diagonal and all the pairs of the batch
+    are computed at once. Returns padded matrix of intermediate values of shape ``(batch, size_x + 2, size_y + 2)``."""
+    batch_size, size_x, size_y = cost.shape
+    R = torch.full((batch_size, size_x + 2, size_y + 2), float('inf'), dtype=cost.dtype, device=cost.device)
+    R[:, 0, 0] = 0
+    for diagonal in range(2, size_x + size_y + 1):
+        i, j = _diagonal_cells(diagonal, size_x, size_y, bandwidth, cost.device)
+        if i.numel() == 0:
+            continue
+        previous = torch.stack([R[:, i - 1, j - 1], R[:, i - 1, j], R[:, i, j - 1]], dim=-1)
+        softmin = -gamma * torch.logsumexp(-previous / gamma, dim=-1)
+        R[:, i, j] = cost[:, i - 1, j - 1] + softmin
+    return R
+
+
+def _soft_dtw_backward(cost: Tensor, R: Tensor, gamma: float, bandwidth: Optional[int]) -> Tensor:
+    """Analytical gradient of soft-DTW value with respect to the cost matrix (expected alignment matrix),
+    computed with the backward recursion over anti-diagonals in reverse order."""
+    batch_size, size_x, size_y = cost.shape
+    D = torch.zeros_like(R)
+    D[:, 1:size_x + 1, 1:size_y + 1] = cost
+    R = R.clone()
+    R[torch.isinf(R)] = -float('inf')
+    R[:, :, -1] = -float('inf')
+    R[:, -1, :] = -float('inf')
+    R[:, -1, -1] = R[:, size_x, size_y]
+    E = torch.zeros_like(R)
+    E[:, -1, -1] = 1
+    for diagonal in range(size_x + size_y, 1, -1):
+        i, j = _diagonal_cells(diagonal, size_x, size_y, bandwidth, cost.device)
+        if i.numel() == 0:
+            continue
+        a = torch.exp((R[:, i + 1, j] - R[:, i, j] - D[:, i + 1, j]) / gamma)
+        b = torch.exp((R[:, i, j + 1] - R[:, i, j] - D[:, i, j + 1]) / gamma)
+        c = torch.exp((R[:, i + 1, j + 1] - R[:, i, j] - D[:, i + 1, j + 1]) / gamma)
+        E[:, i, j] = E[:, i + 1, j] * a + E[:, i, j + 1] * b + E[:, i + 1, j + 1] * c
+    return E[:, 1:size_x + 1, 1:size_y + 1]
+
+
+class _SoftDTWFunction(torch.autograd.Function):
+    """Soft-DTW of a batch of cost matrices with analytical backward pass, so autograd records
+    a single node instead of every scalar operation of the recursion."""
+
+    @staticmethod
+    def forward(ctx, cost: Tensor, gamma: float, bandwidth: Optional[int]) -> Tensor:
+        R = _soft_dtw_forward(cost.detach(), gamma, bandwidth)
+        ctx.save_for_backward(cost, R)
+        ctx.gamma = gamma
+        ctx.bandwidth = bandwidth
+        return R[:, -2, -2]
+
+    @staticmethod
+    def backward(ctx, grad_output: Tensor) -> tuple:
+        cost, R = ctx.saved_tensors
+        E = _soft_dtw_backward(cost.detach(), R, ctx.gamma, ctx.bandwidth)
+        return grad_output[:, None, None] * E, None, None
+
+
+class SoftDTW(Module):
+    """Batched soft-DTW loss between pairs of time series with squared Euclidean cost.
+
+    Args:
+        gamma: regularization strength, soft-DTW tends to DTW when it goes to zero (default: ``1``).
+        bandwidth: width of Sakoe-Chiba band, cells with ``|i - j| > bandwidth`` are not evaluated. ``None``
+            means no band (default: ``None``).
+        normalize: if True, soft-DTW divergence ``sdtw(x, y) - (sdtw(x, x) + sdtw(y, y)) / 2`` is computed,
+            which is non-negative and equals zero for identical series (default: ``False``).
+        reduction: ``'mean'``, ``'sum'`` or ``'none'`` (default: ``'mean'``).
+
+    Example:
+        Use it as a training loss of forecasting model::
+
+            loss_fn = SoftDTW(gamma=0.1, bandwidth=10)
+            loss = loss_fn(model(x), y)  # tensors of shape (batch, horizon) or (batch, horizon, n_dims)
+            loss.backward()
+
+    """
+
+    def __init__(self,
+                 gamma: float = 1.,
+                 bandwidth: Optional[int] = None,
+                 normalize: bool = False,
+                 reduction: str = 'mean') -> None:
+        super().__init__()
+        if reduction not in ('mean', 'sum', 'none'):
+            raise ValueError(f'Unknown reduction {reduction}')
+        self.gamma = gamma
+        self.bandwidth = bandwidth
+        self.normalize = normalize
+        self.reduction = reduction
+
+    @staticmethod
+    def _squared_euclidean_cost(x: Tensor, y: Tensor) -> Tensor:
+        return ((x[:, :, None, :] - y[:, None, :, :]) ** 2).sum(dim=-1)
+
+    def _soft_dtw(self, x: Tensor, y: Tensor) -> Tensor:
+        return _SoftDTWFunction.apply(self._squared_euclidean_cost(x, y), self.gamma, self.bandwidth)
+
+    def forward(self, x: Tensor, y: Tensor) -> Tensor:
+        """Calculates soft-DTW between the series of two batches.
+
+        Args:
+            x: tensor of shape ``(batch, size_x)`` or ``(batch, size_x, n_dims)``.
+            y: tensor of shape ``(batch, size_y)`` or ``(batch, size_y, n_dims)``.
+
+        """
+        x = x.unsqueeze(-1) if x.dim() == 2 else x
+        y = y.unsqueeze(-1) if y.dim() == 2 else y
+        loss = self._soft_dtw(x, y)
+        if self.normalize:
+            loss = loss - (self._soft_dtw(x, x) + self._soft_dtw(y, y)) / 2
+        if self.reduction == 'mean':
+            return loss.mean()
+        if self.reduction == 'sum':
+            return loss.sum()
+        return loss
+
+
 if __name__ == "__main__":
     from fedot_ind.tools.loader import DataLoader
     # Two 3-dimensional time series of lengths 5 and 4, respectively.
@@ -1,5 +1,7 @@
 import logging
 import math
+import os
+import tempfile
 from itertools import chain
 from multiprocessing import cpu_count
 from typing import Optional
@@ -7,11 +9,13 @@ from typing import Optional
 from fedot.core.data.data import InputData
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
-from joblib import delayed, Parallel
+from joblib import Parallel
 from tqdm import tqdm
 
 from fedot_ind.api.utils.data import init_input_data
 from fedot_ind.core.architecture.abstraction.decorators import convert_to_input_data
+from fedot_ind.core.architecture.settings.computational import compute_budget, delayed_in_precision, \
+    get_default_dtype, to_default_dtype
 from fedot_ind.core.metrics.metrics_implementation import *
 from fedot_ind.core.operation.IndustrialCachableOperation import IndustrialCachableOperationImplementation
 from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
@@ -55,29 +59,55 @@ class BaseExtractor(IndustrialCachableOperationImplementation):
         """
         Method for feature generation for all series
         """
-
-        parallel = Parallel(n_jobs=self.n_processes,
-                            verbose=0, pre_dispatch="2*n_jobs")
-        feature_matrix = parallel(delayed(self.generate_features_from_ts)(
-            sample) for sample in tqdm(input_data.features))
-
-        if len(feature_matrix[0].features.shape) > 1:
-            stacked_data = np.stack([ts.features for ts in feature_matrix])
-            self.predict = self._clean_predict(stacked_data)
-        else:
-            stacked_data = np.array([ts.features for ts in feature_matrix])
-            self.predict = self._clean_predict(stacked_data)
+        features = input_data.features
+        # features of the first sample define shape of the output and names of the features
+        first_sample = self.generate_features_from_ts(features[0])
+        self.relevant_features = first_sample.supplementary_data['feature_name']
+        output_shape = (len(features),) + np.shape(first_sample.features)
+
+        with compute_budget(self.n_processes) as n_jobs:
+            if n_jobs == 1 or len(features) < 3:
+                stacked_data = np.empty(output_shape, dtype=get_default_dtype())
+                stacked_data[0] = first_sample.features
+                self._extract_chunk(features, stacked_data, 1, len(features))
+            else:
+                stacked_data = self._parallel_extract(features, first_sample.features, output_shape, n_jobs)
+
+        self.predict = self._clean_predict(stacked_data)
+        if len(output_shape) < 3:
             self.predict = self.predict.reshape(self.predict.shape[0], -1)
-
-        self.relevant_features = feature_matrix[0].supplementary_data['feature_name']
         return self.predict
 
+    def _parallel_extract(self, features: np.array, first_features: np.array, output_shape: tuple, n_jobs: int):
+        """Extracts features in chunks of samples written by workers directly into shared output matrix.
+
+        Input array is memory-mapped by joblib once per call instead of being pickled for every sample, and
+        workers receive only bounds of the chunks. Output matrix is allocated in the default precision.
+        """
+        chunk_size = max(math.ceil((len(features) - 1) / (n_jobs * 4)), 1)
+        chunks = [(start, min(start + chunk_size, len(features))) for start in range(1, len(features), chunk_size)]
+        with tempfile.TemporaryDirectory(dir=os.environ.get('JOBLIB_TEMP_FOLDER')) as temp_folder:
+            output = np.lib.format.open_memmap(os.path.join(temp_folder, 'features.npy'),
+                                               mode='w+', dtype=get_default_dtype(), shape=output_shape)
+            output[0] = first_features
+            parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch="2*n_jobs", mmap_mode='r')
+            parallel(delayed_in_precision(self._extract_chunk)(features, output, start, end)
+                     for start, end in tqdm(chunks))
+            # result is copied to memory before the mapped file is removed
+            stacked_data = np.array(output)
+            del output
+        return stacked_data
+
+    def _extract_chunk(self, features: np.array, output: np.array, start: int, end: int):
+        for idx in range(start, end):
+            output[idx] = self.generate_features_from_ts(features[idx]).features
+
     def _clean_predict(self, predict: np.array):
         """Clean predict from nan, inf and reshape data for Fedot appropriate form
         """
         predict = np.where(np.isnan(predict), 0, predict)
         predict = np.where(np.isinf(predict), 0, predict)
-        return predict
+        return to_default_dtype(predict)
 
     def generate_features_from_ts(self, ts_frame: np.array, window_length: int = None) -> np.array:
         """Method responsible for generation of features from time series.
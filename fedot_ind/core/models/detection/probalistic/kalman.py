@@ -438,3 +438,161 @@ class UnscentedKalmanFilter(AbstractKalmanFilter):
             dz = np.subtract(sigmas_h[i], z)
             Pxz += self.sigma_distribution.Wc[i] * np.outer(dx, dz)
         return Pxz
+
+
+class BatchUnscentedKalmanFilter:
+    """
+    Unscented Kalman filter which runs N independent filters in lock-step.
+    States and covariances of all filters are stored as stacked tensors of
+    shape (N, dim_x) and (N, dim_x, dim_x), sigma points are generated with
+    one batched Cholesky decomposition and propagated through the transition
+    and measurement functions as a single (N, 2 * dim_x + 1, dim_x) array.
+    Like UnscentedKalmanFilter, sigma points are redrawn from the prior before
+    the update, so every filter gives the same results as the single-series one.
+    Parameters
+    ----------
+    dim_x : int
+        Dimensionality of the state of a single filter.
+    dim_z : int
+        Dimensionality of the measurement of a single filter.
+    transition_fn : callable, optional
+        Vectorized state transition function f(x) applied to array of
+        shape (..., dim_x). Identity (random walk model) by default.
+    measurement_fn : callable, optional
+        Vectorized measurement function h(x) mapping (..., dim_x) to
+        (..., dim_z). Takes first dim_z state components by default.
+    process_uncertainty : float or np.array
+        Process noise Q, scalar is treated as Q * eye(dim_x).
+    measurement_uncertainty : float or np.array
+        Measurement noise R, scalar is treated as R * eye(dim_z).
+    """
+
+    def __init__(self, dim_x: int,
+                 dim_z: int,
+                 transition_fn=None,
+                 measurement_fn=None,
+                 process_uncertainty=3.,
+                 measurement_uncertainty=5.,
+                 alpha=.1,
+                 beta=2.,
+                 kappa=-1):
+        self.dim_x = dim_x
+        self.dim_z = dim_z
+        self.transition_fn = transition_fn if transition_fn is not None else lambda x: x
+        self.measurement_fn = measurement_fn if measurement_fn is not None else lambda x: x[..., :dim_z]
+        self.process_uncertainty = process_uncertainty * eye(dim_x) \
+            if np.isscalar(process_uncertainty) else np.asarray(process_uncertainty)
+        self.measurement_uncertainty = measurement_uncertainty * eye(dim_z) \
+            if np.isscalar(measurement_uncertainty) else np.asarray(measurement_uncertainty)
+        self.sigma_distribution = MerweScaledSigmaPoints(
+            dim_x, alpha=alpha, beta=beta, kappa=kappa)
+        self.state_mean = None
+        self.uncertainty_covariance = None
+        self.sigmas_f = None
+
+    def initialize(self, state_mean: np.ndarray, uncertainty_covariance=100.):
+        """
+        Sets initial state of all filters.
+        Parameters
+        ----------
+        state_mean : np.array, of size (N, dim_x)
+            Initial state of each filter.
+        uncertainty_covariance : float or np.array, of size (N, dim_x, dim_x)
+            Initial covariance P, scalar is treated as P * eye(dim_x) for every filter.
+        """
+        self.state_mean = np.array(state_mean, dtype=float).reshape(-1, self.dim_x)
+        n_filters = self.state_mean.shape[0]
+        if np.isscalar(uncertainty_covariance):
+            self.uncertainty_covariance = np.tile(uncertainty_covariance * eye(self.dim_x), (n_filters, 1, 1))
+        else:
+            self.uncertainty_covariance = np.array(uncertainty_covariance, dtype=float)
+        return self
+
+    @staticmethod
+    def batch_unscented_transform(sigmas, Wm, Wc, noise_cov=None):
+        """
+        Computes unscented transform for a stack of sigma point sets of
+        shape (N, 2n+1, dim). Returns means (N, dim) and covariances
+        (N, dim, dim) - the same values as unscented_transform() returns
+        for every filter.
+        """
+        x = np.einsum('s,nsd->nd', Wm, sigmas)
+        y = sigmas - x[:, np.newaxis, :]
+        P = np.einsum('s,nsi,nsj->nij', Wc, y, y)
+        if noise_cov is not None:
+            P += noise_cov
+        return x, P
+
+    def predict_step(self):
+        """
+        Performs the predict step of all filters. On return, self.state_mean
+        and self.uncertainty_covariance contain the prior of each filter.
+        """
+        sigmas = self.sigma_distribution.batch_sigma_points(
+            self.state_mean, self.uncertainty_covariance)
+        sigmas_f = self.transition_fn(sigmas)
+        self.state_mean, self.uncertainty_covariance = self.batch_unscented_transform(
+            sigmas_f, self.sigma_distribution.Wm, self.sigma_distribution.Wc, self.process_uncertainty)
+        # update sigma points to reflect the new variance of the points, as UnscentedKalmanFilter does
+        self.sigmas_f = self.sigma_distribution.batch_sigma_points(
+            self.state_mean, self.uncertainty_covariance)
+
+    def update_step(self, measurement: np.ndarray):
+        """
+        Adds new measurement of shape (N, dim_z) to every filter and returns
+        the residuals between the measurements and the predicted ones.
+        """
+        measurement = np.asarray(measurement, dtype=float).reshape(-1, self.dim_z)
+        sigmas_h = self.measurement_fn(self.sigmas_f)
+        Wm, Wc = self.sigma_distribution.Wm, self.sigma_distribution.Wc
+        measurement_mean, system_uncertainty = self.batch_unscented_transform(
+            sigmas_h, Wm, Wc, self.measurement_uncertainty)
+
+        # cross variance of the state and the measurements
+        dx = self.sigmas_f - self.state_mean[:, np.newaxis, :]
+        dz = sigmas_h - measurement_mean[:, np.newaxis, :]
+        Pxz = np.einsum('s,nsi,nsj->nij', Wc, dx, dz)
+
+        # K = Pxz inv(S), S is symmetric, so K.T = solve(S, Pxz.T)
+        kalman_gain = np.swapaxes(np.linalg.solve(
+            system_uncertainty, np.swapaxes(Pxz, 1, 2)), 1, 2)
+        residual = measurement - measurement_mean
+        self.state_mean = self.state_mean + \
+            np.einsum('nij,nj->ni', kalman_gain, residual)
+        self.uncertainty_covariance = self.uncertainty_covariance - np.einsum(
+            'nij,njk,nlk->nil', kalman_gain, system_uncertainty, kalman_gain)
+        # keep covariances symmetric for the Cholesky decomposition on the next step
+        self.uncertainty_covariance = (self.uncertainty_covariance +
+                                       np.swapaxes(self.uncertainty_covariance, 1, 2)) / 2
+        return residual
+
+    def filter(self, measurements: np.ndarray):
+        """
+        Runs all filters over the measurements.
+        Parameters
+        ----------
+        measurements : np.array, of size (N, T) or (N, T, dim_z)
+            Measurements of N independent series.
+        Returns
+        -------
+        residuals : np.array, of size (N, T, dim_z)
+            Residuals between measurements and predictions, which are used as anomaly score.
+        states : np.array, of size (N, T, dim_x)
+            Posterior state of every filter at every step.
+        """
+        measurements = np.asarray(measurements, dtype=float)
+        if measurements.ndim == 2:
+            measurements = measurements[..., np.newaxis]
+        n_filters, n_steps = measurements.shape[:2]
+        if self.state_mean is None:
+            initial_state = np.zeros((n_filters, self.dim_x))
+            initial_state[:, :self.dim_z] = measurements[:, 0]
+            self.initialize(initial_state)
+
+        residuals = np.zeros((n_filters, n_steps, self.dim_z))
+        states = np.zeros((n_filters, n_steps, self.dim_x))
+        for step in range(n_steps):
+            self.predict_step()
+            residuals[:, step] = self.update_step(measurements[:, step])
+            states[:, step] = self.state_mean
+        return residuals, states
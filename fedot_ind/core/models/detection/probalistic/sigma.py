@@ -124,6 +124,31 @@ class MerweScaledSigmaPoints:
 
         return sigmas
 
+    def batch_sigma_points(self, x, P):
+        """ Computes the sigma points for a stack of independent filters
+        with a single batched Cholesky decomposition.
+        Parameters
+        ----------
+        x : np.array, of size (N, n)
+            Means of N filters.
+        P : np.array, of size (N, n, n)
+            Covariances of N filters.
+        Returns
+        -------
+        sigmas : np.array, of size (N, 2n+1, n)
+            Sigma points of each filter ordered the same way as in
+            sigma_points(): Xi_0, Xi_{1..n}, Xi_{n+1..2n}
+        """
+
+        n = self.n
+        lambda_ = self.alpha ** 2 * (n + self.kappa) - n
+        # numpy returns lower triangular factor, so its columns are
+        # the rows of the upper triangular factor used in sigma_points()
+        U = np.swapaxes(np.linalg.cholesky((lambda_ + n) * P), 1, 2)
+
+        x = x[:, np.newaxis, :]
+        return np.concatenate([x, x + U, x - U], axis=1)
+
     def _compute_weights(self):
         """ Computes the weights for the scaled unscented Kalman filter.
         """
@@ -0,0 +1,194 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Union
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.models.detection.probalistic.kalman import BatchUnscentedKalmanFilter
+from fedot_ind.core.models.detection.subspaces.func_pca import FunctionalPCA
+from fedot_ind.core.models.detection.subspaces.sst import SingularSpectrumTransformation
+
+
+class StreamingDetector(ABC):
+    """Base class of online anomaly detectors.
+
+    A fitted detector keeps only bounded internal state (ring buffers and model statistics) and accepts
+    chunks of new points, returning the anomaly score of each of them. Memory consumption does not depend
+    on the length of the stream. The state can be checkpointed to disk and restored, e.g. after restart
+    of the ingestion service.
+
+    """
+
+    @abstractmethod
+    def update(self, new_points: np.ndarray) -> np.ndarray:
+        """Consumes chunk of new points and returns their scores.
+
+        Args:
+            new_points: array of shape ``(n_points,)`` for univariate or ``(n_channels, n_points)`` for
+                multivariate stream.
+
+        Returns:
+            scores of the new points, ``nan`` for the points which were used for warm-up.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_state(self) -> dict:
+        """Returns internal state as a dictionary of numpy arrays."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_state(self, state: dict):
+        """Restores internal state obtained with :meth:`get_state`."""
+        raise NotImplementedError
+
+    def save_state(self, path: str):
+        """Saves checkpoint of the internal state in ``.npz`` format."""
+        np.savez(path, **self.get_state())
+
+    def load_state(self, path: str):
+        """Restores internal state from checkpoint created with :meth:`save_state`."""
+        with np.load(path, allow_pickle=False) as checkpoint:
+            self.set_state({key: checkpoint[key] for key in checkpoint.files})
+        return self
+
+
+class StreamingSST(StreamingDetector):
+    """Online change point detector based on incremental Singular Spectrum Transformation.
+
+    Args:
+        model_hyperparams: hyperparameters of :class:`SingularSpectrumTransformation`.
+
+    """
+
+    def __init__(self, model_hyperparams: dict):
+        self.model = SingularSpectrumTransformation(model_hyperparams)
+
+    def update(self, new_points: np.ndarray) -> np.ndarray:
+        return self.model.update(new_points)
+
+    def get_state(self) -> dict:
+        return self.model.get_stream_state()
+
+    def set_state(self, state: dict):
+        self.model.set_stream_state(state)
+        return self
+
+
+class StreamingKalmanDetector(StreamingDetector):
+    """Online residual detector which runs independent unscented Kalman filter for each channel.
+
+    The score of a point is the absolute value of the filter residual normalised by the standard deviation
+    of the measurement noise.
+
+    Args:
+        n_channels: number of channels in the stream.
+        model_hyperparams: keyword arguments of :class:`BatchUnscentedKalmanFilter`.
+
+    """
+
+    def __init__(self, n_channels: int = 1, model_hyperparams: dict = None):
+        model_hyperparams = {} if model_hyperparams is None else dict(model_hyperparams)
+        # default kappa of the filter is degenerate for one-dimensional state
+        model_hyperparams.setdefault('kappa', 0.)
+        self.n_channels = n_channels
+        self.model = BatchUnscentedKalmanFilter(dim_x=model_hyperparams.pop('dim_x', 1),
+                                                dim_z=1,
+                                                **model_hyperparams)
+
+    def update(self, new_points: np.ndarray) -> np.ndarray:
+        new_points = np.asarray(new_points, dtype=float).reshape(self.n_channels, -1)
+        residuals, _ = self.model.filter(new_points)
+        measurement_noise = np.sqrt(self.model.measurement_uncertainty[0, 0])
+        scores = np.abs(residuals[..., 0]) / measurement_noise
+        return scores[0] if self.n_channels == 1 else scores
+
+    def get_state(self) -> dict:
+        # filters are initialised by the first points, empty state arrays stand for a detector without them
+        initialized = self.model.state_mean is not None
+        dim_x = self.model.dim_x
+        return {'state_mean': self.model.state_mean if initialized else np.empty((0, dim_x)),
+                'uncertainty_covariance': self.model.uncertainty_covariance if initialized
+                else np.empty((0, dim_x, dim_x)),
+                'process_uncertainty': self.model.process_uncertainty,
+                'measurement_uncertainty': self.model.measurement_uncertainty}
+
+    def set_state(self, state: dict):
+        self.model.process_uncertainty = np.array(state['process_uncertainty'], dtype=float)
+        self.model.measurement_uncertainty = np.array(state['measurement_uncertainty'], dtype=float)
+        if state['state_mean'].size:
+            self.model.initialize(state['state_mean'], state['uncertainty_covariance'])
+        else:
+            self.model.state_mean, self.model.uncertainty_covariance = None, None
+        return self
+
+
+class StreamingFunctionalPCADetector(StreamingDetector):
+    """Online detector based on reconstruction error of sliding windows by fitted functional PCA.
+
+    Only the last ``window_length - 1`` points are kept between calls, all windows of a new chunk are
+    projected onto principal components with a single matrix product.
+
+    Args:
+        model: fitted :class:`FunctionalPCA` model, it's taken from the state if the detector is restored.
+        window_length: length of the windows the model was fitted on.
+
+    Example:
+        The checkpoint keeps the fitted model as well, so the detector is restored without refitting::
+
+            detector = StreamingFunctionalPCADetector().load_state('./checkpoint.npz')
+
+    """
+
+    def __init__(self, model: FunctionalPCA = None, window_length: int = None):
+        self.model = model
+        self.window_length = window_length
+        self.buffer = deque(maxlen=window_length - 1) if window_length is not None else None
+
+    @classmethod
+    def fit(cls, train_features: np.ndarray, window_length: int, model_hyperparams: dict = None):
+        """Fits functional PCA on sliding windows of the train series."""
+        windows = np.lib.stride_tricks.sliding_window_view(np.ravel(train_features), window_length)
+        return cls(FunctionalPCA(model_hyperparams).fit(windows), window_length)
+
+    def update(self, new_points: np.ndarray) -> np.ndarray:
+        new_points = np.ravel(np.asarray(new_points, dtype=float))
+        history = np.concatenate([np.array(self.buffer), new_points])
+        self.buffer.extend(new_points)
+
+        scores = np.full(new_points.size, np.nan)
+        if history.size < self.window_length:
+            return scores
+        windows = np.lib.stride_tricks.sliding_window_view(history, self.window_length)
+        centred = windows - self.model.mean_
+        projection = centred @ self.model._j_matrix @ self.model.component_coefficients
+        recover = self.model.inverse_transform(projection)
+        scores[-windows.shape[0]:] = np.linalg.norm(windows - recover, axis=1)
+        return scores
+
+    def get_state(self) -> dict:
+        return {'buffer': np.array(self.buffer, dtype=float),
+                'window_length': np.array(self.window_length),
+                'mean': np.asarray(self.model.mean_, dtype=float),
+                'j_matrix': self.model._j_matrix,
+                'component_coefficients': self.model.component_coefficients}
+
+    def set_state(self, state: dict):
+        self.model = FunctionalPCA() if self.model is None else self.model
+        self.model.mean_ = state['mean']
+        self.model._j_matrix = state['j_matrix']
+        self.model.component_coefficients = state['component_coefficients']
+        self.model.n_components = state['component_coefficients'].shape[1]
+        self.window_length = int(state['window_length'])
+        self.buffer = deque(state['buffer'], maxlen=self.window_length - 1)
+        return self
+
+
+def stream_scores(detector: StreamingDetector,
+                  time_series: Union[np.ndarray, list],
+                  chunk_size: int = 100) -> np.ndarray:
+    """Feeds the series to the detector by chunks and concatenates the scores."""
+    time_series = np.asarray(time_series, dtype=float)
+    scores = [detector.update(time_series[..., start:start + chunk_size])
+              for start in range(0, time_series.shape[-1], chunk_size)]
+    return np.concatenate(scores, axis=-1)
@@ -1,3 +1,5 @@
+from collections import deque
+
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from sklearn.preprocessing import MinMaxScaler
 from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
@@ -112,6 +114,46 @@ from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
 #     score_diff = np.diff(score_list)
 #     return score_diff
 
+class SlidingSubspaceTracker:
+    """Tracks dominant left singular subspace of a sliding trajectory (Hankel) matrix.
+
+    Left singular vectors of trajectory matrix ``X`` are eigenvectors of lag-covariance ``X @ X.T``, which is
+    updated with rank-one terms when a column enters or leaves the window. The subspace itself is refined with
+    warm-started orthogonal (subspace) iterations from the previous basis instead of a full SVD.
+
+    Args:
+        n_rows: number of rows of the trajectory matrix (trajectory window length).
+        n_components: dimension of the tracked subspace.
+        n_iterations: number of subspace iterations per update.
+
+    """
+
+    def __init__(self, n_rows: int, n_components: int, n_iterations: int = 1):
+        self.n_components = min(n_components, n_rows)
+        self.n_iterations = n_iterations
+        self.covariance = np.zeros((n_rows, n_rows))
+        self.basis = None
+
+    def add(self, column: np.ndarray):
+        self.covariance += np.outer(column, column)
+
+    def remove(self, column: np.ndarray):
+        self.covariance -= np.outer(column, column)
+
+    def recompute(self, columns: np.ndarray):
+        """Recomputes covariance from scratch to get rid of accumulated round-off error."""
+        self.covariance = columns.T @ columns
+
+    def subspace(self) -> np.ndarray:
+        if self.basis is None:
+            _, eigenvectors = np.linalg.eigh(self.covariance)
+            self.basis = eigenvectors[:, ::-1][:, :self.n_components]
+        else:
+            for _ in range(self.n_iterations):
+                self.basis, _ = np.linalg.qr(self.covariance @ self.basis)
+        return self.basis
+
+
 class SingularSpectrumTransformation:
     """SingularSpectrumTransformation class.
 
@@ -128,6 +170,9 @@ class SingularSpectrumTransformation:
                             functional principal component analysis. Defaults to 3.
                         window_length: Regularization object to be applied.
                         trajectory_window_length: .
+                        n_iterations: number of subspace iterations per step in streaming mode. Defaults to 1.
+                        refresh_period: number of streaming steps after which lag-covariances are recomputed
+                            exactly. Defaults to 1000.
     Attributes:
 
     """
@@ -140,11 +185,14 @@ class SingularSpectrumTransformation:
             self.trajectory_window_length = model_hyperparams['trajectory_window_length']
             self.dynamic_mode = model_hyperparams['dynamic_mode']
             self.lag = model_hyperparams['delay_lag']
+            self.n_iterations = model_hyperparams.get('n_iterations', 1)
+            self.refresh_period = model_hyperparams.get('refresh_period', 1000)
 
         if self.lag is None:
             self.lag = np.round(self.window_length / 2)
         if self.n_components is None:
             self.n_components = 2
+        self.reset_stream()
 
     def _scale_ts(self, time_series: np.ndarray):
         time_series_scaled = MinMaxScaler(feature_range=(1, 2)) \
@@ -183,19 +231,19 @@ class SingularSpectrumTransformation:
                 start_idx_hist, end_idx_hist = t - self.window_length - self.lag, t - self.lag
                 start_idx_test, end_idx_test = t - self.window_length, t
                 x_history = HankelMatrix(time_series=train_features[start_idx_hist:end_idx_hist],
-                                         window_length=self.trajectory_window_length)
+                                         window_size=self.trajectory_window_length)
                 x_test = HankelMatrix(time_series=train_features[start_idx_test:end_idx_test],
-                                      window_length=self.trajectory_window_length)
+                                      window_size=self.trajectory_window_length)
                 self.model.append(x_history)
                 test_features.append(x_test)
 
         else:
             self.model = HankelMatrix(time_series=train_features[:start_idx],
-                                      window_length=self.trajectory_window_length)
+                                      window_size=self.trajectory_window_length)
             for t in range(start_idx, end_idx):
                 start_idx_test, end_idx_test = t - self.lag, t
                 x_test = HankelMatrix(time_series=train_features[start_idx_test:end_idx_test],
-                                      window_length=self.trajectory_window_length)
+                                      window_size=self.trajectory_window_length)
                 test_features.append(x_test)
 
         return self.model, test_features
@@ -253,3 +301,111 @@ class SingularSpectrumTransformation:
                                                             :self.n_components]
         u_cov, s, _ = np.linalg.svd(s_cov, full_matrices=False)
         return 1 - s[0]
+
+    def reset_stream(self):
+        """Drops the state accumulated by :meth:`update`."""
+        n_rows = self.trajectory_window_length
+        self._stream_columns = self.window_length - n_rows + 1
+        self._stream_lag = int(self.lag)
+        self._stream_points = deque(maxlen=n_rows)
+        self._stream_vectors = deque(maxlen=self._stream_columns + self._stream_lag + 1)
+        self._test_tracker = SlidingSubspaceTracker(n_rows, self.n_components, self.n_iterations)
+        self._history_tracker = SlidingSubspaceTracker(n_rows, self.n_components, self.n_iterations)
+        self._history_is_frozen = False
+        self._last_score = None
+        self._stream_step = 0
+
+    def get_stream_state(self) -> dict:
+        """Returns state accumulated by :meth:`update` as a dictionary of numpy arrays."""
+        n_rows = self.trajectory_window_length
+        trackers = {'test': self._test_tracker, 'history': self._history_tracker}
+        state = {'points': np.array(self._stream_points, dtype=float),
+                 'vectors': np.array(self._stream_vectors, dtype=float).reshape(-1, n_rows),
+                 'history_is_frozen': np.array(self._history_is_frozen),
+                 'last_score': np.array(np.nan if self._last_score is None else self._last_score),
+                 'step': np.array(self._stream_step)}
+        for name, tracker in trackers.items():
+            state[f'{name}_covariance'] = tracker.covariance
+            state[f'{name}_basis'] = np.zeros((n_rows, 0)) if tracker.basis is None else tracker.basis
+        return state
+
+    def set_stream_state(self, state: dict):
+        """Restores state previously obtained with :meth:`get_stream_state`."""
+        self.reset_stream()
+        self._stream_points.extend(state['points'])
+        self._stream_vectors.extend(state['vectors'])
+        self._history_is_frozen = bool(state['history_is_frozen'])
+        self._last_score = None if np.isnan(state['last_score']) else float(state['last_score'])
+        self._stream_step = int(state['step'])
+        for name, tracker in {'test': self._test_tracker, 'history': self._history_tracker}.items():
+            tracker.covariance = np.array(state[f'{name}_covariance'], dtype=float)
+            basis = np.array(state[f'{name}_basis'], dtype=float)
+            tracker.basis = basis if basis.size else None
+        return self
+
+    def partial_fit(self, new_points: np.ndarray):
+        """Updates streaming state with new points without returning scores."""
+        self.update(new_points)
+        return self
+
+    def update(self, new_points: np.ndarray) -> np.ndarray:
+        """Incremental implementation of change point score calculation.
+
+        Trajectory matrices of the past and the future windows are never built explicitly. Each new point
+        forms a new lagged vector, which enters the future window while the oldest one moves to the past
+        window, so both lag-covariances get rank-one updates and the subspaces are tracked from the previous
+        basis. The cost of a step depends only on ``trajectory_window_length`` and ``n_components``.
+
+        Args:
+            new_points: 1D array with new points of the stream.
+
+        Returns
+            array of the same length as ``new_points`` with score residuals and ``nan`` for the warm-up points.
+            In dynamic mode these are the values offline :meth:`predict` returns for the same series up to the
+            accuracy of the subspace tracking. In static mode the past window is fixed to the first
+            ``window_length`` points of the stream, while the offline mode uses the whole training part as the
+            past and windows of ``delay_lag`` points as the future, so the scores differ.
+
+        """
+        new_points = np.ravel(np.asarray(new_points, dtype=float))
+        residuals = np.full(new_points.size, np.nan)
+        for point_idx, point in enumerate(new_points):
+            score = self._update_one(point)
+            if score is None:
+                continue
+            if self._last_score is not None:
+                residuals[point_idx] = score - self._last_score
+            self._last_score = score
+        return residuals
+
+    def _update_one(self, point: float):
+        self._stream_points.append(point)
+        if len(self._stream_points) < self._stream_points.maxlen:
+            return None
+        vectors = self._stream_vectors
+        vectors.append(np.array(self._stream_points))
+        self._stream_step += 1
+        n_columns, lag = self._stream_columns, self._stream_lag
+
+        self._test_tracker.add(vectors[-1])
+        if len(vectors) > n_columns:
+            self._test_tracker.remove(vectors[-1 - n_columns])
+        if not self._history_is_frozen and len(vectors) > lag:
+            self._history_tracker.add(vectors[-1 - lag])
+            if len(vectors) > lag + n_columns:
+                self._history_tracker.remove(vectors[-1 - lag - n_columns])
+            # in static mode the past window is fixed as soon as it was filled
+            self._history_is_frozen = not self.dynamic_mode and len(vectors) >= lag + n_columns
+
+        if len(vectors) < lag + n_columns:
+            return None
+        if self._stream_step % self.refresh_period == 0:
+            stacked_vectors = np.stack(vectors)
+            self._test_tracker.recompute(stacked_vectors[-n_columns:])
+            if not self._history_is_frozen:
+                self._history_tracker.recompute(stacked_vectors[-lag - n_columns:-lag if lag else None])
+
+        u_test = self._test_tracker.subspace()
+        u_history = self._history_tracker.subspace()
+        s = np.linalg.svd(u_test.T @ u_history, compute_uv=False)
+        return 1 - s[0]
@@ -1,4 +1,5 @@
 import os
+from copy import deepcopy
 from typing import Optional
 
 import torch
@@ -7,7 +8,9 @@ from fedot.core.data.data import InputData, OutputData
 from fedot.core.data.data_split import _are_stratification_allowed, train_test_data_setup
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
-from torch import Tensor
+from torch import nn, Tensor
+from torch.ao.nn.quantized import dynamic as nnqd
+from torch.ao.quantization import default_dynamic_qconfig, quantize_dynamic
 from torch.optim import lr_scheduler
 
 from fedot_ind.core.architecture.abstraction.decorators import convert_inputdata_to_torch_dataset, \
@@ -16,6 +19,11 @@ from fedot_ind.core.architecture.settings.computational import backend_methods a
 from fedot_ind.core.architecture.settings.computational import default_device
 from fedot_ind.core.models.nn.network_modules.layers.special import adjust_learning_rate, EarlyStopping
 
+EXPORT_METHODS = ('trace', 'script')
+# layers with int8 dynamic counterparts, activations are quantized on the fly during inference.
+# Dynamic convolutions are left in float, since their int8 outputs are clipped at zero
+DYNAMIC_QUANTIZATION_MAPPING = {nn.Linear: nnqd.Linear}
+
 
 class BaseNeuralModel:
     """Class responsible for NN model implementation.
@@ -169,6 +177,7 @@ class BaseNeuralModel:
 
     @convert_to_3d_torch_array
     def _fit_model(self, ts: InputData, split_data: bool = False):
+        self.input_shape = tuple(ts.features.shape[1:])
         self._train_loop(*self._prepare_data(ts, split_data),
                          *self._init_model(ts))
 
@@ -205,3 +214,77 @@ class BaseNeuralModel:
         Method for feature generation for all series
         """
         return self._predict_model(input_data, output_mode)
+
+    def _model_for_export(self) -> nn.Module:
+        return self.model
+
+    def export(self,
+               path: Optional[str] = None,
+               method: str = 'trace',
+               quantize: bool = False,
+               example_input: Optional[np.ndarray] = None) -> torch.jit.ScriptModule:
+        """Exports fitted network to TorchScript for serving on CPU without FEDOT and the eager Python graph.
+
+        Args:
+            path: if given, the exported model is saved there with ``torch.jit.save``.
+            method: ``'trace'`` to record operations of the network on ``example_input`` or ``'script'`` to
+                compile its code. Tracing works for all the networks of the repository, scripting only for
+                those without data-dependent Python control flow.
+            quantize: if True, weights of linear layers are dynamically quantized to int8.
+            example_input: batch of samples for tracing, random batch of the training shape by default.
+
+        Returns:
+            exported module which returns raw outputs of the network, e.g. logits for classification.
+
+        """
+        if method not in EXPORT_METHODS:
+            raise ValueError(f'Unknown export method {method}, expected one of {EXPORT_METHODS}')
+        model = deepcopy(self._model_for_export()).to(torch.device('cpu')).eval()
+        if quantize:
+            model = quantize_dynamic(model,
+                                     qconfig_spec=dict.fromkeys(DYNAMIC_QUANTIZATION_MAPPING, default_dynamic_qconfig),
+                                     mapping=DYNAMIC_QUANTIZATION_MAPPING,
+                                     dtype=torch.qint8)
+        with torch.no_grad():
+            if method == 'script':
+                exported = torch.jit.script(model)
+            else:
+                if example_input is None:
+                    # not all the networks call the constructor of the base class
+                    input_shape = getattr(self, 'input_shape', None)
+                    if input_shape is None:
+                        raise ValueError('Example input is required to trace the model with unknown input shape')
+                    example_input = torch.rand(2, *input_shape)
+                exported = torch.jit.trace(model, torch.as_tensor(example_input, dtype=torch.float32))
+        exported = torch.jit.freeze(exported)
+        if path is not None:
+            torch.jit.save(exported, path)
+        return exported
+
+    def check_export_parity(self, exported_model, features: np.ndarray, atol: float = 1e-4) -> dict:
+        """Compares outputs of the exported model with the eager network on the same samples.
+
+        Args:
+            exported_model: model returned by :meth:`export` or loaded with ``torch.jit.load``.
+            features: batch of samples of the training shape.
+            atol: absolute tolerance of the outputs.
+
+        Returns:
+            dict with maximal absolute difference of the outputs, share of the samples with the same
+            predicted class and flag whether all the outputs are within ``atol``.
+
+        """
+        features = torch.as_tensor(features, dtype=torch.float32)
+        model = self._model_for_export()
+        # the network may be compared in the middle of training, so its mode is restored after the comparison
+        training = model.training
+        try:
+            with torch.no_grad():
+                eager_output = model.eval()(features.to(next(model.parameters()).device)).cpu()
+                exported_output = exported_model(features)
+        finally:
+            model.train(training)
+        max_abs_error = (eager_output - exported_output).abs().max().item()
+        return {'max_abs_error': max_abs_error,
+                'label_agreement': (eager_output.argmax(dim=1) == exported_output.argmax(dim=1)).float().mean().item(),
+                'is_close': max_abs_error <= atol}
@@ -297,6 +297,10 @@ class PatchTSTModel(BaseNeuralModel):
 
         return model
 
+    def _model_for_export(self):
+        # every fit appends a model, the latest one is exported
+        return self.model_list[-1]
+
     def _predict(self, model, test_loader):
         model.eval()
         with torch.no_grad():
@@ -136,6 +136,10 @@ class ResNetModel(BaseNeuralModel):
             loss_fn = RMSE
         return loss_fn, optimizer
 
+    def _model_for_export(self):
+        # forward of the wrapper moves input to the default device, so the torch network is exported
+        return self.model.model if isinstance(self.model, ResNet) else self.model
+
     def _prepare_data(self, ts, split_data: bool = True):
         train_data, val_data = train_test_data_setup(
             ts, shuffle_flag=True, split_ratio=0.7)
@@ -58,7 +58,7 @@ class _TSTEncoderLayer(Module):
     def forward(self, src: Tensor, mask: Optional[Tensor] = None) -> Tensor:
         # Multi-Head attention sublayer
         # Multi-Head attention
-        src2, attn = self.self_attn(src, src, src, mask=mask)
+        src2, attn = self.self_attn(src, src, src, attn_mask=mask)
         # Add & Norm
         # Add: residual connection with residual dropout
         src = src + self.dropout_attn(src2)
@@ -191,13 +191,12 @@ class TST(Module):
                                    dropout=dropout,
                                    activation=activation,
                                    n_layers=n_layers)
-        self.flatten = Flatten()
 
         # Head
         self.head_nf = q_len * model_dim
         self.head = self.create_head(self.head_nf,
                                      output_dim,
-                                     act=activation,
+                                     activation=activation,
                                      fc_dropout=fc_dropout,
                                      y_range=y_range)
 
@@ -208,7 +207,7 @@ class TST(Module):
                     fc_dropout=0.,
                     y_range=None,
                     **kwargs):
-        layers = [get_activation_fn(activation), Flatten()]
+        layers = [get_activation_fn(activation), Flatten(number_of_filters)]
         if fc_dropout:
             layers += [nn.Dropout(fc_dropout)]
         layers += [nn.Linear(number_of_filters, output_dim)]
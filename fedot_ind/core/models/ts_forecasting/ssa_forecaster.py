@@ -21,6 +21,42 @@ from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
 from fedot_ind.core.operation.transformation.window_selector import WindowSizeSelector
 
 
+def lrr_coefficients(eigenvectors: np.ndarray) -> np.ndarray:
+    """Computes coefficients of the linear recurrent relation (LRR) of SSA-R forecasting.
+
+    Args:
+        eigenvectors: left singular vectors of the trajectory matrix of shape ``(window_size, n_components)``
+            or stacked for several channels ``(n_channels, window_size, n_components)``.
+
+    Returns:
+        coefficients of shape ``(window_size - 1,)`` or ``(n_channels, window_size - 1)``.
+
+    """
+    last_row = eigenvectors[..., -1, :]
+    verticality = np.sum(last_row ** 2, axis=-1, keepdims=True)
+    coefficients = np.einsum('...ij,...j->...i', eigenvectors[..., :-1, :], last_row)
+    return coefficients / np.maximum(1 - verticality, np.finfo(float).eps)
+
+
+def linear_recurrent_forecast(series: np.ndarray, coefficients: np.ndarray, horizon: int) -> np.ndarray:
+    """Continues all the series with the linear recurrent relation.
+
+    Args:
+        series: array of shape ``(..., ts_length)``, e.g. reconstructed components of several channels.
+        coefficients: LRR coefficients broadcastable to ``(..., window_size - 1)``.
+        horizon: number of points to forecast.
+
+    Returns:
+        forecast of shape ``(..., horizon)``.
+
+    """
+    lags = coefficients.shape[-1]
+    extended = np.concatenate([series[..., -lags:], np.zeros(series.shape[:-1] + (horizon,))], axis=-1)
+    for step in range(horizon):
+        extended[..., lags + step] = np.sum(extended[..., step:lags + step] * coefficients, axis=-1)
+    return extended[..., lags:]
+
+
 class SSAForecasterImplementation(ModelImplementation):
     """Model for forecasting univariate timeseries with Singular Spectrum Decomposition.
     For given time series ``T`` we construct trajectory matrix (hankel matrix) ``X``, where
@@ -30,6 +66,14 @@ class SSAForecasterImplementation(ModelImplementation):
 
     Attributes:
         window_size_method: str, method for estimating window size for SSA forecaster
+        mode: str, ``'lrr'`` to forecast components with linear recurrent relation obtained directly from
+            eigenvectors (SSA-R) or ``'pipeline'`` to fit separate FEDOT ``gaussian_filter -> ar`` pipeline
+            for each component dynamics
+        warm_start: bool, if True, the basis of the previous call is reused as a starting point of subspace
+            iteration for the trajectory matrix of new observations instead of a full decomposition. It speeds up
+            rolling re-forecasting with the same fitted model
+        drift_threshold: float, if relative reconstruction error of the new trajectory matrix with the previous basis
+            exceeds this value, full decomposition is recomputed
 
     Example:
         To use this operation you can create pipeline as follows::
@@ -55,6 +99,11 @@ class SSAForecasterImplementation(ModelImplementation):
         super().__init__(params)
 
         self.window_size_method = params.get('window_size_method')
+        self.mode = params.get('mode', 'lrr')
+        self.warm_start = params.get('warm_start', False)
+        self.drift_threshold = params.get('drift_threshold', 0.1)
+        self.warm_start_iterations = 2
+        self._previous_basis = None
         self.n_processes = 1
         self._SV_threshold = None
         self._decomposer = None
@@ -97,14 +146,17 @@ class SSAForecasterImplementation(ModelImplementation):
         U, s, VT = self._predict_loop(trajectory_matrix)
         s_basis = s[:self._decomposer.thr]
         current_dynamics = VT[:self._decomposer.thr]
-        forecast_by_channel, model_by_channel = self._predict_channel(input_data,
-                                                                      current_dynamics,
-                                                                      self.horizon)
+        if self.mode == 'lrr':
+            basis = self._predict_lrr(U, s_basis, current_dynamics)
+        else:
+            forecast_by_channel, model_by_channel = self._predict_channel(input_data,
+                                                                          current_dynamics,
+                                                                          self.horizon)
 
-        forecasted_dynamics = np.concatenate([current_dynamics,
-                                              np.vstack(list(forecast_by_channel.values()))], axis=1)
-        self._decomposer.ts_length = self._decomposer.ts_length + self.horizon
-        basis = self.reconstruct_basis(U, s_basis, forecasted_dynamics).T
+            forecasted_dynamics = np.concatenate([current_dynamics,
+                                                  np.vstack(list(forecast_by_channel.values()))], axis=1)
+            self._decomposer.ts_length = self._decomposer.ts_length + self.horizon
+            basis = self.reconstruct_basis(U, s_basis, forecasted_dynamics).T
 
         summed_basis = np.array(basis).sum(axis=0)
         reconstructed_forecast = summed_basis[-self.horizon:]
@@ -118,8 +170,36 @@ class SSAForecasterImplementation(ModelImplementation):
                                                                          output_data_type=input_data.data_type)
         return predict_data
 
-    def _predict_loop(self, input_data: InputData) -> tuple:
-        U, s, VT = self.get_svd(input_data)
+    def _predict_loop(self, trajectory_matrix: np.ndarray) -> tuple:
+        if self.warm_start and self._previous_basis is not None \
+                and self._previous_basis.shape[0] == trajectory_matrix.shape[0]:
+            components = self._warm_start_svd(trajectory_matrix)
+            if components is not None:
+                return components
+        U, s, VT = self.get_svd(trajectory_matrix)
+        self._previous_basis = U[:, :self._decomposer.thr]
+        return U, s, VT
+
+    def _warm_start_svd(self, trajectory_matrix: np.ndarray) -> Optional[tuple]:
+        """Updates the previous basis with subspace iteration on the new trajectory matrix.
+
+        Returns:
+            ``U, s, VT`` of the rank of the previous basis or None if the subspace drifted too much
+            and full decomposition is required.
+
+        """
+        basis = self._previous_basis
+        # part of the new trajectory matrix which can't be reconstructed with the previous basis
+        residual = trajectory_matrix - basis @ (basis.T @ trajectory_matrix)
+        drift = np.linalg.norm(residual) / np.linalg.norm(trajectory_matrix)
+        if drift > self.drift_threshold:
+            return None
+        for _ in range(self.warm_start_iterations):
+            basis, _ = np.linalg.qr(trajectory_matrix @ (trajectory_matrix.T @ basis))
+        U_projected, s, VT = np.linalg.svd(basis.T @ trajectory_matrix, full_matrices=False)
+        U = basis @ U_projected
+        self._decomposer.thr = U.shape[1]
+        self._previous_basis = U
         return U, s, VT
 
     def fit(self, input_data: InputData):
@@ -147,6 +227,13 @@ class SSAForecasterImplementation(ModelImplementation):
             predict = self.__predict_for_fit(data)
         return predict
 
+    def _predict_lrr(self, U, s_basis, current_dynamics):
+        """Forecasts all the reconstructed components at once with the LRR obtained from the eigenvectors."""
+        components = self.reconstruct_basis(U, s_basis, current_dynamics).T
+        coefficients = lrr_coefficients(U[:, :s_basis.shape[0]])
+        forecast = linear_recurrent_forecast(components, coefficients, self.horizon)
+        return np.concatenate([components, forecast], axis=1)
+
     def _predict_channel(self, input_data: InputData, component_dynamics, forecast_length: int):
 
         comp = deepcopy(input_data)
@@ -1,5 +1,5 @@
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
-from fedot_ind.core.architecture.settings.computational import backend_scipy
+from fedot_ind.core.architecture.settings.computational import backend_scipy, to_default_dtype
 from fedot_ind.core.operation.transformation.regularization.spectrum import singular_value_hard_threshold, \
     sv_to_explained_variance_ratio
 import math
@@ -71,6 +71,7 @@ class RSVDDecomposition:
         :param approximation:
 
         """
+        tensor = to_default_dtype(tensor)
         # Return classic svd decomposition with choosen type of spectrum thresholding
         if not approximation:
             # classic svd decomposition
@@ -85,6 +86,9 @@ class RSVDDecomposition:
         else:
             # First step. Initialize random matrix params.
             self._init_random_params(tensor)
+            # Power of Gram matrix squares its condition number, so the approximation is computed in double precision
+            # and only the result is cast back to default precision.
+            output_dtype, tensor = tensor.dtype, tensor.astype(np.float64, copy=False)
             # Second step. Transform initial matrix to Gram. matrix
             AAT = tensor @ tensor.T
             # Third step. Power iteration procedure.First we raise the Gram matrix to the chosen degree.
@@ -113,4 +117,4 @@ class RSVDDecomposition:
                 Ut, sampled_tensor_orto, tensor, regularized_rank)
             U_, S_, V_ = np.linalg.svd(reconstr_tensor, full_matrices=False)
 
-            return [U_, S_, V_]
+            return [U_.astype(output_dtype), S_.astype(output_dtype), V_.astype(output_dtype)]
@@ -3,7 +3,8 @@ from typing import Optional
 import pandas as pd
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.pipelines.node import PipelineNode
-from scipy.spatial.distance import cdist
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from scipy.stats import stats
 from sklearn.decomposition import PCA
 from sklearn.feature_selection import VarianceThreshold
@@ -43,10 +44,9 @@ class FeatureFilter(IndustrialCachableOperationImplementation):
 
     def filter_dimension_num(self, data):
         if len(data.features.shape) < 3:
-            grouped_components = [self._compute_component_corr(data.features)]
+            grouped_components = self._group_components(data.features[None, :, :])
         else:
-            grouped_components = list(
-                map(self._compute_component_corr, data.features))
+            grouped_components = self._group_components(data.features)
         dimension_distrib = [x.shape[0] for x in grouped_components]
         minimal_dim = min(dimension_distrib)
         dominant_dim = stats.mode(dimension_distrib).mode
@@ -57,44 +57,51 @@ class FeatureFilter(IndustrialCachableOperationImplementation):
         return np.stack(grouped_predict) if len(grouped_predict) > 1 else grouped_predict[0]
 
     def _compute_component_corr(self, sample):
-        component_idx_list = list(range(sample.shape[0]))
-        del component_idx_list[0]
-        if len(component_idx_list) == 1:
-            return sample
-        else:
-            grouped_predict = sample[0, :].reshape(1, -1)
-            tmp = pd.DataFrame(sample[1:, :])
-            component_list = []
-            correlation_matrix = cdist(
-                metric='correlation', XA=tmp.values, XB=tmp.values)
-            if (correlation_matrix > self.grouping_level).sum() > 0:
-                for index in component_idx_list:
-                    if len(component_idx_list) == 0:
-                        break
-                    else:
-                        component_idx_list.remove(index)
-                        for correlation_level, component in zip(correlation_matrix, sample[1:, :]):
-                            if len(component_idx_list) == 0:
-                                break
-                            grouped_v = component
-                            for cor_level in correlation_level[index:]:
-                                if cor_level > self.grouping_level:
-                                    component_idx = np.where(
-                                        correlation_level == cor_level)[0][0] + 1
-                                    grouped_v = grouped_v + \
-                                        sample[component_idx, :]
-                                    if component_idx in component_idx_list:
-                                        component_idx_list.remove(
-                                            component_idx)
-                                    else:
-                                        continue
-                            component_list.append(grouped_v)
-                    component_list = [x.reshape(1, -1) for x in component_list]
-                    grouped_predict = np.concatenate(
-                        [grouped_predict, *component_list], axis=0)
-                return grouped_predict
-            else:
-                return sample
+        return self._group_components(sample[None, :, :])[0]
+
+    def _group_components(self, components: np.ndarray) -> list:
+        """Groups correlated components of each sample. The first component of a sample is kept as is, the rest
+        are linked if their correlation distance is lower than ``grouping_level`` and the connected groups are summed.
+
+        Args:
+            components: array of shape ``(n_samples, n_components, component_length)``.
+
+        Returns:
+            list of arrays of shape ``(n_groups + 1, component_length)`` for each sample, groups are ordered by
+            their first component.
+
+        """
+        n_samples, n_components, _ = components.shape
+        if n_components <= 2:
+            return list(components)
+        tail = components[:, 1:, :]
+        n_tail = n_components - 1
+
+        # correlation matrices of all samples with one batched matrix product of standardised components
+        centered = tail - tail.mean(axis=2, keepdims=True)
+        norm = np.linalg.norm(centered, axis=2, keepdims=True)
+        standardised = np.divide(centered, norm, out=np.zeros_like(centered), where=norm > 0)
+        correlation = standardised @ standardised.transpose(0, 2, 1)
+        linked = 1 - correlation < self.grouping_level
+
+        # components of all samples are nodes of one graph, so groups are found with a single pass
+        sample_idx, row_idx, col_idx = np.nonzero(linked)
+        n_nodes = n_samples * n_tail
+        graph = coo_matrix((np.ones(sample_idx.shape[0]),
+                            (sample_idx * n_tail + row_idx, sample_idx * n_tail + col_idx)),
+                           shape=(n_nodes, n_nodes))
+        _, labels = connected_components(graph, directed=False)
+        # labels are assigned in order of the first node of a group, so they are contiguous within a sample
+        labels = labels.reshape(n_samples, n_tail)
+        labels = labels - labels.min(axis=1, keepdims=True)
+
+        grouped_components = []
+        for sample, sample_labels in zip(components, labels):
+            grouped = np.zeros((sample_labels.max() + 2, sample.shape[1]), dtype=sample.dtype)
+            grouped[0] = sample[0]
+            np.add.at(grouped, sample_labels + 1, sample[1:])
+            grouped_components.append(grouped)
+        return grouped_components
 
     def filter_feature_num(self, data):
         if self.model is None:
@@ -3,11 +3,10 @@ from fedot.core.operations.evaluation.operation_implementations.data_operations.
 from fedot.core.operations.evaluation.time_series import FedotTsForecastingStrategy
 from fedot.core.operations.operation_parameters import OperationParameters
 
-from fedot_ind.core.models.nn.network_impl.patch_tst import PatchTSTModel
 from fedot_ind.core.operation.interfaces.industrial_preprocessing_strategy import IndustrialCustomPreprocessingStrategy, \
     MultiDimPreprocessingStrategy
-from fedot_ind.core.repository.model_repository import NEURAL_MODEL, SKLEARN_CLF_MODELS, SKLEARN_REG_MODELS, \
-    FORECASTING_MODELS
+from fedot_ind.core.repository.model_repository import FORECASTING_MODELS, LazyOperationRegistry, NEURAL_MODEL, \
+    SKLEARN_CLF_MODELS, SKLEARN_REG_MODELS
 
 
 class FedotNNClassificationStrategy(EvaluationStrategy):
@@ -51,9 +50,9 @@ class FedotNNRegressionStrategy(FedotNNClassificationStrategy):
 
 
 class FedotNNTimeSeriesStrategy(FedotTsForecastingStrategy):
-    __operations_by_types = {
-        'patch_tst_model': PatchTSTModel
-    }
+    __operations_by_types = LazyOperationRegistry({
+        'patch_tst_model': 'fedot_ind.core.models.nn.network_impl.patch_tst.PatchTSTModel'
+    })
 
     def _convert_to_operation(self, operation_type: str):
         if operation_type in self.__operations_by_types.keys():
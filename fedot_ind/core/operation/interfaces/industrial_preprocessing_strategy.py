@@ -10,22 +10,43 @@ from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.operation_types_repository import get_operation_type_from_id, OperationTypesRepository
 from fedot.utilities.random import ImplementationRandomStateHandler
+from joblib import delayed, Parallel
 
 from fedot_ind.core.architecture.preprocessing.data_convertor import ConditionConverter, FedotConverter, NumpyConverter
+from fedot_ind.core.architecture.settings.computational import compute_budget
 from fedot_ind.core.repository.IndustrialOperationParameters import IndustrialOperationParameters
+from fedot_ind.core.repository.constanst_repository import CPU_NUMBERS
 from fedot_ind.core.repository.model_repository import FEDOT_PREPROC_MODEL, FORECASTING_PREPROC, \
     INDUSTRIAL_CLF_PREPROC_MODEL, INDUSTRIAL_PREPROC_MODEL
 
 
 class MultiDimPreprocessingStrategy(EvaluationStrategy):
+    """Strategy which adapts operation to multidimensional data.
+
+    In ``channel_independent`` mode an independent copy of the operation is fitted for every channel. Fit and
+    predict calls of the channels run concurrently in a bounded pool of threads. Operations which process
+    every sample independently of the others and declare ``channel_fusable = True`` are called only once
+    with channels folded into the sample axis.
+
+    Args:
+        operation_impl: class of the wrapped operation.
+        operation_type: name of the operation.
+        params: parameters of the operation.
+        mode: ``'one_dimensional'``, ``'channel_independent'`` or ``'multi_dimensional'``.
+        n_jobs: maximum number of channels processed concurrently, number of CPU by default.
+
+    """
+
     def __init__(self, operation_impl,
                  operation_type: str,
                  params: Optional[OperationParameters] = None,
-                 mode: str = 'one_dimensional'):
+                 mode: str = 'one_dimensional',
+                 n_jobs: Optional[int] = None):
         self.operation_impl = operation_impl
         super().__init__(operation_type, params)
         self.output_mode = 'labels'
         self.mode = mode
+        self.n_jobs = CPU_NUMBERS if n_jobs is None else n_jobs
 
     @property
     def implementation_info(self) -> str:
@@ -74,6 +95,54 @@ class MultiDimPreprocessingStrategy(EvaluationStrategy):
         return FedotConverter(train_data).convert_to_industrial_composing_format(mode if mode is not None
                                                                                  else self.mode)
 
+    def _map_channels(self, func, operations: list, channel_data: list) -> list:
+        """Applies ``func`` to the operation and the data of every channel in a bounded pool of threads.
+
+        Threads are used instead of processes, so neither the data nor the fitted operations are pickled.
+        """
+        with compute_budget(min(self.n_jobs, len(channel_data)), prefer='threads') as n_jobs:
+            if n_jobs <= 1:
+                return [func(operation, data) for operation, data in zip(operations, channel_data)]
+            parallel = Parallel(n_jobs=n_jobs, prefer='threads')
+            return parallel(delayed(func)(operation, data) for operation, data in zip(operations, channel_data))
+
+    @staticmethod
+    def _is_fusable(operation, channel_data) -> bool:
+        return getattr(operation, 'channel_fusable', False) and type(channel_data) is list and \
+            len(channel_data) > 1 and channel_data[0].features.ndim == 2 and \
+            len({data.features.shape for data in channel_data}) == 1
+
+    @staticmethod
+    def _fuse_channels(channel_data: list) -> InputData:
+        """Folds channels into the sample axis, so all of them are processed with one call."""
+        first_channel = channel_data[0]
+        target = np.concatenate([data.target for data in channel_data]) \
+            if isinstance(first_channel.target, np.ndarray) else first_channel.target
+        return InputData(idx=np.arange(len(channel_data) * first_channel.features.shape[0]),
+                         features=np.concatenate([data.features for data in channel_data]),
+                         target=target,
+                         task=first_channel.task,
+                         data_type=first_channel.data_type,
+                         supplementary_data=first_channel.supplementary_data)
+
+    def _fit_fused(self, operation_implementation, train_data: list) -> list:
+        fused_data = self._fuse_channels(train_data)
+        fitted_operation = operation_implementation.fit(fused_data)
+        if fitted_operation is not None:
+            return [fitted_operation] * len(train_data)
+        # fit isn't implemented, so the transformed train data of every channel is returned as in unfused case
+        fused_output = operation_implementation.transform_for_fit(fused_data)
+        fused_predict = getattr(fused_output, 'predict', fused_output)
+        data_type = getattr(fused_output, 'data_type', train_data[0].data_type)
+        return [OutputData(idx=data.idx,
+                           features=data.features,
+                           predict=channel_predict,
+                           task=data.task,
+                           target=data.target,
+                           data_type=data_type,
+                           supplementary_data=data.supplementary_data)
+                for data, channel_predict in zip(train_data, np.split(fused_predict, len(train_data)))]
+
     def _predict_for_ndim(self, predict_data, trained_operation: list):
         self.operation_condition_for_channel_independent = ConditionConverter(predict_data,
                                                                               trained_operation[0],
@@ -90,21 +159,20 @@ class MultiDimPreprocessingStrategy(EvaluationStrategy):
              predict_data.features.swapaxes(1, 0)]
 
         # check model methods and method input type
-
         if self.operation_condition_for_channel_independent.have_transform_method:
             if self.operation_condition_for_channel_independent.is_transform_input_fedot:
-                prediction = list(operation.transform(
-                    data) for operation, data in zip(trained_operation, test_data))
-                prediction = [pred.predict if type(
-                    pred) is not np.ndarray else pred for pred in prediction]
+                def apply(operation, data): return operation.transform(data)
             else:
-                prediction = list(
-                    operation.transform(data.features) for operation, data in zip(trained_operation, test_data))
+                def apply(operation, data): return operation.transform(data.features)
         elif self.operation_condition_for_channel_independent.have_predict_method:
-            prediction = list(operation.predict(data)
-                              for operation, data in zip(trained_operation, test_data))
-            prediction = [pred.predict for pred in prediction if type(
-                pred) is not np.array]
+            def apply(operation, data): return operation.predict(data)
+
+        if self._is_fusable(trained_operation[0], test_data):
+            fused_prediction = apply(trained_operation[0], self._fuse_channels(test_data))
+            prediction = np.split(getattr(fused_prediction, 'predict', fused_prediction), len(test_data))
+        else:
+            prediction = [getattr(pred, 'predict', pred)
+                          for pred in self._map_channels(apply, trained_operation, test_data)]
 
         prediction = NumpyConverter(data=np.hstack(
             prediction)).convert_to_torch_format()
@@ -155,25 +223,26 @@ class MultiDimPreprocessingStrategy(EvaluationStrategy):
             return self.fit_one_sample(operation_implementation, train_data)
         # Elif model could be use for each dimension(channel) independently we use channel_independent mode
         elif self.operation_condition.is_channel_independent_operation:
-            # Create independent copy of model for each channel
-            trained_operation = [deepcopy(operation_implementation) if self.operation_condition.is_list_container
-                                 else deepcopy(operation_implementation) for i in range(len(train_data))]
             train_data = train_data if self.operation_condition.is_list_container else [
                 train_data]
+            if self._is_fusable(operation_implementation, train_data):
+                return self._fit_fused(operation_implementation, train_data)
+            # Create independent copy of model for each channel
+            trained_operation = [deepcopy(operation_implementation) for _ in train_data]
 
             # Check if model have both or just one method (fit and transform_for_fit). For some model one of this method
             # could be not finished to use right now.
+            fit_method_is_not_implemented = False
             if self.operation_condition.have_fit_method:
-                operation_implementation = [operation.fit(data) for operation, data in zip(
-                    trained_operation, train_data)]
+                operation_implementation = self._map_channels(lambda operation, data: operation.fit(data),
+                                                              trained_operation, train_data)
                 fit_method_is_not_implemented = operation_implementation[0] is None
             elif self.operation_condition.have_transform_method:
-                operation_implementation = [operation.transform_for_fit(data) for operation, data in zip(
-                    trained_operation, train_data)]
+                fit_method_is_not_implemented = True
 
             if fit_method_is_not_implemented:
-                operation_implementation = [operation.transform_for_fit(data) for operation, data in zip(
-                    trained_operation, train_data)]
+                operation_implementation = self._map_channels(lambda operation, data: operation.transform_for_fit(data),
+                                                              trained_operation, train_data)
 
             return operation_implementation
         else:
@@ -3,12 +3,13 @@ from typing import Optional, Union
 import pandas as pd
 from fedot.core.data.data import InputData
 from fedot.core.operations.operation_parameters import OperationParameters
-from joblib import delayed, Parallel
+from joblib import Parallel
 from pymonad.either import Either
 from pymonad.list import ListMonad
 
 from fedot_ind.core.architecture.preprocessing.data_convertor import DataConverter, NumpyConverter
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.architecture.settings.computational import compute_budget, delayed_in_precision
 from fedot_ind.core.operation.IndustrialCachableOperation import IndustrialCachableOperationImplementation
 from fedot_ind.core.repository.constanst_repository import CPU_NUMBERS, MULTI_ARRAY
 
@@ -17,6 +18,8 @@ class BasisDecompositionImplementation(IndustrialCachableOperationImplementation
     """
     A class for decomposing data on the abstract basis and evaluating the derivative of the resulting decomposition.
     """
+    # bases which transform every sample independently of the others may process all channels with one call
+    channel_fusable = False
 
     def __init__(self, params: Optional[OperationParameters] = None):
         super().__init__(params)
@@ -62,6 +65,21 @@ class BasisDecompositionImplementation(IndustrialCachableOperationImplementation
         """
         pass
 
+    def _transform_batch(self, features: np.array) -> Optional[np.array]:
+        """Method for transforming all samples with one vectorized call.
+
+        Bases which are cheap to compute for the whole dataset at once override this method to avoid
+        dispatching one parallel task per sample.
+
+        Args:
+            features: array of shape ``(n_samples, series_length)`` or ``(n_samples, n_channels, series_length)``.
+
+        Returns:
+            transformed features or None if the basis has no batched implementation for this input.
+
+        """
+        return None
+
     def _get_1d_basis(self, input_data):
         def decompose(signal): return ListMonad(self._decompose_signal(signal))
         basis = Either.insert(input_data).then(decompose).value[0]
@@ -72,10 +90,14 @@ class BasisDecompositionImplementation(IndustrialCachableOperationImplementation
 
         """
         features = DataConverter(data=input_data).convert_to_monad_data()
-        parallel = Parallel(n_jobs=self.n_processes,
-                            verbose=0, pre_dispatch="2*n_jobs")
-        v = parallel(delayed(self._transform_one_sample)(sample)
-                     for sample in features)
+        predict = self._transform_batch(features)
+        if predict is not None:
+            return predict
+        with compute_budget(self.n_processes) as n_jobs:
+            parallel = Parallel(n_jobs=n_jobs,
+                                verbose=0, pre_dispatch="2*n_jobs")
+            v = parallel(delayed_in_precision(self._transform_one_sample)(sample)
+                         for sample in features)
         predict = NumpyConverter(data=np.array(v)).convert_to_torch_format()
         return predict
 
@@ -4,7 +4,7 @@ import tensorly as tl
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
-from joblib import delayed, Parallel
+from joblib import Parallel
 from pymonad.either import Either
 from pymonad.list import ListMonad
 from scipy import stats
@@ -13,6 +13,7 @@ from tqdm import tqdm
 
 from fedot_ind.core.architecture.preprocessing.data_convertor import DataConverter, NumpyConverter
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.architecture.settings.computational import compute_budget, delayed_in_precision
 from fedot_ind.core.operation.decomposition.matrix_decomposition.power_iteration_decomposition import RSVDDecomposition
 from fedot_ind.core.operation.transformation.basis.abstract_basis import BasisDecompositionImplementation
 from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
@@ -52,12 +53,13 @@ class EigenBasisImplementation(BasisDecompositionImplementation):
         if self.SV_threshold is None:
             self.SV_threshold = max(self.get_threshold(data=features), 2)
             self.logging_params.update({'SV_thr': self.SV_threshold})
-        for dimension in range(features.shape[1]):
-            parallel = Parallel(n_jobs=self.n_processes,
-                                verbose=0, pre_dispatch="2*n_jobs")
-            v = parallel(delayed(self._transform_one_sample)(sample)
-                         for sample in features[:, dimension, :])
-            predict.append(np.array(v) if len(v) > 1 else v[0])
+        with compute_budget(self.n_processes) as n_jobs:
+            for dimension in range(features.shape[1]):
+                parallel = Parallel(n_jobs=n_jobs,
+                                    verbose=0, pre_dispatch="2*n_jobs")
+                v = parallel(delayed_in_precision(self._transform_one_sample)(sample)
+                             for sample in features[:, dimension, :])
+                predict.append(np.array(v) if len(v) > 1 else v[0])
         return predict
 
     def _convert_basis_to_predict(self, basis, input_data):
@@ -18,6 +18,7 @@ class FourierBasisImplementation(BasisDecompositionImplementation):
         basis_1d = bss.transform(ts1)
 
     """
+    channel_fusable = True
 
     def __repr__(self):
         return 'FourierBasisImplementation'
@@ -30,22 +31,35 @@ class FourierBasisImplementation(BasisDecompositionImplementation):
 
         self.logging_params.update({'threshold': self.threshold})
 
-    def _decompose_signal(self, input_data):
-        fourier_coef = np.fft.rfft(input_data)
+    def _frequency_mask(self, series_length: int) -> np.array:
+        """Returns boolean mask of ``rfft`` coefficients which are kept for series of the given length."""
         frequencies = np.fft.rfftfreq(
-            input_data.size, d=2e-3 / input_data.size)
+            series_length, d=2e-3 / series_length)
 
-        if self.threshold > frequencies[-1]:
+        threshold = self.threshold
+        if threshold > frequencies[-1]:
             median_freq = round(len(frequencies) / 2)
-            self.threshold = frequencies[median_freq]
-        ind_of_main_freq = np.where(frequencies >= self.threshold)[0][:1]
-        ind_of_main_freq = tuple(ind_of_main_freq)
+            threshold = frequencies[median_freq]
+        main_freq = frequencies[np.argmax(frequencies >= threshold)]
 
         if self.approximation == 'exact':
-            fourier_coef[frequencies != frequencies[ind_of_main_freq]] = 0
-        else:
-            fourier_coef[frequencies > frequencies[ind_of_main_freq]] = 0
+            return frequencies == main_freq
+        return frequencies <= main_freq
+
+    def _decompose_signal(self, input_data):
+        fourier_coef = np.fft.rfft(input_data)
+        fourier_coef[~self._frequency_mask(input_data.size)] = 0
         return np.fft.irfft(fourier_coef).reshape(1, -1)
 
+    def _transform_batch(self, features: np.array):
+        """Applies the basis to all samples and channels at once along the last axis."""
+        if not isinstance(features, np.ndarray) or features.dtype == object or features.ndim not in (2, 3):
+            return None
+        if features.ndim == 2:
+            features = features[:, np.newaxis, :]
+        fourier_coef = np.fft.rfft(features, axis=-1)
+        fourier_coef *= self._frequency_mask(features.shape[-1])
+        return np.fft.irfft(fourier_coef, axis=-1)
+
     def _transform_one_sample(self, series: np.array):
         return self._get_basis(series)
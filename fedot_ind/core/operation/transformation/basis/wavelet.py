@@ -1,15 +1,77 @@
+from functools import lru_cache
+from math import floor
 from typing import Optional, Tuple
 
 import pywt
 from fedot.core.operations.operation_parameters import OperationParameters
 from pymonad.either import Either
 from pymonad.list import ListMonad
+from scipy.fft import next_fast_len
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.operation.transformation.basis.abstract_basis import BasisDecompositionImplementation
 from fedot_ind.core.repository.constanst_repository import CONTINUOUS_WAVELETS, DISCRETE_WAVELETS, WAVELET_SCALES
 
 
+@lru_cache(maxsize=64)
+def _discrete_wavelet(wavelet: str) -> pywt.Wavelet:
+    return pywt.Wavelet(wavelet)
+
+
+@lru_cache(maxsize=64)
+def _cwt_kernel_spectra(wavelet: str, scales: Tuple[float], series_length: int, precision: int = 12):
+    """Computes spectra of the scaled and integrated wavelet the same way as ``pywt.cwt`` does.
+
+    Spectra depend only on the wavelet, scales and length of the series, so they are cached between calls.
+
+    Returns:
+        tuple of spectra of shape ``(n_scales, n_freq)``, kernel sizes, length of the padded signal and flag
+        whether the wavelet is complex.
+
+    """
+    wavelet = pywt.ContinuousWavelet(wavelet)
+    int_psi, x = pywt.integrate_wavelet(wavelet, precision=precision)
+    int_psi = np.conj(int_psi) if wavelet.complex_cwt else int_psi
+    step = x[1] - x[0]
+    kernels = []
+    for scale in scales:
+        j = (np.arange(scale * (x[-1] - x[0]) + 1) / (scale * step)).astype(int)
+        kernels.append(int_psi[j[j < int_psi.size]][::-1])
+    kernel_sizes = tuple(kernel.size for kernel in kernels)
+    if min(kernel_sizes) < 2:
+        raise ValueError(f'Selected scale of {min(scales)} too small.')
+    fft_size = next_fast_len(series_length + max(kernel_sizes) - 1)
+    fft = np.fft.fft if wavelet.complex_cwt else np.fft.rfft
+    spectra = np.stack([fft(kernel, fft_size) for kernel in kernels])
+    spectra.setflags(write=False)
+    return spectra, kernel_sizes, fft_size, wavelet.complex_cwt
+
+
+def batch_cwt(data: np.array, scales: Tuple[float], wavelet: str) -> np.array:
+    """Continuous wavelet transform along the last axis of the array of any shape.
+
+    Unlike ``pywt.cwt`` which convolves every series in a loop, all series are convolved with cached
+    kernels in the frequency domain with one forward and one inverse FFT.
+
+    Returns:
+        array of shape ``(n_scales, *data.shape)``.
+
+    """
+    series_length = data.shape[-1]
+    spectra, kernel_sizes, fft_size, complex_cwt = _cwt_kernel_spectra(wavelet, tuple(scales), series_length)
+    spectra = spectra.reshape((len(scales),) + (1,) * (data.ndim - 1) + (-1,))
+    if complex_cwt:
+        conv = np.fft.ifft(np.fft.fft(data, fft_size)[np.newaxis] * spectra)
+    else:
+        conv = np.fft.irfft(np.fft.rfft(data, fft_size)[np.newaxis] * spectra, fft_size)
+    coefs = np.empty((len(scales),) + data.shape, dtype=conv.dtype)
+    for i, (scale, kernel_size) in enumerate(zip(scales, kernel_sizes)):
+        # derivative of the integrated wavelet response, centred to the length of the series
+        start = floor((kernel_size - 2) / 2)
+        coefs[i] = - np.sqrt(scale) * np.diff(conv[i, ..., start:start + series_length + 1], axis=-1)
+    return coefs
+
+
 class WaveletBasisImplementation(BasisDecompositionImplementation):
     """Wavelet basis
         Example:
@@ -20,6 +82,7 @@ class WaveletBasisImplementation(BasisDecompositionImplementation):
             basis_multi = bss._transform(ts)
             basis_1d = bss._transform(ts1)
     """
+    channel_fusable = True
 
     def __init__(self, params: Optional[OperationParameters] = None):
         super().__init__(params)
@@ -33,12 +96,16 @@ class WaveletBasisImplementation(BasisDecompositionImplementation):
     def __repr__(self):
         return 'WaveletBasisImplementation'
 
+    def _cwt_scales(self) -> list:
+        """Returns only the scales which are kept in the basis: the first ``n_components`` and the last one."""
+        return self.scales[:-1][:self.n_components] + self.scales[-1:]
+
     def _decompose_signal(self, input_data) -> Tuple[np.array, np.array]:
         if self.wavelet in self.discrete_wavelets:
-            high_freq, low_freq = pywt.dwt(input_data, self.wavelet, 'smooth')
+            high_freq, low_freq = pywt.dwt(input_data, _discrete_wavelet(self.wavelet), 'smooth')
         else:
             high_freq, low_freq = pywt.cwt(data=input_data,
-                                           scales=self.scales,
+                                           scales=self._cwt_scales(),
                                            wavelet=self.wavelet)
             low_freq = high_freq[-1, :]
             high_freq = np.delete(high_freq, (-1), axis=0)
@@ -56,6 +123,20 @@ class WaveletBasisImplementation(BasisDecompositionImplementation):
     def _transform_one_sample(self, series: np.array):
         return self._get_basis(series)
 
+    def _transform_batch(self, features: np.array):
+        """Decomposes all samples and channels at once along the last axis."""
+        if not isinstance(features, np.ndarray) or features.dtype == object or features.ndim not in (2, 3):
+            return None
+        if features.ndim == 2:
+            features = features[:, np.newaxis, :]
+        if self.wavelet in self.discrete_wavelets:
+            high_freq, low_freq = pywt.dwt(features, _discrete_wavelet(self.wavelet), 'smooth', axis=-1)
+            return np.concatenate([high_freq[..., :self.n_components], low_freq], axis=-1)
+        # coefficients of shape (n_scales, n_samples, n_channels, length) are grouped by channel
+        coefs = batch_cwt(features, self._cwt_scales(), self.wavelet)
+        coefs = np.moveaxis(coefs, 0, 2)
+        return coefs.reshape(features.shape[0], -1, features.shape[-1])
+
     def _get_1d_basis(self, data) -> np.array:
 
         def decompose(signal): return ListMonad(self._decompose_signal(signal))
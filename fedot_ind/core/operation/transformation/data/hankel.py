@@ -2,7 +2,7 @@ from typing import Union
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 import pandas as pd
-from fedot_ind.core.architecture.settings.computational import backend_scipy
+from fedot_ind.core.architecture.settings.computational import backend_scipy, to_default_dtype
 
 
 class HankelMatrix:
@@ -48,6 +48,7 @@ class HankelMatrix:
             self.__time_series = np.array(self.__time_series)
         else:
             self.__time_series = self.__time_series
+        self.__time_series = to_default_dtype(self.__time_series)
 
     def __get_1d_trajectory_matrix(self):
 
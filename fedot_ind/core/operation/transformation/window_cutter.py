@@ -1,18 +1,61 @@
+from typing import List, Optional, Tuple, Union
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+
+PADDING_POLICIES = ('drop', 'pad')
+LABEL_ALIGNMENTS = ('window', 'first', 'center', 'last')
+
+
 class WindowCutter:
     """
     Window cutter.
-        input format: dict with "data" and "labels" fields
+        input format: dict with "data" and "labels" fields (or list of such dicts)
         output: the same dict but with additional windows_list and labels for it
+
+    Windows of every key are returned as strided views of shape ``(n_windows, window_len, ...)`` over the
+    first axis of the source array, so cutting doesn't copy the data.
+
+    Args:
+        window_len: length of the window.
+        window_step: step between starts of two consecutive windows.
+        padding: ``'drop'`` to discard the incomplete tail of the series or ``'pad'`` to fill it with
+            ``fill_value`` so every point gets to some window.
+        fill_value: value used for padding of data keys.
+        label_key: key of the labels in the input dict. Labels are padded with their last value.
+        label_alignment: ``'window'`` to keep all labels of the window, ``'first'``, ``'center'`` or ``'last'``
+            to keep a single label at the given position of the window.
+
+    Example:
+        Cut recording into training windows with label of the last point::
+
+            cutter = WindowCutter(window_len=100, window_step=10, label_key='labels', label_alignment='last')
+            windows = cutter.cut({'data': series, 'labels': labels})
+            features, target = windows['data'], windows['labels']
+
     """
 
-    def __init__(self, window_len, window_step):
+    def __init__(self,
+                 window_len: int,
+                 window_step: int = 1,
+                 padding: str = 'drop',
+                 fill_value: float = np.nan,
+                 label_key: Optional[str] = None,
+                 label_alignment: str = 'window'):
         # super().__init__(name="Window Cutter", operation="window cutting")
+        if padding not in PADDING_POLICIES:
+            raise ValueError(f'Unknown padding policy {padding}, expected one of {PADDING_POLICIES}')
+        if label_alignment not in LABEL_ALIGNMENTS:
+            raise ValueError(f'Unknown label alignment {label_alignment}, expected one of {LABEL_ALIGNMENTS}')
         self.input_dict = None
         self.window_len = window_len
         self.window_step = window_step
+        self.padding = padding
+        self.fill_value = fill_value
+        self.label_key = label_key
+        self.label_alignment = label_alignment
         self.output_window_list = []
 
-    def load_data(self, input_dict: dict) -> None:
+    def load_data(self, input_dict: Union[dict, List[dict]]) -> None:
         self.input_dict = input_dict
 
     def get_windows(self) -> list:
@@ -23,18 +66,75 @@ class WindowCutter:
         Cut data to windows
         :return: none
         """
-        self.output_window_list = self._cut_ts_to_windows(self.input_dict)
-
-    def _cut_ts_to_windows(self, ts: dict) -> list:
-        start_idx = 0
-        end_idx = len(ts[list(ts.keys())[0]]) - self.window_len
-        temp_windows_list = []
-        for i in range(start_idx, end_idx, self.window_step):
-            temp_window_dict = {}
-            for key in ts.keys():
-                temp_window = []
-                for j in range(i, i + self.window_len):
-                    temp_window.append(ts[key][j])
-                temp_window_dict[key] = temp_window
-        temp_windows_list.append(temp_window_dict)
-        return temp_windows_list
+        if isinstance(self.input_dict, dict):
+            windows = self.cut(self.input_dict)
+        else:
+            windows, _ = self.cut_batch(self.input_dict)
+        n_windows = len(next(iter(windows.values()))) if windows else 0
+        self.output_window_list = [{key: value[i] for key, value in windows.items()} for i in range(n_windows)]
+
+    def cut(self, ts: dict) -> dict:
+        """Cuts every series of the dict to windows.
+
+        Args:
+            ts: dict of arrays of the same length along the first axis.
+
+        Returns:
+            dict with the same keys and windows of shape ``(n_windows, window_len, ...)`` as values.
+
+        """
+        return self._cut_ts_to_windows(ts)
+
+    def cut_batch(self, ts_list: List[dict]) -> Tuple[dict, np.ndarray]:
+        """Cuts many dicts to windows and stacks the windows of the same key together.
+
+        Returns:
+            tuple of dict with stacked windows and array with index of the source dict of every window.
+
+        """
+        cut_list = [self._cut_ts_to_windows(ts) for ts in ts_list]
+        if not cut_list:
+            return {}, np.empty(0, dtype=int)
+        windows = {key: np.concatenate([cut_dict[key] for cut_dict in cut_list]) for key in cut_list[0]}
+        n_windows = [len(next(iter(cut_dict.values()))) if cut_dict else 0 for cut_dict in cut_list]
+        groups = np.repeat(np.arange(len(cut_list)), n_windows)
+        return windows, groups
+
+    def _n_windows(self, length: int) -> int:
+        if self.padding == 'pad':
+            return max(int(np.ceil((length - self.window_len) / self.window_step)), 0) + 1 if length else 0
+        return max((length - self.window_len) // self.window_step + 1, 0)
+
+    def _cut_one_series(self, series: np.ndarray, n_windows: int, fill_value) -> np.ndarray:
+        required_len = (n_windows - 1) * self.window_step + self.window_len if n_windows else 0
+        if required_len > series.shape[0]:
+            pad_width = [(0, required_len - series.shape[0])] + [(0, 0)] * (series.ndim - 1)
+            if fill_value is None:
+                series = np.pad(series, pad_width, mode='edge')
+            else:
+                series = series.astype(np.result_type(series.dtype, np.min_scalar_type(fill_value)), copy=False)
+                series = np.pad(series, pad_width, mode='constant', constant_values=fill_value)
+        if n_windows == 0:
+            return np.empty((0, self.window_len) + series.shape[1:], dtype=series.dtype)
+        windows = np.lib.stride_tricks.sliding_window_view(series, self.window_len, axis=0)
+        # window axis of the view is the last one, it's moved next to the windows axis
+        return np.moveaxis(windows[::self.window_step][:n_windows], -1, 1)
+
+    def _align_labels(self, windows: np.ndarray) -> np.ndarray:
+        position = {'first': 0, 'center': self.window_len // 2, 'last': -1}.get(self.label_alignment)
+        return windows if position is None else windows[:, position]
+
+    def _cut_ts_to_windows(self, ts: dict) -> dict:
+        ts = {key: np.asarray(value) for key, value in ts.items()}
+        lengths = {value.shape[0] for value in ts.values()}
+        if len(lengths) > 1:
+            raise ValueError(f'All series must have the same length, got lengths {sorted(lengths)}')
+        n_windows = self._n_windows(lengths.pop()) if ts else 0
+
+        windows = {}
+        for key, series in ts.items():
+            if key == self.label_key:
+                windows[key] = self._align_labels(self._cut_one_series(series, n_windows, fill_value=None))
+            else:
+                windows[key] = self._cut_one_series(series, n_windows, fill_value=self.fill_value)
+        return windows
@@ -42,6 +42,11 @@ class WindowSizeSelector:
             ws_selector = WindowSizeSelector(method='hac')
             window_size = ws_selector.apply(time_series=ts, average='median')
 
+        To get window size of each series of equal length dataset in one vectorized pass::
+            ts = np.random.rand(1000, 10)
+            ws_selector = WindowSizeSelector(method='dff')
+            window_sizes = ws_selector.apply_batch(time_series=ts, average=None)
+
 
     Reference:
         (c) "Windows Size Selection in Unsupervised Time Series Analytics: A Review and Benchmark. Arik Ermshaus,
@@ -57,6 +62,9 @@ class WindowSizeSelector:
                              'dff': self.dominant_fourier_frequency,
                              'mwf': self.mwf,
                              'sss': self.summary_statistics_subsequence}
+        self.dict_batch_methods = {'hac': self.batch_autocorrelation,
+                                   'dff': self.batch_dominant_fourier_frequency,
+                                   'mwf': self.batch_mwf}
         self.wss_algorithm = method
         self.window_range = window_range
         self.window_max = None
@@ -81,9 +89,52 @@ class WindowSizeSelector:
         if isinstance(time_series, pd.DataFrame):
             time_series = time_series.values
 
+        if self.wss_algorithm in self.dict_batch_methods and self._is_batch(time_series):
+            return self.apply_batch(time_series, average)
         window_list = [self.get_window_size(ts) for ts in time_series]
         return round(methods[average](window_list))
 
+    @staticmethod
+    def _is_batch(time_series) -> bool:
+        time_series = np.asarray(time_series)
+        return time_series.dtype != object and (time_series.ndim == 2 or
+                                                time_series.ndim == 3 and time_series.shape[1] == 1)
+
+    def apply_batch(self, time_series: Union[pd.DataFrame, np.array], average: str = 'median') -> Union[int, np.array]:
+        """Method to select window size for the whole dataset of equal length time series at once. Spectra,
+        autocorrelations and moving averages are computed along the series axis for all samples together.
+
+        Args:
+            time_series: array of shape ``(n_samples, series_length)`` or ``(n_samples, 1, series_length)``
+            average: 'mean' or 'median' to get dataset-level window size, None to get window size of each series
+
+        Returns:
+            window size in % of series length, single value or array of shape ``(n_samples,)``
+
+        """
+        methods = {'mean': np.mean, 'median': np.median}
+        assert average is None or average in methods.keys(
+        ), 'Hyperparameters error: `average` should be mean, median or None'
+        assert self.wss_algorithm in self.dict_batch_methods, \
+            f'Batched selection is not implemented for {self.wss_algorithm}'
+
+        if isinstance(time_series, pd.DataFrame):
+            time_series = time_series.values
+        time_series = np.asarray(time_series, dtype=float)
+        if time_series.ndim == 3:
+            time_series = time_series[:, 0, :]
+        elif time_series.ndim == 1:
+            time_series = time_series[None, :]
+        self.length_ts = time_series.shape[1]
+        self.window_max = int(round(self.length_ts * self.window_range[1] / 100))
+        self.window_min = int(round(self.length_ts * self.window_range[0] / 100))
+
+        window_sizes = self.dict_batch_methods[self.wss_algorithm](time_series)
+        window_sizes = np.round(window_sizes * 100 / self.length_ts).astype(int)  # in %
+        if average is None:
+            return window_sizes
+        return round(methods[average](window_sizes))
+
     def get_window_size(self, time_series: np.array) -> int:
         """Main function to run WSS class over selected time series
 
@@ -130,6 +181,21 @@ class WindowSizeSelector:
 
         return window_sizes[np.argmax(magnitudes)]
 
+    def batch_dominant_fourier_frequency(self, time_series: np.array) -> np.array:
+        """Vectorized version of :meth:`dominant_fourier_frequency` for array of shape
+        ``(n_samples, series_length)``. If there is no frequency in window range, ``window_min`` is returned.
+        """
+        length = time_series.shape[1]
+        # positive frequencies of the full spectrum, Nyquist frequency is treated as negative one
+        frequency_idx = np.arange(1, (length - 1) // 2 + 1)
+        magnitudes = np.abs(np.fft.rfft(time_series, axis=1)[:, frequency_idx])
+        window_sizes = (length / frequency_idx).astype(int)
+        in_range = (window_sizes >= self.window_min) & (window_sizes < self.window_max)
+        magnitudes = np.where(in_range & (magnitudes > 0), magnitudes, -np.inf)
+        dominant = np.argmax(magnitudes, axis=1)
+        return np.where(np.isfinite(magnitudes[np.arange(len(dominant)), dominant]),
+                        window_sizes[dominant], self.window_min)
+
     def autocorrelation(self, time_series: np.array) -> int:
         """Method to find the highest autocorrelation in time series and return appropriate window size. It is based on
         the assumption that the lag of highest autocorrelation coefficient corresponds to the window size that best
@@ -148,6 +214,26 @@ class WindowSizeSelector:
             return self.window_min
         return peaks[np.argmax(corrs)]
 
+    def batch_autocorrelation(self, time_series: np.array) -> np.array:
+        """Vectorized version of :meth:`autocorrelation` for array of shape ``(n_samples, series_length)``.
+        Autocorrelation of all series is obtained with one FFT along the series axis.
+        """
+        length = time_series.shape[1]
+        n_lags = int(length / 2)
+        centered = time_series - time_series.mean(axis=1, keepdims=True)
+        spectrum = np.fft.rfft(centered, n=2 * length, axis=1)
+        acov = np.fft.irfft(spectrum * np.conj(spectrum), n=2 * length, axis=1)[:, :n_lags + 1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            acf_values = acov / acov[:, :1]
+
+        lags = np.arange(1, n_lags)
+        is_peak = (acf_values[:, 1:-1] > acf_values[:, :-2]) & (acf_values[:, 1:-1] > acf_values[:, 2:])
+        is_peak &= (lags >= self.window_min) & (lags < self.window_max)
+        corrs = np.where(is_peak, acf_values[:, 1:-1], -np.inf)
+        best = np.argmax(corrs, axis=1)
+        # if there is no peaks in range (window_min, window_max) return window_min
+        return np.where(is_peak.any(axis=1), lags[best], self.window_min)
+
     def mwf(self, time_series: np.array) -> int:
         """ Method to find the window size that minimizes the moving average residual. It is based on the assumption
         that the window size that best captures the periodicity of the time series is the one that minimizes the
@@ -182,6 +268,41 @@ class WindowSizeSelector:
 
         return int(w)
 
+    def batch_mwf(self, time_series: np.array, chunk_size: int = 10 ** 7) -> np.array:
+        """Vectorized version of :meth:`mwf` for array of shape ``(n_samples, series_length)``. Moving averages
+        of all candidate windows are obtained from one cumulative sum, samples are processed by chunks to bound
+        memory by ``chunk_size`` elements.
+        """
+        window_sizes = np.arange(self.window_min, self.window_max)
+        if window_sizes.shape[0] == 0:
+            return np.full(time_series.shape[0], self.window_min)
+        n_points = time_series.shape[1] - window_sizes[-1] + 1
+        end_idx = window_sizes[:, None] + np.arange(n_points)[None, :]
+        start_idx = np.broadcast_to(np.arange(n_points), end_idx.shape)
+
+        cumsum = np.zeros((time_series.shape[0], time_series.shape[1] + 1))
+        np.cumsum(time_series, axis=1, out=cumsum[:, 1:])
+        step = max(1, chunk_size // end_idx.size)
+        residuals = []
+        for start in range(0, time_series.shape[0], step):
+            chunk = cumsum[start:start + step]
+            moving_avg = (chunk[:, end_idx] - chunk[:, start_idx]) / window_sizes[:, None]
+            residual = np.abs(moving_avg - moving_avg.mean(axis=2, keepdims=True)).sum(axis=2)
+            residuals.append(np.log(residual))
+        residuals = np.concatenate(residuals)
+
+        local_min = np.diff(np.sign(np.diff(residuals, axis=1)), axis=1) > 0
+        selected = np.full(time_series.shape[0], self.window_min)
+        for sample_idx, minimums in enumerate(local_min):
+            b = minimums.nonzero()[0] + 1
+            if len(b) == 0:
+                continue
+            if len(b) < 3:
+                selected[sample_idx] = window_sizes[b[0]]
+            else:
+                selected[sample_idx] = int(np.mean(window_sizes[b[:3]] / np.arange(1, 4)))
+        return selected
+
     def movmean(self, ts, w):
         """Fast moving average function"""
         moving_avg = np.cumsum(ts, dtype=float)
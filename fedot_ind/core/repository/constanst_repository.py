@@ -1,4 +1,5 @@
 import math
+import sys
 from enum import Enum
 from multiprocessing import cpu_count
 
@@ -8,19 +9,11 @@ from fedot.core.pipelines.pipeline_builder import PipelineBuilder
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.metrics_repository import ClassificationMetricsEnum, RegressionMetricsEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
-from torch import nn
 
 from fedot_ind.core.metrics.metrics_implementation import calculate_classification_metric, calculate_regression_metric
-from fedot_ind.core.models.nn.network_modules.losses import CenterLoss, CenterPlusLoss, ExpWeightedLoss, FocalLoss, \
-    HuberLoss, LogCoshLoss, MaskedLossWrapper, RMSELoss, SMAPELoss, TweedieLoss
 from fedot_ind.core.models.quantile.stat_features import autocorrelation, ben_corr, crest_factor, energy, \
     hjorth_complexity, hjorth_mobility, hurst_exponent, interquartile_range, kurtosis, mean_ema, mean_moving_median, \
     mean_ptp_distance, n_peaks, pfd, ptp_amp, q25, q5, q75, q95, shannon_entropy, skewness, slope, zero_crossing_rate
-from fedot_ind.core.models.topological.topofeatures import *
-from fedot_ind.core.models.topological.topofeatures import AverageHoleLifetimeFeature, \
-    AveragePersistenceLandscapeFeature, BettiNumbersSumFeature, HolesNumberFeature, MaxHoleLifeTimeFeature, \
-    PersistenceDiagramsExtractor, PersistenceEntropyFeature, RadiusAtMaxBNFeature, RelevantHolesNumber, \
-    SimultaneousAliveHolesFeature, SumHoleLifetimeFeature
 from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
 
 
@@ -84,22 +77,6 @@ class FeatureConstant(Enum):
         'petrosian_fractal_dimension_': pfd
     }
 
-    PERSISTENCE_DIAGRAM_FEATURES = {'HolesNumberFeature': HolesNumberFeature(),
-                                    'MaxHoleLifeTimeFeature': MaxHoleLifeTimeFeature(),
-                                    'RelevantHolesNumber': RelevantHolesNumber(),
-                                    'AverageHoleLifetimeFeature': AverageHoleLifetimeFeature(),
-                                    'SumHoleLifetimeFeature': SumHoleLifetimeFeature(),
-                                    'PersistenceEntropyFeature': PersistenceEntropyFeature(),
-                                    'SimultaneousAliveHolesFeature': SimultaneousAliveHolesFeature(),
-                                    'AveragePersistenceLandscapeFeature': AveragePersistenceLandscapeFeature(),
-                                    'BettiNumbersSumFeature': BettiNumbersSumFeature(),
-                                    'RadiusAtMaxBNFeature': RadiusAtMaxBNFeature()}
-
-    PERSISTENCE_DIAGRAM_EXTRACTOR = PersistenceDiagramsExtractor(takens_embedding_dim=1,
-                                                                 takens_embedding_delay=2,
-                                                                 homology_dimensions=(
-                                                                     0, 1),
-                                                                 parallel=False)
     DISCRETE_WAVELETS = pywt.wavelist(kind='discrete')
     CONTINUOUS_WAVELETS = pywt.wavelist(kind='continuous')
     WAVELET_SCALES = [2, 4, 10, 20]
@@ -202,22 +179,6 @@ class ModelCompressionConstant(Enum):
     }
 
 
-class TorchLossesConstant(Enum):
-    CROSS_ENTROPY = nn.CrossEntropyLoss
-    MULTI_CLASS_CROSS_ENTROPY = nn.BCEWithLogitsLoss
-    MSE = nn.MSELoss
-    RMSE = RMSELoss()
-    SMAPE = SMAPELoss()
-    TWEEDIE_LOSS = TweedieLoss()
-    FOCAL_LOSS = FocalLoss()
-    CENTER_PLUS_LOSS = CenterPlusLoss
-    CENTER_LOSS = CenterLoss
-    MASK_LOSS = MaskedLossWrapper
-    LOG_COSH_LOSS = LogCoshLoss()
-    HUBER_LOSS = HuberLoss()
-    EXPONENTIAL_WEIGHTED_LOSS = ExpWeightedLoss
-
-
 class BenchmarkDatasets(Enum):
     MULTI_REG_BENCH = [
         "AppliancesEnergy",
@@ -387,8 +348,6 @@ class BenchmarkDatasets(Enum):
 
 STAT_METHODS = FeatureConstant.STAT_METHODS.value
 STAT_METHODS_GLOBAL = FeatureConstant.STAT_METHODS_GLOBAL.value
-PERSISTENCE_DIAGRAM_FEATURES = FeatureConstant.PERSISTENCE_DIAGRAM_FEATURES.value
-PERSISTENCE_DIAGRAM_EXTRACTOR = FeatureConstant.PERSISTENCE_DIAGRAM_EXTRACTOR.value
 DISCRETE_WAVELETS = FeatureConstant.DISCRETE_WAVELETS.value
 CONTINUOUS_WAVELETS = FeatureConstant.CONTINUOUS_WAVELETS.value
 WAVELET_SCALES = FeatureConstant.WAVELET_SCALES.value
@@ -423,20 +382,82 @@ HOER_LOSS = ModelCompressionConstant.HOER_LOSS.value
 ORTOGONAL_LOSS = ModelCompressionConstant.ORTOGONAL_LOSS.value
 MODELS_FROM_LENGTH = ModelCompressionConstant.MODELS_FROM_LENGTH.value
 
-CROSS_ENTROPY = TorchLossesConstant.CROSS_ENTROPY.value
-MULTI_CLASS_CROSS_ENTROPY = TorchLossesConstant.MULTI_CLASS_CROSS_ENTROPY.value
-MSE = TorchLossesConstant.MSE.value
-RMSE = TorchLossesConstant.RMSE.value
-SMAPE = TorchLossesConstant.SMAPE.value
-TWEEDIE_LOSS = TorchLossesConstant.TWEEDIE_LOSS.value
-FOCAL_LOSS = TorchLossesConstant.FOCAL_LOSS.value
-CENTER_PLUS_LOSS = TorchLossesConstant.CENTER_PLUS_LOSS.value
-CENTER_LOSS = TorchLossesConstant.CENTER_LOSS.value
-MASK_LOSS = TorchLossesConstant.MASK_LOSS.value
-LOG_COSH_LOSS = TorchLossesConstant.LOG_COSH_LOSS.value
-HUBER_LOSS = TorchLossesConstant.HUBER_LOSS.value
-EXPONENTIAL_WEIGHTED_LOSS = TorchLossesConstant.EXPONENTIAL_WEIGHTED_LOSS.value
-
 MULTI_REG_BENCH = BenchmarkDatasets.MULTI_REG_BENCH.value
 UNI_CLF_BENCH = BenchmarkDatasets.UNI_CLF_BENCH.value
 MULTI_CLF_BENCH = BenchmarkDatasets.MULTI_CLF_BENCH.value
+
+
+def _torch_losses_constant():
+    from torch import nn
+
+    from fedot_ind.core.metrics.loss.soft_dtw import SoftDTW
+    from fedot_ind.core.models.nn.network_modules.losses import CenterLoss, CenterPlusLoss, ExpWeightedLoss, \
+        FocalLoss, HuberLoss, LogCoshLoss, MaskedLossWrapper, RMSELoss, SMAPELoss, TweedieLoss
+
+    class TorchLossesConstant(Enum):
+        CROSS_ENTROPY = nn.CrossEntropyLoss
+        MULTI_CLASS_CROSS_ENTROPY = nn.BCEWithLogitsLoss
+        MSE = nn.MSELoss
+        RMSE = RMSELoss()
+        SMAPE = SMAPELoss()
+        TWEEDIE_LOSS = TweedieLoss()
+        FOCAL_LOSS = FocalLoss()
+        CENTER_PLUS_LOSS = CenterPlusLoss
+        CENTER_LOSS = CenterLoss
+        MASK_LOSS = MaskedLossWrapper
+        LOG_COSH_LOSS = LogCoshLoss()
+        HUBER_LOSS = HuberLoss()
+        EXPONENTIAL_WEIGHTED_LOSS = ExpWeightedLoss
+        SOFT_DTW_LOSS = SoftDTW
+
+    return TorchLossesConstant
+
+
+def _persistence_diagram_features():
+    from fedot_ind.core.models.topological.topofeatures import AverageHoleLifetimeFeature, \
+        AveragePersistenceLandscapeFeature, BettiNumbersSumFeature, HolesNumberFeature, MaxHoleLifeTimeFeature, \
+        PersistenceEntropyFeature, RadiusAtMaxBNFeature, RelevantHolesNumber, SimultaneousAliveHolesFeature, \
+        SumHoleLifetimeFeature
+
+    return {'HolesNumberFeature': HolesNumberFeature(),
+            'MaxHoleLifeTimeFeature': MaxHoleLifeTimeFeature(),
+            'RelevantHolesNumber': RelevantHolesNumber(),
+            'AverageHoleLifetimeFeature': AverageHoleLifetimeFeature(),
+            'SumHoleLifetimeFeature': SumHoleLifetimeFeature(),
+            'PersistenceEntropyFeature': PersistenceEntropyFeature(),
+            'SimultaneousAliveHolesFeature': SimultaneousAliveHolesFeature(),
+            'AveragePersistenceLandscapeFeature': AveragePersistenceLandscapeFeature(),
+            'BettiNumbersSumFeature': BettiNumbersSumFeature(),
+            'RadiusAtMaxBNFeature': RadiusAtMaxBNFeature()}
+
+
+def _persistence_diagram_extractor():
+    from fedot_ind.core.models.topological.topofeatures import PersistenceDiagramsExtractor
+
+    return PersistenceDiagramsExtractor(takens_embedding_dim=1,
+                                        takens_embedding_delay=2,
+                                        homology_dimensions=(0, 1),
+                                        parallel=False)
+
+
+# constants which require torch or giotto-tda are created on the first access to keep import of the module cheap
+_LAZY_CONSTANTS = {
+    'TorchLossesConstant': _torch_losses_constant,
+    'PERSISTENCE_DIAGRAM_FEATURES': _persistence_diagram_features,
+    'PERSISTENCE_DIAGRAM_EXTRACTOR': _persistence_diagram_extractor
+}
+_TORCH_LOSSES = ('CROSS_ENTROPY', 'MULTI_CLASS_CROSS_ENTROPY', 'MSE', 'RMSE', 'SMAPE', 'TWEEDIE_LOSS', 'FOCAL_LOSS',
+                 'CENTER_PLUS_LOSS', 'CENTER_LOSS', 'MASK_LOSS', 'LOG_COSH_LOSS', 'HUBER_LOSS',
+                 'EXPONENTIAL_WEIGHTED_LOSS', 'SOFT_DTW_LOSS')
+
+
+def __getattr__(name: str):
+    if name in _TORCH_LOSSES:
+        value = getattr(sys.modules[__name__].TorchLossesConstant, name).value
+    elif name in _LAZY_CONSTANTS:
+        value = _LAZY_CONSTANTS[name]()
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    # cached in the module namespace, so the attribute is resolved without this hook next time
+    globals()[name] = value
+    return value
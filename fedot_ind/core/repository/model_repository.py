@@ -1,194 +1,205 @@
+import importlib
+from collections.abc import Mapping
 from enum import Enum
 from itertools import chain
+from typing import Dict
+
+_FEDOT_DATA_OPERATIONS = 'fedot.core.operations.evaluation.operation_implementations.data_operations'
+_FEDOT_MODELS = 'fedot.core.operations.evaluation.operation_implementations.models'
+_INDUSTRIAL_NN = 'fedot_ind.core.models.nn.network_impl'
+_INDUSTRIAL_BASIS = 'fedot_ind.core.operation.transformation.basis'
+
+
+class LazyOperationRegistry(Mapping):
+    """Mapping of operation names to implementation classes which imports the module of an implementation
+    only when the operation is requested for the first time.
+
+    Keys, membership checks and length don't import anything, so the registry can be used to build search
+    spaces without loading torch, giotto-tda and other heavy dependencies of unused operations.
+
+    Args:
+        operation_paths: dict of operation names and dotted paths to implementation classes.
+
+    Examples:
+        >>> registry = LazyOperationRegistry({'logit': 'sklearn.linear_model.LogisticRegression'})
+        >>> 'logit' in registry
+        True
+        >>> model = registry['logit']()
+
+    """
+
+    def __init__(self, operation_paths: Dict[str, str]):
+        self.operation_paths = dict(operation_paths)
+        self._loaded = {}
+
+    def __getitem__(self, operation_type: str):
+        if operation_type not in self._loaded:
+            module_path, class_name = self.operation_paths[operation_type].rsplit('.', 1)
+            self._loaded[operation_type] = getattr(importlib.import_module(module_path), class_name)
+        return self._loaded[operation_type]
+
+    def __contains__(self, operation_type) -> bool:
+        return operation_type in self.operation_paths
+
+    def __iter__(self):
+        return iter(self.operation_paths)
+
+    def __len__(self) -> int:
+        return len(self.operation_paths)
+
+    def __eq__(self, other) -> bool:
+        # comparison by paths keeps Enum creation from importing the implementations
+        if isinstance(other, LazyOperationRegistry):
+            return self.operation_paths == other.operation_paths
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.operation_paths})'
 
-from fedot.core.operations.evaluation.operation_implementations.data_operations.categorical_encoders import \
-    LabelEncodingImplementation, OneHotEncodingImplementation
-from fedot.core.operations.evaluation.operation_implementations.data_operations.decompose import \
-    DecomposerClassImplementation
-from fedot.core.operations.evaluation.operation_implementations.data_operations.sklearn_filters import \
-    IsolationForestClassImplementation, IsolationForestRegImplementation
-from fedot.core.operations.evaluation.operation_implementations.data_operations.sklearn_imbalanced_class import \
-    ResampleImplementation
-from fedot.core.operations.evaluation.operation_implementations.data_operations.sklearn_selectors import \
-    LinearClassFSImplementation, NonLinearClassFSImplementation
-from fedot.core.operations.evaluation.operation_implementations.data_operations.sklearn_transformations import \
-    *
-from fedot.core.operations.evaluation.operation_implementations. \
-    data_operations.topological.fast_topological_extractor import \
-    FastTopologicalFeaturesImplementation
-from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import \
-    ExogDataTransformationImplementation, GaussianFilterImplementation, LaggedTransformationImplementation, \
-    SparseLaggedTransformationImplementation, TsSmoothingImplementation
-from fedot.core.operations.evaluation.operation_implementations.models.knn import FedotKnnClassImplementation, \
-    FedotKnnRegImplementation
-from fedot.core.operations.evaluation.operation_implementations.models.ts_implementations.arima import \
-    STLForecastARIMAImplementation
-from fedot.core.operations.evaluation.operation_implementations.models.ts_implementations.cgru import \
-    CGRUImplementation
-from fedot.core.operations.evaluation.operation_implementations.models.ts_implementations.naive import \
-    RepeatLastValueImplementation
-from fedot.core.operations.evaluation.operation_implementations.models.ts_implementations.statsmodels import \
-    AutoRegImplementation, ExpSmoothingImplementation, GLMImplementation
-from sklearn.ensemble import AdaBoostRegressor, ExtraTreesRegressor, GradientBoostingRegressor, RandomForestClassifier, \
-    RandomForestRegressor
-from sklearn.linear_model import (
-    Lasso as SklearnLassoReg,
-    LinearRegression as SklearnLinReg,
-    LogisticRegression as SklearnLogReg,
-    Ridge as SklearnRidgeReg,
-    SGDRegressor as SklearnSGD
-)
-from sklearn.naive_bayes import BernoulliNB as SklearnBernoulliNB, MultinomialNB as SklearnMultinomialNB
-from sklearn.neural_network import MLPClassifier
-from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
-from xgboost import XGBClassifier, XGBRegressor
-
-from fedot_ind.core.models.nn.network_impl.explainable_convolution_model import XCModel
-from fedot_ind.core.models.nn.network_impl.inception import InceptionTimeModel
-from fedot_ind.core.models.nn.network_impl.mini_rocket import MiniRocketExtractor
-from fedot_ind.core.models.nn.network_impl.omni_scale import OmniScaleModel
-from fedot_ind.core.models.nn.network_impl.resnet import ResNetModel
-from fedot_ind.core.models.nn.network_impl.tst import TSTModel
-from fedot_ind.core.models.quantile.quantile_extractor import QuantileExtractor
-from fedot_ind.core.models.recurrence.reccurence_extractor import RecurrenceExtractor
-from fedot_ind.core.models.topological.topological_extractor import TopologicalExtractor
-from fedot_ind.core.models.ts_forecasting.ssa_forecaster import SSAForecasterImplementation
-from fedot_ind.core.operation.dummy.dummy_operation import DummyOperation
-from fedot_ind.core.operation.filtration.feature_filtration import FeatureFilter
-from fedot_ind.core.operation.transformation.basis.eigen_basis import EigenBasisImplementation
-from fedot_ind.core.operation.transformation.basis.fourier import FourierBasisImplementation
-from fedot_ind.core.operation.transformation.basis.wavelet import WaveletBasisImplementation
 
 TEMPORARY_EXCLUDED = {
-    'INDUSTRIAL_CLF_PREPROC_MODEL': {
-        'rfe_lin_class': LinearClassFSImplementation,
-        'rfe_non_lin_class': NonLinearClassFSImplementation,
-    },
-    'FEDOT_PREPROC_MODEL': {'pca': PCAImplementation,
-                            'fast_ica': FastICAImplementation,
-                            'poly_features': PolyFeaturesImplementation,
-                            'topological_extractor': TopologicalExtractor,
-                            'exog_ts': ExogDataTransformationImplementation,
-                            # categorical encoding
-                            'one_hot_encoding': OneHotEncodingImplementation,
-                            'label_encoding': LabelEncodingImplementation
-                            },
-    'INDUSTRIAL_PREPROC_MODEL': {'cat_features': DummyOperation,
-                                 'dimension_reduction': FeatureFilter,
-                                 # 'signal_extractor': SignalExtractor,
-                                 'recurrence_extractor': RecurrenceExtractor,
-                                 # isolation_forest forest
-                                 'isolation_forest_class': IsolationForestClassImplementation,
-                                 'isolation_forest_reg': IsolationForestRegImplementation,
-                                 },
-    'SKLEARN_REG_MODELS': {
-        'gbr': GradientBoostingRegressor,
-        'rfr': RandomForestRegressor,
-        'adareg': AdaBoostRegressor,
-        'linear': SklearnLinReg
-    },
-    'SKLEARN_CLF_MODELS': {'bernb': SklearnBernoulliNB,
-                           'multinb': SklearnMultinomialNB,
-                           'knn': FedotKnnClassImplementation
-                           },
-    'NEURAL_MODELS': {'resnet_model': ResNetModel,
-                      # transformer models
-                      'tst_model': TSTModel,
-                      # explainable models
-                      'xcm_model': XCModel
-                      }
+    'INDUSTRIAL_CLF_PREPROC_MODEL': LazyOperationRegistry({
+        'rfe_lin_class': f'{_FEDOT_DATA_OPERATIONS}.sklearn_selectors.LinearClassFSImplementation',
+        'rfe_non_lin_class': f'{_FEDOT_DATA_OPERATIONS}.sklearn_selectors.NonLinearClassFSImplementation',
+    }),
+    'FEDOT_PREPROC_MODEL': LazyOperationRegistry({
+        'pca': f'{_FEDOT_DATA_OPERATIONS}.sklearn_transformations.PCAImplementation',
+        'fast_ica': f'{_FEDOT_DATA_OPERATIONS}.sklearn_transformations.FastICAImplementation',
+        'poly_features': f'{_FEDOT_DATA_OPERATIONS}.sklearn_transformations.PolyFeaturesImplementation',
+        'topological_extractor': 'fedot_ind.core.models.topological.topological_extractor.TopologicalExtractor',
+        'exog_ts': f'{_FEDOT_DATA_OPERATIONS}.ts_transformations.ExogDataTransformationImplementation',
+        # categorical encoding
+        'one_hot_encoding': f'{_FEDOT_DATA_OPERATIONS}.categorical_encoders.OneHotEncodingImplementation',
+        'label_encoding': f'{_FEDOT_DATA_OPERATIONS}.categorical_encoders.LabelEncodingImplementation'
+    }),
+    'INDUSTRIAL_PREPROC_MODEL': LazyOperationRegistry({
+        'cat_features': 'fedot_ind.core.operation.dummy.dummy_operation.DummyOperation',
+        'dimension_reduction': 'fedot_ind.core.operation.filtration.feature_filtration.FeatureFilter',
+        # 'signal_extractor': SignalExtractor,
+        'recurrence_extractor': 'fedot_ind.core.models.recurrence.reccurence_extractor.RecurrenceExtractor',
+        # isolation_forest forest
+        'isolation_forest_class': f'{_FEDOT_DATA_OPERATIONS}.sklearn_filters.IsolationForestClassImplementation',
+        'isolation_forest_reg': f'{_FEDOT_DATA_OPERATIONS}.sklearn_filters.IsolationForestRegImplementation',
+    }),
+    'SKLEARN_REG_MODELS': LazyOperationRegistry({
+        'gbr': 'sklearn.ensemble.GradientBoostingRegressor',
+        'rfr': 'sklearn.ensemble.RandomForestRegressor',
+        'adareg': 'sklearn.ensemble.AdaBoostRegressor',
+        'linear': 'sklearn.linear_model.LinearRegression'
+    }),
+    'SKLEARN_CLF_MODELS': LazyOperationRegistry({
+        'bernb': 'sklearn.naive_bayes.BernoulliNB',
+        'multinb': 'sklearn.naive_bayes.MultinomialNB',
+        'knn': f'{_FEDOT_MODELS}.knn.FedotKnnClassImplementation'
+    }),
+    'NEURAL_MODELS': LazyOperationRegistry({
+        'resnet_model': f'{_INDUSTRIAL_NN}.resnet.ResNetModel',
+        # transformer models
+        'tst_model': f'{_INDUSTRIAL_NN}.tst.TSTModel',
+        # explainable models
+        'xcm_model': f'{_INDUSTRIAL_NN}.explainable_convolution_model.XCModel'
+    })
 }
 
 
 class AtomizedModel(Enum):
-    INDUSTRIAL_CLF_PREPROC_MODEL = {
+    """Operations of the industrial search space grouped by kind.
+
+    Every value is a :class:`LazyOperationRegistry`, so the implementation of an operation is imported
+    only when the operation is instantiated for the first time.
+
+    """
+    INDUSTRIAL_CLF_PREPROC_MODEL = LazyOperationRegistry({
         # for decomposed tasks
-        'class_decompose': DecomposerClassImplementation,
+        'class_decompose': f'{_FEDOT_DATA_OPERATIONS}.decompose.DecomposerClassImplementation',
         # for imbalanced data
-        'resample': ResampleImplementation,
+        'resample': f'{_FEDOT_DATA_OPERATIONS}.sklearn_imbalanced_class.ResampleImplementation',
 
-    }
-    SKLEARN_CLF_MODELS = {
+    })
+    SKLEARN_CLF_MODELS = LazyOperationRegistry({
         # boosting models (bid datasets)
-        'xgboost': XGBClassifier,
+        'xgboost': 'xgboost.XGBClassifier',
         # solo linear models
-        'logit': SklearnLogReg,
+        'logit': 'sklearn.linear_model.LogisticRegression',
         # solo tree models
-        'dt': DecisionTreeClassifier,
+        'dt': 'sklearn.tree.DecisionTreeClassifier',
         # ensemble tree models
-        'rf': RandomForestClassifier,
+        'rf': 'sklearn.ensemble.RandomForestClassifier',
         # solo nn models
-        'mlp': MLPClassifier
-    }
-    FEDOT_PREPROC_MODEL = {
+        'mlp': 'sklearn.neural_network.MLPClassifier'
+    })
+    FEDOT_PREPROC_MODEL = LazyOperationRegistry({
         # data standartization
-        'scaling': ScalingImplementation,
-        'normalization': NormalizationImplementation,
+        'scaling': f'{_FEDOT_DATA_OPERATIONS}.sklearn_transformations.ScalingImplementation',
+        'normalization': f'{_FEDOT_DATA_OPERATIONS}.sklearn_transformations.NormalizationImplementation',
         # missing data
-        'simple_imputation': ImputationImplementation,
+        'simple_imputation': f'{_FEDOT_DATA_OPERATIONS}.sklearn_transformations.ImputationImplementation',
         # dimension reduction
-        'kernel_pca': KernelPCAImplementation,
+        'kernel_pca': f'{_FEDOT_DATA_OPERATIONS}.sklearn_transformations.KernelPCAImplementation',
         # feature generation
-        'topological_features': FastTopologicalFeaturesImplementation,
+        'topological_features': f'{_FEDOT_DATA_OPERATIONS}.topological.fast_topological_extractor.'
+                                f'FastTopologicalFeaturesImplementation',
 
-    }
-    INDUSTRIAL_PREPROC_MODEL = {
+    })
+    INDUSTRIAL_PREPROC_MODEL = LazyOperationRegistry({
         # data projection onto different basis
-        'eigen_basis': EigenBasisImplementation,
-        'wavelet_basis': WaveletBasisImplementation,
-        'fourier_basis': FourierBasisImplementation,
+        'eigen_basis': f'{_INDUSTRIAL_BASIS}.eigen_basis.EigenBasisImplementation',
+        'wavelet_basis': f'{_INDUSTRIAL_BASIS}.wavelet.WaveletBasisImplementation',
+        'fourier_basis': f'{_INDUSTRIAL_BASIS}.fourier.FourierBasisImplementation',
         # feature extraction algorithm
 
-        'quantile_extractor': QuantileExtractor,
+        'quantile_extractor': 'fedot_ind.core.models.quantile.quantile_extractor.QuantileExtractor',
         # nn feature extraction algorithm
-        'minirocket_extractor': MiniRocketExtractor,
+        'minirocket_extractor': f'{_INDUSTRIAL_NN}.mini_rocket.MiniRocketExtractor',
         # isolation_forest forest
-        'isolation_forest_class': IsolationForestClassImplementation,
-        'isolation_forest_reg': IsolationForestRegImplementation,
-    }
+        'isolation_forest_class': f'{_FEDOT_DATA_OPERATIONS}.sklearn_filters.IsolationForestClassImplementation',
+        'isolation_forest_reg': f'{_FEDOT_DATA_OPERATIONS}.sklearn_filters.IsolationForestRegImplementation',
+    })
 
-    SKLEARN_REG_MODELS = {
+    SKLEARN_REG_MODELS = LazyOperationRegistry({
         # boosting models (bid datasets)
-        'xgbreg': XGBRegressor,
-        'sgdr': SklearnSGD,
+        'xgbreg': 'xgboost.XGBRegressor',
+        'sgdr': 'sklearn.linear_model.SGDRegressor',
         # ensemble tree models (big datasets)
-        'treg': ExtraTreesRegressor,
+        'treg': 'sklearn.ensemble.ExtraTreesRegressor',
         # solo linear models with regularization
-        'ridge': SklearnRidgeReg,
-        'lasso': SklearnLassoReg,
+        'ridge': 'sklearn.linear_model.Ridge',
+        'lasso': 'sklearn.linear_model.Lasso',
         # solo tree models (small datasets)
-        'knnreg': FedotKnnRegImplementation,
-        'dtreg': DecisionTreeRegressor
-    }
+        'knnreg': f'{_FEDOT_MODELS}.knn.FedotKnnRegImplementation',
+        'dtreg': 'sklearn.tree.DecisionTreeRegressor'
+    })
 
-    FORECASTING_MODELS = {
+    FORECASTING_MODELS = LazyOperationRegistry({
         # boosting models (bid datasets)
-        'ar': AutoRegImplementation,
-        'stl_arima': STLForecastARIMAImplementation,
-        'ets': ExpSmoothingImplementation,
-        'cgru': CGRUImplementation,
-        'glm': GLMImplementation,
-        'locf': RepeatLastValueImplementation,
-        'ssa_forecaster': SSAForecasterImplementation
-    }
-
-    FORECASTING_PREPROC = {
-        'lagged': LaggedTransformationImplementation,
-        'sparse_lagged': SparseLaggedTransformationImplementation,
-        'smoothing': TsSmoothingImplementation,
-        'gaussian_filter': GaussianFilterImplementation
-    }
-
-    NEURAL_MODEL = {
+        'ar': f'{_FEDOT_MODELS}.ts_implementations.statsmodels.AutoRegImplementation',
+        'stl_arima': f'{_FEDOT_MODELS}.ts_implementations.arima.STLForecastARIMAImplementation',
+        'ets': f'{_FEDOT_MODELS}.ts_implementations.statsmodels.ExpSmoothingImplementation',
+        'cgru': f'{_FEDOT_MODELS}.ts_implementations.cgru.CGRUImplementation',
+        'glm': f'{_FEDOT_MODELS}.ts_implementations.statsmodels.GLMImplementation',
+        'locf': f'{_FEDOT_MODELS}.ts_implementations.naive.RepeatLastValueImplementation',
+        'ssa_forecaster': 'fedot_ind.core.models.ts_forecasting.ssa_forecaster.SSAForecasterImplementation'
+    })
+
+    FORECASTING_PREPROC = LazyOperationRegistry({
+        'lagged': f'{_FEDOT_DATA_OPERATIONS}.ts_transformations.LaggedTransformationImplementation',
+        'sparse_lagged': f'{_FEDOT_DATA_OPERATIONS}.ts_transformations.SparseLaggedTransformationImplementation',
+        'smoothing': f'{_FEDOT_DATA_OPERATIONS}.ts_transformations.TsSmoothingImplementation',
+        'gaussian_filter': f'{_FEDOT_DATA_OPERATIONS}.ts_transformations.GaussianFilterImplementation'
+    })
+
+    NEURAL_MODEL = LazyOperationRegistry({
         # fundamental models
-        'inception_model': InceptionTimeModel,
-        'omniscale_model': OmniScaleModel,
-        'resnet_model': ResNetModel,
+        'inception_model': f'{_INDUSTRIAL_NN}.inception.InceptionTimeModel',
+        'omniscale_model': f'{_INDUSTRIAL_NN}.omni_scale.OmniScaleModel',
+        'resnet_model': f'{_INDUSTRIAL_NN}.resnet.ResNetModel',
         # transformer models
-        'tst_model': TSTModel,
+        'tst_model': f'{_INDUSTRIAL_NN}.tst.TSTModel',
         # explainable models
-        'xcm_model': XCModel
-    }
+        'xcm_model': f'{_INDUSTRIAL_NN}.explainable_convolution_model.XCModel'
+    })
 
 
 def default_industrial_availiable_operation(problem: str = 'regression'):
@@ -56,7 +56,9 @@ industrial_search_space = {
                             ['LeakyReLU', 'SwishBeta', 'Tanh', 'Softmax', 'SmeLU', 'Mish']]}},
     'ssa_forecaster':
         {'window_size_method': {'hyperopt-dist': hp.choice,
-                                'sampling-scope': [['hac', 'dff']]}}
+                                'sampling-scope': [['hac', 'dff']]},
+         'mode': {'hyperopt-dist': hp.choice,
+                  'sampling-scope': [['lrr', 'pipeline']]}}
 }
 
 
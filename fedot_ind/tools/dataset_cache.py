@@ -0,0 +1,121 @@
+import hashlib
+import json
+import logging
+import os
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+
+CACHE_FORMAT_VERSION = 2
+
+
+class DatasetCache:
+    """Class responsible for binary columnar cache of datasets parsed from text files.
+
+    Each subset is stored as contiguous ``.npy`` arrays and a small ``json`` sidecar with metadata. Series of
+    unequal length are concatenated into one flat array with per sample and channel lengths, so the original
+    structure is restored from offsets. The cache is invalidated when the checksum of any source file changes.
+
+    Args:
+        cache_folder: path to the folder where cached subsets are stored.
+        mmap: if True, arrays are memory-mapped instead of being read into memory.
+
+    Examples:
+        >>> cache = DatasetCache(os.path.expanduser('~/.cache/fedot_ind/datasets/ItalyPowerDemand'))
+        >>> checksum = cache.checksum(['data/ItalyPowerDemand/ItalyPowerDemand_TRAIN.ts'])
+        >>> cache.save('TRAIN', x_train, y_train, checksum)
+        >>> x_train, y_train = cache.load('TRAIN', checksum)
+
+    """
+
+    def __init__(self, cache_folder: str, mmap: bool = False):
+        self.cache_folder = cache_folder
+        self.mmap_mode = 'r' if mmap else None
+        self.logger = logging.getLogger('DatasetCache')
+
+    @staticmethod
+    def checksum(source_files: List[str], chunk_size: int = 2 ** 20, **options) -> str:
+        """Computes md5 checksum of the source files content and reading options passed as keyword arguments."""
+        hsh = hashlib.md5(repr(sorted(options.items())).encode('utf8'))
+        for file_path in source_files:
+            with open(file_path, 'rb') as file:
+                for chunk in iter(lambda: file.read(chunk_size), b''):
+                    hsh.update(chunk)
+        return hsh.hexdigest()
+
+    def _path(self, subset: str, name: str) -> str:
+        return os.path.join(self.cache_folder, f'{subset}_{name}')
+
+    def _read_meta(self, subset: str) -> Optional[dict]:
+        try:
+            with open(self._path(subset, 'meta.json'), 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def is_valid(self, subset: str, checksum: str) -> bool:
+        meta = self._read_meta(subset)
+        return meta is not None and meta['version'] == CACHE_FORMAT_VERSION and meta['checksum'] == checksum
+
+    def save(self, subset: str, features, target: np.ndarray, checksum: str):
+        """Saves features and target of the subset to the cache.
+
+        Args:
+            subset: name of the subset, e.g. 'TRAIN' or 'TEST'.
+            features: 2d array, ``pd.DataFrame`` of values or nested ``pd.DataFrame`` with series in cells.
+            target: array of labels.
+            checksum: checksum of the source files.
+
+        """
+        os.makedirs(self.cache_folder, exist_ok=True)
+        meta = {'version': CACHE_FORMAT_VERSION, 'checksum': checksum}
+        if isinstance(features, pd.DataFrame):
+            meta['columns'] = [column if isinstance(column, str) else int(column) for column in features.columns]
+            is_nested = features.shape[1] > 0 and features.dtypes.eq(object).all() and \
+                isinstance(features.iat[0, 0], (pd.Series, np.ndarray))
+            if is_nested:
+                meta['kind'] = 'nested'
+                cells = [np.asarray(cell, dtype=float) for cell in features.values.ravel()]
+                lengths = np.array([cell.shape[0] for cell in cells]).reshape(features.shape)
+                values = np.concatenate(cells) if cells else np.empty(0)
+                np.save(self._path(subset, 'lengths.npy'), lengths)
+            else:
+                meta['kind'] = 'frame'
+                values = features.values.astype(float)
+        else:
+            meta['kind'] = 'array'
+            values = np.asarray(features, dtype=float)
+        np.save(self._path(subset, 'values.npy'), values)
+        # labels of object dtype are pickled, so their types are restored as they were
+        target = np.asarray(target)
+        meta['pickled_target'] = target.dtype.hasobject
+        np.save(self._path(subset, 'target.npy'), target, allow_pickle=meta['pickled_target'])
+        # sidecar is written last, so an interrupted save never looks like a valid cache
+        with open(self._path(subset, 'meta.json'), 'w') as file:
+            json.dump(meta, file)
+
+    def load(self, subset: str, checksum: str) -> Optional[Tuple]:
+        """Loads features and target of the subset in the same form they were saved.
+
+        Returns:
+            tuple of features and target or None if the cache is missing or outdated.
+
+        """
+        if not self.is_valid(subset, checksum):
+            return None
+        meta = self._read_meta(subset)
+        values = np.load(self._path(subset, 'values.npy'), mmap_mode=self.mmap_mode, allow_pickle=False)
+        target = np.load(self._path(subset, 'target.npy'), allow_pickle=meta['pickled_target'])
+        if meta['kind'] == 'array':
+            return values, target
+        if meta['kind'] == 'frame':
+            return pd.DataFrame(values, columns=meta['columns']), target
+
+        lengths = np.load(self._path(subset, 'lengths.npy'), allow_pickle=False)
+        offsets = np.concatenate([[0], np.cumsum(lengths.ravel())])
+        cells = [pd.Series(values[start:end]) for start, end in zip(offsets[:-1], offsets[1:])]
+        nested = np.empty(lengths.size, dtype=object)
+        nested[:] = cells
+        return pd.DataFrame(nested.reshape(lengths.shape), columns=meta['columns']), target
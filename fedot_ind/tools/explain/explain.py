@@ -30,6 +30,19 @@ class Explainer:
 
 
 class PointExplainer(Explainer):
+    """Explains model predictions by perturbation of time series windows with their mean value.
+
+    In batched mode all the perturbed variants are predicted with a few chunked ``predict_proba`` calls instead
+    of one call per window. Variants which coincide with the original series (e.g. the window is already
+    constant) get the base probabilities without passing them to the model.
+
+    Args:
+        model: fitted model with ``predict_proba`` method.
+        features: features of the samples to explain.
+        target: target of the samples to explain.
+
+    """
+
     def __init__(self, model, features, target):
         super().__init__(model, features, target)
         self.picked_target = None
@@ -38,17 +51,38 @@ class PointExplainer(Explainer):
         self.scaled_vector = None
         self.window_length = None
 
-    def explain(self, n_samples: int = 1, window: int = 5, method: str = 'rmse'):
+    def explain(self,
+                n_samples: int = 1,
+                window: int = 5,
+                method: str = 'rmse',
+                batched: bool = False,
+                batch_size: int = 256,
+                max_evaluations: int = None):
+        """Computes importance of time series windows.
+
+        Args:
+            n_samples: number of samples of each class to explain.
+            window: window size in % of series length, ``0`` to perturb every point separately.
+            method: distance between probabilities used as importance.
+            batched: if True, perturbed variants are predicted by chunks of ``batch_size`` samples.
+            batch_size: number of perturbed variants in one ``predict_proba`` call of batched mode.
+            max_evaluations: budget of perturbed variants in batched mode. If the number of windows doesn't
+                fit into it, windows are enlarged.
+
+        """
         self.picked_feature, self.picked_target = self.select(self.features,
                                                               self.target.flatten(),
                                                               n_samples_=n_samples)
         self.scaled_vector, self.window_length = self.importance(window=window,
-                                                                 method=method)
+                                                                 method=method,
+                                                                 batched=batched,
+                                                                 batch_size=batch_size,
+                                                                 max_evaluations=max_evaluations)
 
     def visual(self, threshold: int = 90, name='dataset'):
         self.plot_importance(thr=threshold, name=name)
 
-    def importance(self, window=None, method='euclidean'):
+    def importance(self, window=None, method='euclidean', batched=False, batch_size=256, max_evaluations=None):
         model = self.model
         part_feature_ = self.picked_feature
         part_target_ = self.picked_target
@@ -58,16 +92,21 @@ class PointExplainer(Explainer):
         if not window:
             window_length = 0
             n_parts = part_feature_.shape[1]
-
-            iv_scaled = self.get_vector(base_proba_, distance_func, model, n_parts,
-                                        part_feature_, part_target_, window_length)
-
         else:
             window_length = part_feature_.shape[1] * window // 100
             n_parts = math.ceil(part_feature_.shape[1] / window_length)
+
+        if not batched:
             iv_scaled = self.get_vector(base_proba_, distance_func, model, n_parts,
                                         part_feature_, part_target_, window_length)
+            return pd.DataFrame(iv_scaled), window_length
 
+        if max_evaluations is not None and n_parts * part_feature_.shape[0] > max_evaluations:
+            max_parts = max(max_evaluations // part_feature_.shape[0], 1)
+            window_length = math.ceil(part_feature_.shape[1] / max_parts)
+            n_parts = math.ceil(part_feature_.shape[1] / window_length)
+        iv_scaled = self.get_vector_batched(base_proba_, distance_func, model, n_parts,
+                                            part_feature_, part_target_, window_length, batch_size)
         return pd.DataFrame(iv_scaled), window_length
 
     def get_vector(self, base_proba_, distance_func, model, n_parts, part_feature_, part_target_, window_length):
@@ -92,6 +131,39 @@ class PointExplainer(Explainer):
                 pbar.update(1)
         return importance_vector_
 
+    def get_vector_batched(self, base_proba_, distance_func, model, n_parts, part_feature_, part_target_,
+                           window_length, batch_size=256):
+        """Batched version of :meth:`get_vector`. Perturbed variants of all the samples are generated and
+        predicted by chunks of ``batch_size``."""
+        features = np.asarray(part_feature_, dtype=float)
+        n_rows, series_length = features.shape
+        row_means = features.mean(axis=1, keepdims=True)
+        window_idx = np.arange(series_length) // max(window_length, 1)
+        base_proba_ = np.asarray(base_proba_).reshape(n_rows, -1)
+
+        n_variants = n_parts * n_rows
+        proba_new = np.empty((n_variants, base_proba_.shape[1]))
+        with tqdm(total=n_variants, desc='Processing points', unit='variant') as pbar:
+            for start in range(0, n_variants, batch_size):
+                variant_idx = np.arange(start, min(start + batch_size, n_variants))
+                parts, rows = np.divmod(variant_idx, n_rows)
+                perturbed = np.where(window_idx[None, :] == parts[:, None], row_means[rows], features[rows])
+                changed = np.any(perturbed != features[rows], axis=1)
+                proba_new[variant_idx[~changed]] = base_proba_[rows[~changed]]
+                if changed.any():
+                    predicted = self.predict_proba(model, perturbed[changed], part_target_[rows[changed]])
+                    proba_new[variant_idx[changed]] = np.asarray(predicted).reshape(changed.sum(), -1)
+                pbar.update(len(variant_idx))
+
+        proba_new = proba_new.reshape(n_parts, n_rows, -1)
+        importance_vector_ = {}
+        for cls in np.unique(part_target_):
+            class_rows = np.where(part_target_ == cls)[0]
+            importance_vector_[cls] = np.array([np.mean([distance_func(base_proba_[row], proba_new[part, row])
+                                                         for row in class_rows])
+                                                for part in range(n_parts)])
+        return importance_vector_
+
     @staticmethod
     def replace_values(features: np.ndarray, window_len: int, i: int):
         if window_len:
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import os
 import shutil
@@ -14,7 +15,8 @@ import pandas as pd
 from scipy.io.arff import loadarff
 from sktime.datasets._data_io import load_from_tsfile_to_dataframe
 from tqdm import tqdm
-from fedot_ind.api.utils.path_lib import PROJECT_PATH
+from fedot_ind.api.utils.path_lib import DEFAULT_DATASET_CACHE_PATH, PROJECT_PATH
+from fedot_ind.tools.dataset_cache import DatasetCache
 
 
 class DataLoader:
@@ -24,16 +26,34 @@ class DataLoader:
     Args:
         dataset_name: name of dataset
         folder: path to folder with data
+        use_cache: if True, parsed data is stored in binary cache and read from it while the source files
+            are unchanged
+        cache_folder: folder of the binary cache, ``fedot_ind/datasets`` of the user cache directory
+            (``$XDG_CACHE_HOME`` or ``~/.cache``) by default. Data folders are never written to, so read-only and
+            shared datasets are cached as well
+        mmap: if True, arrays of binary cache are memory-mapped
+        dense: if True, ``.ts`` data is returned as array of shape ``(n_samples, n_channels, series_length)``
+            instead of nested ``pd.DataFrame``. Series of unequal length are padded with NaN at the end
 
     Examples:
         >>> data_loader = DataLoader('ItalyPowerDemand')
         >>> train_data, test_data = data_loader.load_data()
     """
 
-    def __init__(self, dataset_name: str, folder: str = None):
+    def __init__(self,
+                 dataset_name: str,
+                 folder: str = None,
+                 use_cache: bool = True,
+                 cache_folder: str = None,
+                 mmap: bool = False,
+                 dense: bool = False):
         self.logger = logging.getLogger('DataLoader')
         self.dataset_name = dataset_name
         self.folder = folder
+        self.use_cache = use_cache
+        self.cache_folder = DEFAULT_DATASET_CACHE_PATH if cache_folder is None else cache_folder
+        self.mmap = mmap
+        self.dense = dense
         self.forecast_data_source = {'M3': M3.load,
                                      'M4': M4.load,
                                      'M5': M5.load
@@ -100,32 +120,32 @@ class DataLoader:
         if os.path.isfile(file_path + '.tsv'):
             self.logger.info(
                 f'Reading data from {data_path + "/" + dataset_name}')
-            x_train, y_train, x_test, y_test = self.read_tsv(
-                dataset_name, data_path)
+            x_train, y_train, x_test, y_test = self._read_with_cache(
+                self.read_tsv, '.tsv', dataset_name, data_path)
             is_multi = False
 
         # If data unpacked as .txt file
         elif os.path.isfile(file_path + '.txt'):
             self.logger.info(
                 f'Reading data from {data_path + "/" + dataset_name}')
-            x_train, y_train, x_test, y_test = self.read_txt_files(
-                dataset_name, data_path)
+            x_train, y_train, x_test, y_test = self._read_with_cache(
+                self.read_txt_files, '.txt', dataset_name, data_path)
             is_multi = False
 
         # If data unpacked as .ts file
         elif os.path.isfile(file_path + '.ts'):
             self.logger.info(
                 f'Reading data from {data_path + "/" + dataset_name}')
-            x_train, y_train, x_test, y_test = self.read_ts_files(
-                dataset_name, data_path)
+            x_train, y_train, x_test, y_test = self._read_with_cache(
+                self.read_ts_files, '.ts', dataset_name, data_path)
             is_multi = True
 
         # If data unpacked as .arff file
         elif os.path.isfile(file_path + '.arff'):
             self.logger.info(
                 f'Reading data from {data_path + "/" + dataset_name}')
-            x_train, y_train, x_test, y_test = self.read_arff_files(
-                dataset_name, data_path)
+            x_train, y_train, x_test, y_test = self._read_with_cache(
+                self.read_arff_files, '.arff', dataset_name, data_path)
             is_multi = True
 
         else:
@@ -145,6 +165,33 @@ class DataLoader:
             y_train = y_train[shuffled_idx]
         return is_multi, (x_train, y_train), (x_test, y_test)
 
+    def _read_with_cache(self, read_method, extension: str, dataset_name: str, data_path: str) -> tuple:
+        """Reads train and test subsets from binary cache if it matches the source files, otherwise parses them
+        with ``read_method`` and fills the cache.
+
+        """
+        source_files = [os.path.join(data_path, dataset_name, f'{dataset_name}_{subset}{extension}')
+                        for subset in ('TRAIN', 'TEST')]
+        if not self.use_cache or not all(os.path.isfile(file) for file in source_files):
+            return read_method(dataset_name, data_path)
+
+        # datasets of the same name from different folders get separate caches
+        folder_hash = hashlib.md5(os.path.abspath(data_path).encode('utf8')).hexdigest()[:8]
+        cache = DatasetCache(os.path.join(self.cache_folder, f'{dataset_name}_{folder_hash}'), mmap=self.mmap)
+        checksum = cache.checksum(source_files, dense=self.dense)
+        train_data, test_data = cache.load('TRAIN', checksum), cache.load('TEST', checksum)
+        if train_data is not None and test_data is not None:
+            self.logger.info('Reading data from binary cache')
+            return (*train_data, *test_data)
+
+        x_train, y_train, x_test, y_test = read_method(dataset_name, data_path)
+        try:
+            cache.save('TRAIN', x_train, y_train, checksum)
+            cache.save('TEST', x_test, y_test, checksum)
+        except Exception as ex:
+            self.logger.warning(f'Data was not cached due to error {ex}')
+        return x_train, y_train, x_test, y_test
+
     def predict_encoding(self, file_path: Path, n_lines: int = 20) -> str:
         with Path(file_path).open('rb') as f:
             rawdata = b''.join([f.readline() for _ in range(n_lines)])
@@ -782,7 +829,126 @@ class DataLoader:
         x_test, y_test = data_test[:, 1:], data_test[:, 0]
         return x_train, y_train, x_test, y_test
 
+    def _fast_load_from_tsfile(self, full_file_path_and_name: str, return_dense: bool = False) -> tuple:
+        """Loads data from a ``.ts`` file parsing all the data lines in bulk. Values of all series are converted
+        to float with a single call, missing values marked with ``?`` are replaced with NaN.
+
+        Args:
+            full_file_path_and_name: the full pathname of the .ts file to read.
+            return_dense: if True, features are returned as array of shape ``(n_samples, n_channels, series_length)``,
+                series of unequal length are padded with NaN at the end. Otherwise, nested ``pd.DataFrame`` with
+                ``pd.Series`` in cells is returned as with :meth:`_load_from_tsfile_to_dataframe`.
+
+        Returns:
+            tuple of features and array of class values (or target values for regression).
+
+        Raises:
+            ValueError: if the file contains timestamps or can't be parsed in bulk. Such files should be read
+                with :meth:`_load_from_tsfile_to_dataframe`.
+
+        """
+        encoding = self.predict_encoding(full_file_path_and_name)
+        with open(full_file_path_and_name, 'r', encoding=encoding) as file:
+            lines = file.read().splitlines()
+
+        has_labels, is_regression, data_start = False, False, None
+        for line_num, line in enumerate(lines):
+            tokens = line.strip().lower().split()
+            if not tokens or tokens[0].startswith('#'):
+                continue
+            if tokens[0] == '@timestamps' and tokens[-1] == 'true':
+                raise ValueError('timestamps are not supported by bulk parser')
+            elif tokens[0] in ('@classlabel', '@targetlabel'):
+                has_labels = len(tokens) > 1 and tokens[1] == 'true'
+                is_regression = tokens[0] == '@targetlabel'
+            elif tokens[0] == '@data':
+                data_start = line_num + 1
+                break
+        if data_start is None:
+            raise ValueError('file contained no data')
+
+        rows = [line.strip() for line in lines[data_start:]]
+        rows = [row for row in rows if row and not row.startswith('#')]
+        labels = None
+        if has_labels:
+            rows, labels = zip(*[row.rsplit(':', 1) for row in rows])
+            labels = np.array([label.strip() for label in labels])
+            labels = labels.astype(float) if is_regression else labels
+
+        cells = [row.split(':') for row in rows]
+        n_samples, n_channels = len(cells), len(cells[0])
+        if any(len(row_cells) != n_channels for row_cells in cells):
+            raise ValueError('inconsistent number of dimensions')
+        flat_cells = [cell for row_cells in cells for cell in row_cells]
+        lengths = np.array([cell.count(',') + 1 for cell in flat_cells]).reshape(n_samples, n_channels)
+        values = np.array(','.join(flat_cells).replace('?', 'nan').split(','), dtype=float)
+
+        if (lengths == lengths[0, 0]).all():
+            features = values.reshape(n_samples, n_channels, lengths[0, 0])
+            if return_dense:
+                return features, labels
+            cells = [pd.Series(series) for series in features.reshape(-1, lengths[0, 0])]
+        else:
+            offsets = np.concatenate([[0], np.cumsum(lengths.ravel())])
+            cells = [values[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+            if return_dense:
+                self.logger.info('Series of unequal length are padded with NaN')
+                features = np.full((n_samples * n_channels, lengths.max()), np.nan)
+                for series_idx, series in enumerate(cells):
+                    features[series_idx, :series.shape[0]] = series
+                return features.reshape(n_samples, n_channels, -1), labels
+            cells = [pd.Series(series) for series in cells]
+
+        nested = np.empty(n_samples * n_channels, dtype=object)
+        nested[:] = cells
+        features = pd.DataFrame(nested.reshape(n_samples, n_channels),
+                                columns=[f'dim_{dim}' for dim in range(n_channels)])
+        return features, labels
+
+    @staticmethod
+    def _fast_load_from_arff(full_file_path_and_name: str) -> tuple:
+        """Loads data from a dense ``.arff`` file with numeric attributes and class attribute in the last column
+        parsing all the data lines in bulk.
+
+        Raises:
+            ValueError: if the file contains relational or string attributes, or sparse data.
+
+        """
+        with open(full_file_path_and_name, 'r') as file:
+            lines = file.read().splitlines()
+
+        n_attributes, data_start = 0, None
+        for line_num, line in enumerate(lines):
+            tokens = line.strip().lower().split()
+            if not tokens or tokens[0].startswith('%'):
+                continue
+            if tokens[0] == '@attribute':
+                if tokens[-1] in ('relational', 'string'):
+                    raise ValueError(f'{tokens[-1]} attributes are not supported by bulk parser')
+                n_attributes += 1
+            elif tokens[0] == '@data':
+                data_start = line_num + 1
+                break
+        if data_start is None:
+            raise ValueError('file contained no data')
+
+        rows = [line.strip() for line in lines[data_start:]]
+        rows = [row for row in rows if row and not row.startswith('%')]
+        features, labels = zip(*[row.rsplit(',', 1) for row in rows])
+        features = np.array(','.join(features).replace('?', 'nan').split(','), dtype=float)
+        labels = np.array([label.strip().strip('\'"') for label in labels])
+        return features.reshape(len(rows), n_attributes - 1), labels
+
     def read_ts_files(self, dataset_name, data_path):
+        try:
+            x_test, y_test = self._fast_load_from_tsfile(data_path + '/' + dataset_name + f'/{dataset_name}_TEST.ts',
+                                                         return_dense=self.dense)
+            x_train, y_train = self._fast_load_from_tsfile(
+                data_path + '/' + dataset_name + f'/{dataset_name}_TRAIN.ts',
+                return_dense=self.dense)
+            return x_train, y_train, x_test, y_test
+        except (ValueError, IndexError) as ex:
+            self.logger.info(f'Bulk parsing of .ts file failed - {ex}')
         try:
             x_test, y_test = load_from_tsfile_to_dataframe(data_path + '/' + dataset_name + f'/{dataset_name}_TEST.ts',
                                                            return_separate_X_and_y=True)
@@ -803,6 +969,14 @@ class DataLoader:
         """Reads data from ``.arff`` file.
 
         """
+        try:
+            x_train, y_train = self._fast_load_from_arff(temp_data_path + '/' + dataset_name +
+                                                         f'/{dataset_name}_TRAIN.arff')
+            x_test, y_test = self._fast_load_from_arff(temp_data_path + '/' + dataset_name +
+                                                       f'/{dataset_name}_TEST.arff')
+            return x_train, y_train, x_test, y_test
+        except (ValueError, IndexError) as ex:
+            self.logger.info(f'Bulk parsing of .arff file failed - {ex}')
         train = loadarff(temp_data_path + '/' + dataset_name +
                          f'/{dataset_name}_TRAIN.arff')
         test = loadarff(temp_data_path + '/' + dataset_name +
@@ -0,0 +1,330 @@
+import copyreg
+import io
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+from typing import Dict, List, Optional, Union
+
+from fedot.core.pipelines.node import PipelineNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.operation_types_repository import atomized_model_type
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+
+ARTIFACT_FORMAT_VERSION = 1
+ARTIFACT_MAGIC = b'FEDOTIND'
+# magic, offset and size of the manifest
+ARTIFACT_HEADER = struct.Struct('<8sQQ')
+BLOB_ALIGNMENT = 64
+
+
+def _has_default_state(module, torch) -> bool:
+    """Checks that module is pickled with its ``__dict__`` and saves only its parameters and buffers to the state
+    dict, so it can be rebuilt from the state dict."""
+    module_type = type(module)
+    return module_type.__reduce_ex__ is object.__reduce_ex__ and module_type.__reduce__ is object.__reduce__ and \
+        module_type.__getstate__ is torch.nn.Module.__getstate__ and \
+        module_type._save_to_state_dict is torch.nn.Module._save_to_state_dict
+
+
+def _module_skeleton(module, torch) -> dict:
+    """Returns state of the module with entries of its state dict replaced by tensors on the meta device."""
+
+    def placeholder(tensor):
+        meta_tensor = torch.empty_like(tensor, device='meta')
+        return torch.nn.Parameter(meta_tensor, tensor.requires_grad) if isinstance(tensor, torch.nn.Parameter) \
+            else meta_tensor
+
+    state = module.__getstate__()
+    state['_parameters'] = {name: None if parameter is None else placeholder(parameter)
+                            for name, parameter in module._parameters.items()}
+    state['_buffers'] = {name: buffer if buffer is None or name in module._non_persistent_buffers_set
+                         else placeholder(buffer)
+                         for name, buffer in module._buffers.items()}
+    return state
+
+
+def _set_module_state(module, state):
+    skeleton, state_dict = state
+    module.__setstate__(skeleton)
+    if state_dict is not None:
+        # tensors of the state dict are assigned to the module, so the weights stay mapped to the artifact
+        module.load_state_dict(state_dict, assign=True)
+    return module
+
+
+class _BlobPickler(pickle.Pickler):
+    """Pickler which moves numpy arrays and torch tensors out of the pickle stream to the list of blobs.
+
+    Torch modules are saved as their structure with weights on the meta device and the state dict of the outermost
+    module, the weights are restored with ``load_state_dict`` on load.
+    """
+
+    def __init__(self, file, min_blob_size: int):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.min_blob_size = min_blob_size
+        self.blobs = []
+        # objects are kept alive, so their ids can't be reused during the dump
+        self._blob_ids = {}
+        self._submodules = {}
+
+    def _blob_index(self, obj, array: np.ndarray) -> int:
+        if id(obj) not in self._blob_ids:
+            self._blob_ids[id(obj)] = (len(self.blobs), obj)
+            self.blobs.append(np.ascontiguousarray(array))
+        return self._blob_ids[id(obj)][0]
+
+    def persistent_id(self, obj):
+        if type(obj) in (np.ndarray, np.memmap):
+            if obj.dtype.hasobject or obj.dtype.fields is not None or obj.nbytes < self.min_blob_size:
+                return None
+            return 'ndarray', self._blob_index(obj, obj)
+        # torch is checked only when it is already imported by the saved models
+        torch = sys.modules.get('torch')
+        if torch is not None and type(obj) in (torch.Tensor, torch.nn.Parameter):
+            if obj.layout != torch.strided or obj.is_meta or obj.nelement() * obj.element_size() < self.min_blob_size:
+                return None
+            try:
+                array = obj.detach().cpu().numpy()
+            except TypeError:
+                # dtypes without numpy counterpart, e.g. bfloat16, stay in the pickle stream
+                return None
+            return 'tensor', self._blob_index(obj, array), isinstance(obj, torch.nn.Parameter), obj.requires_grad
+        return None
+
+    def reducer_override(self, obj):
+        torch = sys.modules.get('torch')
+        if torch is None or not isinstance(obj, torch.nn.Module):
+            return NotImplemented
+        if id(obj) in self._submodules:
+            # weights of the submodule are restored with the state dict of the outermost module
+            state_dict = None
+        else:
+            submodules = list(obj.modules())
+            if not all(_has_default_state(module, torch) for module in submodules):
+                return NotImplemented
+            self._submodules.update({id(module): module for module in submodules[1:]})
+            state_dict = obj.state_dict(keep_vars=True)
+        return copyreg.__newobj__, (type(obj),), (_module_skeleton(obj, torch), state_dict), None, None, \
+            _set_module_state
+
+
+class _BlobUnpickler(pickle.Unpickler):
+    """Unpickler which restores arrays and tensors from the memory-mapped blobs of the artifact."""
+
+    def __init__(self, file, arrays: List[np.ndarray]):
+        super().__init__(file)
+        self.arrays = arrays
+        self._restored = {}
+
+    def persistent_load(self, pid):
+        key = pid[:2]
+        if key not in self._restored:
+            kind, index = key
+            if kind == 'ndarray':
+                self._restored[key] = self.arrays[index]
+            else:
+                import torch
+
+                tensor = torch.from_numpy(self.arrays[index])
+                is_parameter, requires_grad = pid[2:]
+                self._restored[key] = torch.nn.Parameter(tensor, requires_grad) if is_parameter else \
+                    tensor.requires_grad_(requires_grad)
+        return self._restored[key]
+
+
+class _LazyPipelineNode(PipelineNode):
+    """Pipeline node which reads its fitted operation from the artifact on the first access."""
+
+    def __init__(self, *args, artifact: 'ModelArtifact' = None, record: Optional[dict] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._artifact = artifact
+        self._pending_record = record
+
+    @property
+    def fitted_operation(self):
+        if getattr(self, '_pending_record', None) is not None:
+            record, self._pending_record = self._pending_record, None
+            self._fitted_operation = self._artifact.read_record(record)
+        return getattr(self, '_fitted_operation', None)
+
+    @fitted_operation.setter
+    def fitted_operation(self, value):
+        self._pending_record = None
+        PipelineNode.fitted_operation.fset(self, value)
+
+
+class ModelArtifact:
+    """Class responsible for compact single file artifact of fitted pipelines.
+
+    The file starts with a fixed header followed by binary blobs and a ``json`` manifest describing structure of
+    the pipelines. Fitted operations of every node are pickled separately, while numpy arrays and torch tensors
+    they hold (e.g. weights of the NN models or kernels of MiniRocket) are stored as raw blobs aligned to
+    64 bytes. On load the file is memory-mapped once in copy-on-write mode and the blobs are views of the
+    mapping, so nothing is read until the model touches the data, and fitted operation of a node is unpickled
+    only on the first access to it.
+
+    Args:
+        path: path to the artifact file.
+        min_blob_size: arrays smaller than this number of bytes are kept inside the pickle stream.
+
+    Examples:
+        >>> artifact = ModelArtifact('results/model.fedotind')
+        >>> artifact.save({'best_pipeline': pipeline})
+        >>> pipeline = artifact.load()['best_pipeline']
+
+    """
+
+    def __init__(self, path: str, min_blob_size: int = 1024):
+        self.path = path
+        self.min_blob_size = min_blob_size
+        self._buffer = None
+
+    def __getstate__(self):
+        # mapping can't be pickled, copies of the artifact map the file again
+        state = self.__dict__.copy()
+        state['_buffer'] = None
+        return state
+
+    @staticmethod
+    def _align(file) -> int:
+        offset = file.tell()
+        padding = -offset % BLOB_ALIGNMENT
+        file.write(b'\0' * padding)
+        return offset + padding
+
+    def _write_record(self, file, obj) -> dict:
+        stream = io.BytesIO()
+        pickler = _BlobPickler(stream, self.min_blob_size)
+        pickler.dump(obj)
+        arrays = []
+        for blob in pickler.blobs:
+            offset = self._align(file)
+            file.write(blob.reshape(-1).view(np.uint8).data)
+            arrays.append({'offset': offset, 'dtype': blob.dtype.str, 'shape': list(blob.shape)})
+        offset = self._align(file)
+        file.write(stream.getbuffer())
+        return {'offset': offset, 'nbytes': stream.tell(), 'arrays': arrays}
+
+    @staticmethod
+    def _pipeline_nodes(pipeline: Pipeline) -> List[PipelineNode]:
+        """Returns nodes of the pipeline in depth-first order starting from the root node."""
+        nodes = []
+
+        def visit(node: PipelineNode):
+            if all(node is not visited for visited in nodes):
+                nodes.append(node)
+                for parent in node.nodes_from:
+                    visit(parent)
+
+        visit(pipeline.root_node)
+        return nodes
+
+    def _write_pipeline(self, file, pipeline: Pipeline) -> dict:
+        nodes = self._pipeline_nodes(pipeline)
+        node_index = {id(node): index for index, node in enumerate(nodes)}
+        node_descriptions = []
+        for node in nodes:
+            if node.operation.operation_type == atomized_model_type():
+                raise ValueError(f'Atomized models are not supported by {self.__class__.__name__}')
+            fitted_operation = node.fitted_operation
+            node_descriptions.append({
+                'operation_type': node.operation.operation_type,
+                'nodes_from': [node_index[id(parent)] for parent in node.nodes_from],
+                'parameters': self._write_record(file, node.parameters),
+                'fitted_operation': None if fitted_operation is None else self._write_record(file, fitted_operation)
+            })
+        return {'use_input_preprocessing': pipeline.use_input_preprocessing,
+                'preprocessor': self._write_record(file, pipeline.preprocessor),
+                'nodes': node_descriptions}
+
+    def save(self, pipelines: Union[Pipeline, Dict[str, Pipeline]], metadata: Optional[dict] = None):
+        """Saves fitted pipelines to the artifact.
+
+        Args:
+            pipelines: pipeline or dict of named pipelines, e.g. branches and head of the ensemble.
+            metadata: json serializable description of the model stored in the manifest.
+
+        """
+        if isinstance(pipelines, Pipeline):
+            pipelines = {'pipeline': pipelines}
+        folder = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(folder, exist_ok=True)
+        temporary_path = f'{self.path}.tmp'
+        with open(temporary_path, 'wb') as file:
+            file.write(b'\0' * ARTIFACT_HEADER.size)
+            manifest = {'version': ARTIFACT_FORMAT_VERSION,
+                        'metadata': metadata or {},
+                        'pipelines': {name: self._write_pipeline(file, pipeline)
+                                      for name, pipeline in pipelines.items()}}
+            manifest_offset = self._align(file)
+            manifest = json.dumps(manifest).encode('utf8')
+            file.write(manifest)
+            # header is written last, so an interrupted save never looks like a valid artifact
+            file.seek(0)
+            file.write(ARTIFACT_HEADER.pack(ARTIFACT_MAGIC, manifest_offset, len(manifest)))
+        os.replace(temporary_path, self.path)
+        # objects read before keep the mapping of the replaced file
+        self._buffer = None
+
+    @staticmethod
+    def is_artifact(path: str) -> bool:
+        if not os.path.isfile(path):
+            return False
+        with open(path, 'rb') as file:
+            return file.read(len(ARTIFACT_MAGIC)) == ARTIFACT_MAGIC
+
+    def read_manifest(self) -> dict:
+        with open(self.path, 'rb') as file:
+            header = file.read(ARTIFACT_HEADER.size)
+            if len(header) < ARTIFACT_HEADER.size:
+                raise ValueError(f'{self.path} is not a model artifact')
+            magic, manifest_offset, manifest_size = ARTIFACT_HEADER.unpack(header)
+            if magic != ARTIFACT_MAGIC:
+                raise ValueError(f'{self.path} is not a model artifact')
+            file.seek(manifest_offset)
+            manifest = json.loads(file.read(manifest_size))
+        if manifest['version'] != ARTIFACT_FORMAT_VERSION:
+            raise ValueError(f'Unsupported version {manifest["version"]} of the model artifact, '
+                             f'expected {ARTIFACT_FORMAT_VERSION}')
+        return manifest
+
+    def read_record(self, record: dict):
+        """Restores the object saved to the artifact with its arrays mapped to the file."""
+        if self._buffer is None:
+            with open(self.path, 'rb') as file:
+                # copy-on-write mapping lets models modify their arrays in place without touching the file
+                self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        buffer = self._buffer
+        arrays = [np.frombuffer(buffer, dtype=np.dtype(array['dtype']), count=int(np.prod(array['shape'])),
+                                offset=array['offset']).reshape(array['shape'])
+                  for array in record['arrays']]
+        stream = io.BytesIO(buffer[record['offset']:record['offset'] + record['nbytes']])
+        return _BlobUnpickler(stream, arrays).load()
+
+    def _read_pipeline(self, description: dict) -> Pipeline:
+        nodes = []
+        for node_description in description['nodes']:
+            node = _LazyPipelineNode(node_description['operation_type'],
+                                     artifact=self,
+                                     record=node_description['fitted_operation'])
+            node.parameters = self.read_record(node_description['parameters'])
+            nodes.append(node)
+        for node, node_description in zip(nodes, description['nodes']):
+            node.nodes_from = [nodes[index] for index in node_description['nodes_from']]
+        pipeline = Pipeline(nodes[0], use_input_preprocessing=description['use_input_preprocessing'])
+        pipeline.preprocessor = self.read_record(description['preprocessor'])
+        return pipeline
+
+    def load(self) -> Dict[str, Pipeline]:
+        """Loads pipelines in the order they were saved.
+
+        Returns:
+            dict of named pipelines.
+
+        """
+        manifest = self.read_manifest()
+        return {name: self._read_pipeline(description) for name, description in manifest['pipelines'].items()}
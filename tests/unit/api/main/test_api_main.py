@@ -1,10 +1,15 @@
 import warnings
+from copy import deepcopy
+from types import SimpleNamespace
 
 import numpy as np
 import pytest
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
 from matplotlib import get_backend, pyplot as plt
 
 from fedot_ind.api.main import FedotIndustrial
+from fedot_ind.api.utils.checkers_collections import DataCheck
+from fedot_ind.core.architecture.settings.computational import get_default_dtype
 from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
 
 
@@ -146,3 +151,69 @@ def test_plot_methods(fedot_industrial_classification):
     plt.switch_backend("Agg")
     warnings.filterwarnings("ignore", "Matplotlib is currently using agg")
     fedot_industrial_classification.explain()
+
+
+@pytest.fixture
+def artifact_data(industrial_models):
+    features = np.random.default_rng(0).normal(size=(30, 50))
+    target = np.digitize(features.mean(axis=1), [-0.1, 0.1])
+    input_data = DataCheck(input_data=(features, target), task='classification').check_input_data()
+    return (features, target), input_data
+
+
+def test_save_artifact_pipeline(tmp_path, artifact_data):
+    data, input_data = artifact_data
+    industrial = FedotIndustrial(problem='classification', output_folder=str(tmp_path))
+    industrial.solver = PipelineBuilder().add_node('quantile_extractor').add_node('logit').build()
+    industrial.solver.fit(input_data)
+    expected = industrial.predict(data)
+    path = industrial.save_artifact()
+
+    loaded = FedotIndustrial(problem='classification', output_folder=str(tmp_path))
+    loaded.load(path)
+
+    assert path == str(tmp_path / 'model.fedotind')
+    assert np.array_equal(loaded.predict(data), expected)
+
+
+def test_save_artifact_raf_ensemble(tmp_path, artifact_data):
+    data, input_data = artifact_data
+    branches = [PipelineBuilder().add_node('quantile_extractor').add_node(model).build() for model in ('logit', 'rf')]
+    for branch in branches:
+        branch.fit(input_data)
+    head_input = deepcopy(input_data)
+    head_input.features = np.stack([branch.predict(input_data).predict for branch in branches], axis=1)
+    head = PipelineBuilder().add_node('dt').build()
+    head.fit(head_input)
+    industrial = FedotIndustrial(problem='classification', output_folder=str(tmp_path))
+    industrial.solver = SimpleNamespace(ensemble_head=head.root_node,
+                                        ensemble_branches=[branch.root_node for branch in branches])
+    path = industrial.save_artifact(str(tmp_path / 'raf.fedotind'))
+
+    loaded = FedotIndustrial(problem='classification', output_folder=str(tmp_path))
+    loaded.load(path)
+
+    # head of the loaded ensemble is the first pipeline and branches follow it in their order
+    assert [pipeline.root_node.name for pipeline in loaded.solver] == ['dt', 'logit', 'rf']
+    assert np.allclose(loaded.predict(data), head.predict(head_input).predict)
+
+
+def test_compile_raf_ensemble(fedot_industrial_classification):
+    fedot_industrial_classification.solver = [PipelineBuilder().add_node('logit').build() for _ in range(3)]
+    with pytest.raises(ValueError):
+        fedot_industrial_classification.compile()
+
+
+def test_precision_of_instance(monkeypatch):
+    initial_dtype = get_default_dtype()
+    industrial_32 = FedotIndustrial(problem='classification', timeout=0.1, precision='float32')
+    industrial_64 = FedotIndustrial(problem='classification', timeout=0.1, precision='float64')
+    assert get_default_dtype() == initial_dtype
+
+    monkeypatch.setattr(FedotIndustrial, '_predict_raf_ensemble', lambda self: get_default_dtype())
+    data = univariate_clf_data()
+    # methods of every instance run in its own precision
+    for industrial, dtype in ((industrial_32, np.float32), (industrial_64, np.float64)):
+        industrial.solver = []
+        assert industrial.predict(data) == dtype
+    assert get_default_dtype() == initial_dtype
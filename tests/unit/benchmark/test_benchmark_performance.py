@@ -0,0 +1,69 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmark.benchmark_performance import BenchmarkPerformance
+
+
+@pytest.fixture
+def benchmark_factory(tmp_path):
+    def create(operation):
+        return BenchmarkPerformance(operations=[operation],
+                                    n_samples=[10],
+                                    series_length=[20],
+                                    n_channels=[1],
+                                    n_repeats=1,
+                                    output_dir=str(tmp_path))
+    return create
+
+
+def test_run_and_compare_with_baseline(benchmark_factory, tmp_path):
+    benchmark = benchmark_factory('quantile_extractor')
+    results = benchmark.run()
+    comparison = benchmark.compare_with_baseline(results, str(tmp_path / 'performance_report.json'))
+
+    assert os.path.isfile(tmp_path / 'performance_report.csv')
+    assert len(results) == 1
+    assert results['error'].isna().all()
+    assert (results['fit_time'] > 0).all()
+    # times are rounded in the json report
+    assert np.allclose(comparison['fit_time_ratio'], 1)
+    assert not comparison['regression'].any()
+
+
+def test_compare_failed_cases_with_baseline(benchmark_factory, tmp_path):
+    benchmark = benchmark_factory('unknown_extractor')
+    results = benchmark.run()
+    comparison = benchmark.compare_with_baseline(results, str(tmp_path / 'performance_report.json'))
+
+    assert results['error'].notna().all()
+    assert comparison['fit_time_ratio'].isna().all()
+    assert not comparison['regression'].any()
+
+
+@pytest.mark.parametrize('peak_rss_mb, regression', [(70., True), (50.5, False), (10., False)])
+def test_compare_memory_with_baseline(benchmark_factory, tmp_path, peak_rss_mb, regression):
+    benchmark = benchmark_factory('quantile_extractor')
+    case = {'operation': 'quantile_extractor', 'n_samples': 10, 'series_length': 20, 'n_channels': 1,
+            'fit_time': 1., 'transform_time': 1.}
+    with open(tmp_path / 'baseline_report.json', 'w') as file:
+        json.dump({'results': [{**case, 'peak_rss_mb': 50.}]}, file)
+    results = pd.DataFrame([{**case, 'peak_rss_mb': peak_rss_mb, 'throughput': 10., 'error': None}])
+    comparison = benchmark.compare_with_baseline(results, str(tmp_path / 'baseline_report.json'))
+
+    assert np.allclose(comparison['peak_rss_mb_ratio'], peak_rss_mb / 50)
+    assert comparison['regression'].tolist() == [regression]
+
+
+def test_throughput_of_instant_transform(benchmark_factory, monkeypatch):
+    benchmark = benchmark_factory('quantile_extractor')
+    monkeypatch.setattr(benchmark, '_run_once', lambda operation, input_data: {'fit_time': 0.1,
+                                                                               'transform_time': 0.,
+                                                                               'peak_rss_mb': 0.})
+    result = benchmark.evaluate_case('quantile_extractor', 10, 20, 1)
+
+    assert result['error'] is None
+    assert np.isnan(result['throughput'])
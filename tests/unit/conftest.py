@@ -0,0 +1,26 @@
+import pytest
+from fedot.core.operations.operation import Operation
+from fedot.core.repository.operation_types_repository import OperationTypesRepository
+
+from fedot_ind.core.repository.industrial_implementations.abstract import predict, predict_for_fit, \
+    predict_operation
+from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
+
+
+@pytest.fixture
+def industrial_models(monkeypatch):
+    """Runs the test with the industrial operations, whatever the other tests left patched.
+
+    Loading of the industrial models patches predict of operations and switches to the industrial repositories
+    for good, both are reverted after the test so they don't leak to the other tests.
+    """
+    repositories = {operation_type: dict(OperationTypesRepository.__repository_dict__[operation_type])
+                    for operation_type in ('model', 'data_operation')}
+    monkeypatch.setattr(Operation, '_predict', predict_operation)
+    monkeypatch.setattr(Operation, 'predict', predict)
+    monkeypatch.setattr(Operation, 'predict_for_fit', predict_for_fit)
+    with IndustrialModels():
+        yield
+    for operation_type, repository in repositories.items():
+        OperationTypesRepository.__repository_dict__[operation_type] = repository
+        OperationTypesRepository.assign_repo(operation_type, repository['file'])
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from fedot.core.operations.operation import Operation
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+
+from fedot_ind.api.utils.checkers_collections import DataCheck
+from fedot_ind.core.architecture.pipelines.compiled_pipeline import CompiledPipeline
+from fedot_ind.core.repository.industrial_implementations.abstract import predict, predict_for_fit, \
+    predict_operation
+from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
+from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
+
+
+@pytest.fixture
+def fitted_pipeline(monkeypatch):
+    # industrial strategies get output mode from Operation.predict, which is patched by setup_repository,
+    # the patch is reverted after the test so it doesn't leak to the other tests
+    monkeypatch.setattr(Operation, '_predict', predict_operation)
+    monkeypatch.setattr(Operation, 'predict', predict)
+    monkeypatch.setattr(Operation, 'predict_for_fit', predict_for_fit)
+    train_data, test_data = TimeSeriesDatasetsGenerator(num_samples=40,
+                                                        max_ts_len=50,
+                                                        binary=True,
+                                                        test_size=0.5).generate_data()
+    with IndustrialModels():
+        train_input = DataCheck(input_data=train_data, task='classification').check_input_data()
+        test_input = DataCheck(input_data=test_data, task='classification').check_input_data()
+        pipeline = PipelineBuilder().add_node('quantile_extractor').add_node('logit').build()
+        pipeline.fit(train_input)
+        yield pipeline, test_input
+
+
+def test_compiled_pipeline_matches_pipeline(fitted_pipeline):
+    pipeline, test_input = fitted_pipeline
+    expected = pipeline.predict(test_input, output_mode='labels').predict
+    compiled = CompiledPipeline(pipeline, problem='classification', input_shape=test_input.features.shape[1:])
+    predict = compiled.predict(test_input.features)
+
+    assert np.array_equal(np.ravel(predict), np.ravel(expected))
+
+
+def test_compiled_pipeline_labels_then_probs(fitted_pipeline):
+    pipeline, test_input = fitted_pipeline
+    expected = pipeline.predict(test_input, output_mode='probs').predict
+    compiled = CompiledPipeline(pipeline, problem='classification', input_shape=test_input.features.shape[1:])
+    compiled.predict(test_input.features)
+    probs = compiled.predict_proba(test_input.features)
+    root_index = len(compiled.nodes) - 1
+
+    assert np.allclose(np.ravel(probs), np.ravel(expected))
+    # strategies which read output mode set on init must not be reused across modes
+    assert compiled.strategies[root_index, 'labels'].output_mode == 'labels'
+    assert compiled.strategies[root_index, 'probs'].output_mode == 'probs'
+
+
+def test_compiled_pipeline_keeps_original_pipeline(fitted_pipeline):
+    pipeline, test_input = fitted_pipeline
+    strategies = [node.operation.__dict__.get('_eval_strategy') for node in pipeline.nodes]
+    compiled = CompiledPipeline(pipeline, problem='classification', input_shape=test_input.features.shape[1:])
+    compiled.predict_proba(test_input.features)
+
+    assert [node.operation.__dict__.get('_eval_strategy') for node in pipeline.nodes] == strategies
+
+
+def test_compiled_pipeline_single_series(fitted_pipeline):
+    pipeline, test_input = fitted_pipeline
+    compiled = CompiledPipeline(pipeline, problem='classification')
+    single_series = test_input.features[0, 0]
+    first_predict = compiled.predict(single_series)
+    second_predict = compiled.predict(single_series)
+
+    assert np.ravel(first_predict).shape[0] == 1
+    assert np.array_equal(first_predict, second_predict)
+
+
+def test_compiled_pipeline_wrong_shape(fitted_pipeline):
+    pipeline, test_input = fitted_pipeline
+    compiled = CompiledPipeline(pipeline, problem='classification', input_shape=test_input.features.shape[1:])
+    with pytest.raises(ValueError):
+        compiled.predict(np.random.rand(1, 1, test_input.features.shape[-1] + 1))
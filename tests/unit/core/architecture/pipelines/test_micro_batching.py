@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from fedot_ind.core.architecture.pipelines.micro_batching import MicroBatchPredictor
+
+
+class SumModel:
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, features):
+        self.batch_sizes.append(features.shape[0])
+        return features.sum(axis=(1, 2))
+
+    def predict_proba(self, features):
+        return np.stack([features.min(axis=(1, 2)), features.max(axis=(1, 2))], axis=1)
+
+
+def test_micro_batching_results_per_request():
+    model = SumModel()
+    series = [np.random.rand(30) for _ in range(50)]
+    with MicroBatchPredictor(model, max_batch_size=16, max_latency=0.05) as batcher:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            predictions = list(executor.map(batcher.predict, series))
+        metrics = batcher.metrics
+
+    for ts, predict in zip(series, predictions):
+        assert np.isclose(predict[0], ts.sum())
+    assert max(model.batch_sizes) <= 16
+    assert sum(model.batch_sizes) == len(series)
+    assert metrics['processed_requests'] == len(series)
+    assert 0 < metrics['mean_batch_fill'] <= 1
+
+
+def test_micro_batching_probs():
+    model = SumModel()
+    with MicroBatchPredictor(model, max_batch_size=4, output_mode='probs') as batcher:
+        probs = batcher.predict(np.random.rand(3, 1, 20))
+    assert probs.shape == (3, 2)
+
+
+def test_micro_batching_not_started():
+    batcher = MicroBatchPredictor(SumModel())
+    with pytest.raises(RuntimeError):
+        batcher.submit(np.random.rand(10))
+
+
+class ScalarModel:
+    def predict(self, features):
+        return features.sum()
+
+
+def test_micro_batching_failed_batch():
+    with MicroBatchPredictor(ScalarModel(), max_batch_size=4) as batcher:
+        with pytest.raises(ValueError):
+            batcher.predict(np.random.rand(10), timeout=5)
+        batcher.model = SumModel()
+        batcher.predict_method = batcher.model.predict
+        # worker survives the failed batch and serves the next requests
+        assert batcher.predict(np.ones(10), timeout=5)[0] == 10
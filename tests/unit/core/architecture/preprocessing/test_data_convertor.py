@@ -1,7 +1,10 @@
+import numpy as np
+import pandas as pd
 import pytest
 from fedot.core.data.data import InputData
 
-from fedot_ind.core.architecture.preprocessing.data_convertor import FedotConverter
+from fedot_ind.core.architecture.preprocessing.data_convertor import DataConverter, FedotConverter, \
+    convert_to_dense_array
 from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
 
 
@@ -17,3 +20,52 @@ def test_fedot_converter(data):
     converter = FedotConverter(data=train_data)
 
     assert isinstance(converter.input_data, InputData)
+
+
+def test_convert_nested_to_dense_array():
+    nested = pd.DataFrame({'dim_0': [pd.Series(np.random.rand(10)) for _ in range(5)],
+                           'dim_1': [pd.Series(np.random.rand(10)) for _ in range(5)]})
+    dense = convert_to_dense_array(nested, dtype=np.float32)
+
+    assert dense.shape == (5, 2, 10)
+    assert dense.dtype == np.float32
+    assert dense.flags['C_CONTIGUOUS']
+    assert np.allclose(dense, np.array(nested.values.tolist()))
+
+
+def test_convert_unequal_length_to_dense_array():
+    nested = pd.DataFrame({'dim_0': [pd.Series([1., 2.]), pd.Series([1., 2., 3.])]})
+    dense = convert_to_dense_array(nested)
+
+    assert dense.shape == (2, 1, 3)
+    assert np.isnan(dense[0, 0, 2])
+
+
+def test_convert_dense_array_without_copy(tmp_path):
+    array = np.random.rand(5, 2, 10)
+    memmap = np.memmap(tmp_path / 'features.dat', dtype=float, mode='w+', shape=(5, 10))
+
+    assert convert_to_dense_array(array) is array
+    assert convert_to_dense_array(array, dtype=float) is array
+    assert convert_to_dense_array(memmap) is memmap
+
+
+def test_convert_list_cells_to_dense_array():
+    nested = pd.DataFrame({'dim_0': [[1., 2., 3.], [4., 5., 6.]]})
+    dense = convert_to_dense_array(nested)
+
+    assert dense.shape == (2, 1, 3)
+    assert np.array_equal(dense[:, 0], [[1., 2., 3.], [4., 5., 6.]])
+
+
+def test_convert_nested_cells_to_dense_array():
+    nested = pd.DataFrame({'dim_0': [np.ones((2, 3)), np.ones((2, 3))]})
+    with pytest.raises(ValueError):
+        convert_to_dense_array(nested)
+
+
+def test_data_converter_to_dense_array():
+    features = np.random.rand(5, 2, 10)
+    input_data = InputData(idx=np.arange(5), features=features, target=None, task=None, data_type=None)
+
+    assert DataConverter(data=input_data).convert_to_monad_data() is features
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+import torch
+from joblib import delayed, Parallel
+
+from fedot_ind.core.architecture.settings.computational import allocate_workers, compute_budget, \
+    default_precision, delayed_in_precision, get_core_budget, get_default_dtype, set_core_budget, set_default_dtype, \
+    to_default_dtype
+from fedot_ind.core.operation.decomposition.matrix_decomposition.power_iteration_decomposition import \
+    RSVDDecomposition
+from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
+
+
+def test_default_precision_context():
+    initial_dtype = get_default_dtype()
+    with default_precision('float32'):
+        assert get_default_dtype() == np.float32
+        array = np.random.rand(10)
+        assert to_default_dtype(array).dtype == np.float32
+        array_32 = array.astype(np.float32)
+        assert to_default_dtype(array_32) is array_32
+    assert get_default_dtype() == initial_dtype
+
+
+def test_precision_of_non_float_arrays():
+    with default_precision('float32'):
+        for array in (np.arange(5), np.array([True, False]), np.arange(3) * 1j):
+            assert to_default_dtype(array) is array
+
+
+def test_precision_in_process_workers(core_budget):
+    with default_precision('float32'), compute_budget(2) as n_jobs:
+        worker_dtypes = Parallel(n_jobs=n_jobs)(delayed_in_precision(get_default_dtype)() for _ in range(4))
+    assert all(dtype == np.float32 for dtype in worker_dtypes)
+
+    with compute_budget(2) as n_jobs:
+        worker_dtypes = Parallel(n_jobs=n_jobs)(delayed_in_precision(get_default_dtype)() for _ in range(4))
+    assert all(dtype == get_default_dtype() for dtype in worker_dtypes)
+
+
+def test_unsupported_precision():
+    with pytest.raises(ValueError):
+        set_default_dtype('int32')
+
+
+@pytest.mark.parametrize('approximation', [True, False])
+def test_float32_data_path(approximation):
+    time_series = np.sin(np.arange(200) / 5) + np.random.normal(scale=0.1, size=200)
+    with default_precision('float32'):
+        trajectory_matrix = HankelMatrix(time_series=time_series, window_size=40).trajectory_matrix
+        U, S, V = RSVDDecomposition().rsvd(tensor=trajectory_matrix, approximation=approximation)
+    assert trajectory_matrix.dtype == np.float32
+    assert all(component.dtype == np.float32 for component in (U, S, V))
+
+
+@pytest.fixture
+def core_budget():
+    initial_budget = get_core_budget()
+    set_core_budget(8)
+    yield
+    set_core_budget(initial_budget)
+
+
+def test_allocate_workers(core_budget):
+    assert allocate_workers() == (8, 1)
+    assert allocate_workers(2) == (2, 4)
+    assert allocate_workers(100) == (8, 1)
+    with pytest.raises(ValueError):
+        set_core_budget(0)
+
+
+@pytest.mark.parametrize('prefer', ['processes', 'threads'])
+def test_compute_budget(core_budget, prefer):
+    torch_threads = torch.get_num_threads()
+    with compute_budget(4, prefer=prefer) as n_jobs:
+        assert n_jobs == 4
+        result = Parallel(n_jobs=n_jobs)(delayed(np.square)(value) for value in range(10))
+        if prefer == 'threads':
+            assert torch.get_num_threads() == 2
+    assert result == [value ** 2 for value in range(10)]
+    assert torch.get_num_threads() == torch_threads
@@ -1,7 +1,8 @@
 import numpy as np
 import pytest
+import torch
 
-from fedot_ind.core.metrics.loss.soft_dtw import SoftDTWLoss
+from fedot_ind.core.metrics.loss.soft_dtw import SoftDTW, SoftDTWLoss
 
 
 @pytest.fixture()
@@ -24,3 +25,27 @@ def test_sdtw_return_all(sample_data):
     v, p = metric.sdtw(gamma=0.7, return_all=True)
     assert isinstance(v, np.ndarray)
     assert isinstance(p, np.ndarray)
+
+
+@pytest.mark.parametrize('bandwidth', [None, 3])
+def test_batched_soft_dtw_matches_single(bandwidth):
+    x, y = torch.randn(4, 10, 1, dtype=torch.float64), torch.randn(4, 12, 1, dtype=torch.float64)
+    loss = SoftDTW(gamma=0.7, bandwidth=bandwidth, reduction='none')(x, y)
+    assert loss.shape == (4,)
+    if bandwidth is None:
+        for sample in range(4):
+            metric = SoftDTWLoss(X=x[sample].numpy(), Y=y[sample].numpy())
+            assert np.isclose(loss[sample].item(), metric.sdtw(gamma=0.7))
+
+
+@pytest.mark.parametrize('bandwidth', [None, 3])
+def test_batched_soft_dtw_gradient(bandwidth):
+    x = torch.randn(3, 8, 2, dtype=torch.float64, requires_grad=True)
+    y = torch.randn(3, 9, 2, dtype=torch.float64)
+    assert torch.autograd.gradcheck(lambda inputs: SoftDTW(gamma=0.5, bandwidth=bandwidth)(inputs, y), (x,))
+
+
+def test_soft_dtw_divergence():
+    x = torch.randn(2, 15)
+    loss = SoftDTW(gamma=0.1, normalize=True, reduction='none')(x, x)
+    assert torch.allclose(loss, torch.zeros(2), atol=1e-4)
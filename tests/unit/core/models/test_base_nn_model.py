@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+import torch
+
+from fedot_ind.core.models.nn.network_impl.base_nn_model import BaseNeuralModel
+from fedot_ind.core.models.nn.network_impl.explainable_convolution_model import XCM, XCModel
+from fedot_ind.core.models.nn.network_impl.inception import InceptionTime, InceptionTimeModel
+from fedot_ind.core.models.nn.network_impl.omni_scale import OmniScaleCNN, OmniScaleModel
+from fedot_ind.core.models.nn.network_impl.patch_tst import PatchTST, PatchTSTModel
+from fedot_ind.core.models.nn.network_impl.resnet import ResNet, ResNetModel
+from fedot_ind.core.models.nn.network_impl.tst import TST, TSTModel
+
+
+def fitted_inception():
+    model = InceptionTimeModel({})
+    model.model = InceptionTime(input_dim=2, output_dim=3)
+    return model, (2, 50)
+
+
+def fitted_omniscale():
+    model = OmniScaleModel({})
+    model.model = OmniScaleCNN(input_dim=2, output_dim=3, seq_len=50)
+    return model, (2, 50)
+
+
+def fitted_resnet():
+    model = ResNetModel({})
+    model.model = ResNet(input_dim=3, output_dim=3, model_name='ResNet18')
+    return model, (3, 32, 32)
+
+
+def fitted_xcm():
+    model = XCModel({})
+    model.model = XCM(input_dim=2, output_dim=3, seq_len=50)
+    return model, (2, 50)
+
+
+def fitted_tst():
+    model = TSTModel({})
+    model.model = TST(input_dim=2, output_dim=3, seq_len=50)
+    return model, (2, 50)
+
+
+def fitted_patch_tst():
+    model = PatchTSTModel({})
+    # forecaster is applied to windows of the patch length
+    model.model_list = [PatchTST(input_dim=1, output_dim=None, seq_len=50, pred_dim=10, patch_len=16)]
+    return model, (1, 16)
+
+
+@pytest.fixture
+def fitted_model():
+    model = BaseNeuralModel()
+    model.model = InceptionTime(input_dim=2, output_dim=3).eval()
+    model.input_shape = (2, 50)
+    return model
+
+
+@pytest.mark.parametrize('quantize', [False, True])
+@pytest.mark.parametrize('network', [fitted_inception,
+                                     fitted_omniscale,
+                                     fitted_resnet,
+                                     fitted_xcm,
+                                     fitted_tst,
+                                     fitted_patch_tst])
+def test_export_parity(network, quantize, tmp_path):
+    torch.manual_seed(0)
+    model, input_shape = network()
+    path = str(tmp_path / 'model.pt')
+    model.export(path=path, quantize=quantize, example_input=torch.rand(2, *input_shape))
+    exported = torch.jit.load(path)
+    features = np.random.RandomState(0).rand(8, *input_shape)
+    parity = model.check_export_parity(exported, features)
+
+    assert exported(torch.rand(5, *input_shape)).shape[0] == 5
+    # int8 weights shift raw outputs, but must not change predicted classes
+    assert parity['label_agreement'] == 1
+    if not quantize:
+        assert parity['is_close']
+
+
+def test_export_parity_keeps_training_mode(fitted_model):
+    exported = fitted_model.export()
+    fitted_model.model.train()
+    fitted_model.check_export_parity(exported, np.random.rand(4, 2, 50))
+
+    assert fitted_model.model.training
+    assert all(module.training for module in fitted_model.model.modules())
+
+
+def test_export_default_example_input(fitted_model):
+    exported = fitted_model.export()
+
+    assert exported(torch.rand(5, 2, 50)).shape == (5, 3)
+
+
+def test_export_unknown_method(fitted_model):
+    with pytest.raises(ValueError):
+        fitted_model.export(method='onnx')
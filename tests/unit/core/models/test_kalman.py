@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from fedot_ind.core.models.detection.probalistic.kalman import BatchUnscentedKalmanFilter, UnscentedKalmanFilter
+from fedot_ind.core.models.detection.probalistic.sigma import MerweScaledSigmaPoints
+
+TRANSITION = np.array([[1., 1.], [0., 1.]])
+
+
+def transition_fn(x):
+    return x @ TRANSITION.T
+
+
+class LinearTransition:
+    """Known state transition in place of the regression model fitted by UnscentedKalmanFilter."""
+
+    @staticmethod
+    def predict(state):
+        return transition_fn(state)
+
+
+class IdentityScaler:
+    @staticmethod
+    def transform(x):
+        return x
+
+    @staticmethod
+    def inverse_transform(x):
+        return x
+
+
+@pytest.fixture
+def measurements():
+    rng = np.random.RandomState(42)
+    velocity = rng.normal(scale=0.3, size=(8, 60))
+    position = np.cumsum(velocity, axis=1)
+    states = np.stack([position, velocity], axis=-1)
+    return states + rng.normal(scale=0.5, size=states.shape)
+
+
+def single_series_residuals(series, Q, R):
+    ukf = UnscentedKalmanFilter(model_hyperparams={})
+    ukf._init_kalman_params(np.zeros((2, 1)))
+    ukf.sigma_distribution = ukf.sigma_points(ukf.input_dim)
+    ukf.sigmas_f = np.zeros((ukf.sigma_distribution.num_sigmas(), ukf.input_dim))
+    ukf.state_transition_matrix = LinearTransition()
+    ukf.measurement_function = IdentityScaler()
+    ukf.process_uncertainty, ukf.measurement_uncertainty = Q, R
+    ukf.state_mean, ukf.uncertainty_covariance = np.array([series[0, 0], 0.]), 100. * np.eye(2)
+    ukf.state = ukf.state_mean
+    return np.array([ukf._predict(z.reshape(-1, 1))[0].ravel() for z in series])
+
+
+def test_batch_ukf_matches_single_series(measurements):
+    Q, R = 0.1 * np.eye(2), 0.25 * np.eye(2)
+    batch_filter = BatchUnscentedKalmanFilter(dim_x=2, dim_z=2,
+                                              transition_fn=transition_fn,
+                                              process_uncertainty=Q,
+                                              measurement_uncertainty=R)
+    batch_filter.initialize(np.stack([measurements[:, 0, 0], np.zeros(len(measurements))], axis=1))
+    residuals, states = batch_filter.filter(measurements)
+
+    assert residuals.shape == measurements.shape
+    assert states.shape == measurements.shape
+    for series, batch_residual in zip(measurements, residuals):
+        assert np.allclose(single_series_residuals(series, Q, R), batch_residual, atol=1e-6)
+
+
+def test_batch_sigma_points():
+    points = MerweScaledSigmaPoints(3, alpha=.1, beta=2., kappa=-1)
+    x = np.random.rand(4, 3)
+    A = np.random.rand(4, 3, 3)
+    P = A @ np.swapaxes(A, 1, 2) + np.eye(3)
+    batch_sigmas = points.batch_sigma_points(x, P)
+    for i in range(4):
+        assert np.allclose(batch_sigmas[i], points.sigma_points(x[i], P[i]))
@@ -4,6 +4,7 @@ from fedot.core.data.data import OutputData
 
 from fedot_ind.api.utils.data import init_input_data
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.architecture.settings.computational import default_precision
 from fedot_ind.core.models.quantile.quantile_extractor import QuantileExtractor
 from fedot_ind.core.repository.constanst_repository import STAT_METHODS, STAT_METHODS_GLOBAL
 from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
@@ -61,3 +62,21 @@ def test_extract_features(quantile_extractor):
     assert train_features is not None
     assert isinstance(train_features, pd.DataFrame)
     assert len(FEATURES) == train_features.shape[1]
+
+
+def test_parallel_extract(quantile_extractor, input_data):
+    features = input_data.features
+    sequential = quantile_extractor._transform(input_data)
+    first_features = quantile_extractor.generate_features_from_ts(features[0]).features
+    output_shape = (len(features),) + np.shape(first_features)
+    parallel = quantile_extractor._parallel_extract(features, first_features, output_shape, n_jobs=2)
+    assert np.allclose(np.nan_to_num(parallel.reshape(sequential.shape), posinf=0, neginf=0), sequential)
+
+
+def test_parallel_extract_precision(quantile_extractor, input_data):
+    features = input_data.features
+    with default_precision('float32'):
+        first_features = quantile_extractor.generate_features_from_ts(features[0]).features
+        output_shape = (len(features),) + np.shape(first_features)
+        parallel = quantile_extractor._parallel_extract(features, first_features, output_shape, n_jobs=2)
+    assert parallel.dtype == np.float32
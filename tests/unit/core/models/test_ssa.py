@@ -1,14 +1,20 @@
+import pytest
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.pipelines.pipeline_builder import PipelineBuilder
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
+from scipy.linalg import hankel
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.models.ts_forecasting.ssa_forecaster import SSAForecasterImplementation, \
+    linear_recurrent_forecast, lrr_coefficients
 from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
 
 
-def test_ssa():
+@pytest.mark.parametrize('mode', ['lrr', 'pipeline'])
+def test_ssa(mode):
     time_series = np.random.normal(size=30)
     task = Task(TaskTypesEnum.ts_forecasting,
                 TsForecastingParams(forecast_length=1))
@@ -20,7 +26,81 @@ def test_ssa():
     train_data, test_data = train_test_data_setup(train_input)
 
     with IndustrialModels():
-        pipeline = PipelineBuilder().add_node('ssa_forecaster').build()
+        pipeline = PipelineBuilder().add_node('ssa_forecaster', params={'mode': mode}).build()
         pipeline.fit(train_data)
         ssa_predict = np.ravel(pipeline.predict(test_data).predict)
     assert ssa_predict is not None
+
+
+def test_lrr_forecast():
+    time = np.arange(120)
+    series = np.stack([np.sin(time / 7), 2 * np.cos(time / 3)])
+    history, future = series[:, :100], series[:, 100:]
+    eigenvectors = []
+    for ts in history:
+        U, _, _ = np.linalg.svd(hankel(ts[:30], ts[29:]), full_matrices=False)
+        eigenvectors.append(U[:, :2])
+    coefficients = lrr_coefficients(np.stack(eigenvectors))
+    forecast = linear_recurrent_forecast(history, coefficients, horizon=20)
+
+    assert coefficients.shape == (2, 29)
+    assert np.allclose(forecast, future, atol=1e-6)
+
+
+@pytest.fixture
+def seasonal_series():
+    time = np.arange(300)
+    noise = np.random.RandomState(0).normal(scale=0.05, size=time.size)
+    return np.sin(time / 6) + 0.5 * np.cos(time / 15) + noise
+
+
+def rolling_forecasts(model, time_series, ends):
+    task = Task(TaskTypesEnum.ts_forecasting, TsForecastingParams(forecast_length=5))
+    forecasts = []
+    for end in ends:
+        window = InputData(idx=np.arange(end),
+                           features=time_series[:end],
+                           target=time_series[:end],
+                           task=task,
+                           data_type=DataTypesEnum.ts)
+        forecasts.append(np.ravel(model.predict(window).predict))
+    return np.array(forecasts)
+
+
+def test_ssa_warm_start(seasonal_series):
+    predictions, warm_start_calls = {}, []
+    for warm_start in [True, False]:
+        # randomized decomposition uses global random state
+        np.random.seed(0)
+        model = SSAForecasterImplementation(OperationParameters(window_size_method='hac',
+                                                                mode='lrr',
+                                                                warm_start=warm_start))
+        model.horizon = 5
+        warm_start_svd = model._warm_start_svd
+
+        def tracked_warm_start_svd(trajectory_matrix):
+            warm_start_calls.append(warm_start_svd(trajectory_matrix))
+            return warm_start_calls[-1]
+
+        model._warm_start_svd = tracked_warm_start_svd
+        predictions[warm_start] = rolling_forecasts(model, seasonal_series, range(200, 300, 10))
+        assert model._previous_basis is not None
+
+    assert len(warm_start_calls) == 9 and all(components is not None for components in warm_start_calls)
+    assert np.allclose(predictions[True], predictions[False], atol=1e-4)
+
+
+def test_ssa_warm_start_drift(seasonal_series):
+    np.random.seed(0)
+    model = SSAForecasterImplementation(OperationParameters(window_size_method='hac', mode='lrr', warm_start=True))
+    model.horizon = 5
+    rolling_forecasts(model, seasonal_series, [200])
+    window_length, rank = model._previous_basis.shape
+    # new weaker component barely rotates the subspace found by iteration from the previous basis,
+    # but it can't be reconstructed with the previous basis
+    time = np.arange(110, 210)
+    new_window = seasonal_series[time] + 0.2 * np.sin(time / 2.5)
+    trajectory_matrix = hankel(new_window[:window_length], new_window[window_length - 1:])
+
+    assert model._warm_start_svd(trajectory_matrix) is None
+    assert model._previous_basis.shape[1] == rank
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from scipy.linalg import hankel
+
+from fedot_ind.core.models.detection.subspaces.sst import SingularSpectrumTransformation
+
+
+@pytest.fixture
+def sst_params():
+    return {'n_components': 2,
+            'window_length': 30,
+            'trajectory_window_length': 10,
+            'dynamic_mode': True,
+            'delay_lag': 10,
+            'n_iterations': 30,
+            'refresh_period': 1}
+
+
+@pytest.fixture
+def time_series():
+    time = np.arange(400)
+    series = np.concatenate([np.sin(time[:200] / 5), 2 * np.sin(time[200:] / 2)])
+    return series + np.random.RandomState(0).normal(scale=0.01, size=series.size)
+
+
+def exact_score(series, t, params):
+    n_rows = params['trajectory_window_length']
+    window, lag = params['window_length'], params['delay_lag']
+
+    def left_subspace(segment):
+        u, _, _ = np.linalg.svd(hankel(segment[:n_rows], segment[n_rows - 1:]), full_matrices=False)
+        return u[:, :params['n_components']]
+
+    u_test = left_subspace(series[t - window + 1:t + 1])
+    u_history = left_subspace(series[t - lag - window + 1:t - lag + 1])
+    return 1 - np.linalg.svd(u_test.T @ u_history, compute_uv=False)[0]
+
+
+def test_sst_update_matches_exact_scores(sst_params, time_series):
+    detector = SingularSpectrumTransformation(sst_params)
+    residuals = np.concatenate([detector.update(chunk) for chunk in np.array_split(time_series, 7)])
+    assert residuals.shape == time_series.shape
+
+    first_score = sst_params['window_length'] + sst_params['delay_lag'] - 1
+    scores = [exact_score(time_series, t, sst_params) for t in range(first_score, time_series.size)]
+    assert np.all(np.isnan(residuals[:first_score + 1]))
+    assert np.allclose(residuals[first_score + 1:], np.diff(scores), atol=1e-4)
+
+
+def test_sst_update_matches_offline_dynamic_mode(sst_params, time_series):
+    offline_detector = SingularSpectrumTransformation(sst_params)
+    history, current = offline_detector._fit(time_series)
+    offline_residuals = offline_detector._predict(current, history)
+    residuals = SingularSpectrumTransformation(sst_params).update(time_series)
+
+    # offline scores start one point later than the streaming ones
+    assert np.allclose(residuals[-len(offline_residuals):], offline_residuals, atol=1e-4)
+
+
+def test_sst_update_detects_change_point(sst_params, time_series):
+    sst_params.update({'n_iterations': 1, 'refresh_period': 100})
+    detector = SingularSpectrumTransformation(sst_params)
+    residuals = detector.partial_fit(time_series[:100]).update(time_series[100:])
+    change_idx = 100 + np.nanargmax(np.abs(residuals))
+    assert 190 <= change_idx <= 250
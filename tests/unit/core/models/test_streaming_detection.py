@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from fedot_ind.core.models.detection.streaming import StreamingDetector, StreamingFunctionalPCADetector, \
+    StreamingKalmanDetector, StreamingSST, stream_scores
+
+
+def noisy_sine():
+    time = np.arange(600)
+    series = np.sin(time / 4)
+    series[400:420] += 3
+    return series + np.random.RandomState(1).normal(scale=0.05, size=series.size)
+
+
+@pytest.fixture
+def time_series():
+    return noisy_sine()
+
+
+def sst_detector():
+    return StreamingSST({'n_components': 2,
+                         'window_length': 30,
+                         'trajectory_window_length': 10,
+                         'dynamic_mode': True,
+                         'delay_lag': 10})
+
+
+def kalman_detector():
+    return StreamingKalmanDetector(n_channels=1, model_hyperparams={'process_uncertainty': 0.1,
+                                                                    'measurement_uncertainty': 0.1})
+
+
+def fpca_detector():
+    return StreamingFunctionalPCADetector.fit(noisy_sine()[:300], window_length=20,
+                                              model_hyperparams={'n_components': 3,
+                                                                 'regularization': None,
+                                                                 'basis_function': None})
+
+
+@pytest.mark.parametrize('detector_factory', [sst_detector, kalman_detector, fpca_detector])
+def test_streaming_scores_do_not_depend_on_chunks(detector_factory, time_series):
+    scores_small_chunks = stream_scores(detector_factory(), time_series, chunk_size=7)
+    scores_big_chunks = stream_scores(detector_factory(), time_series, chunk_size=250)
+
+    assert scores_small_chunks.shape == time_series.shape
+    assert np.allclose(scores_small_chunks, scores_big_chunks, equal_nan=True, atol=1e-8)
+
+
+@pytest.mark.parametrize('detector_factory', [sst_detector, kalman_detector, fpca_detector])
+def test_streaming_checkpoint(detector_factory, time_series, tmp_path):
+    detector = detector_factory()
+    detector.update(time_series[:350])
+    checkpoint = str(tmp_path / 'state.npz')
+    detector.save_state(checkpoint)
+    expected = detector.update(time_series[350:])
+
+    restored = detector_factory().load_state(checkpoint)
+    assert np.allclose(restored.update(time_series[350:]), expected, equal_nan=True)
+
+
+def test_streaming_fpca_restored_without_fit(time_series, tmp_path):
+    detector = fpca_detector()
+    detector.update(time_series[:350])
+    checkpoint = str(tmp_path / 'state.npz')
+    detector.save_state(checkpoint)
+    expected = detector.update(time_series[350:])
+
+    restored = StreamingFunctionalPCADetector().load_state(checkpoint)
+    assert np.allclose(restored.update(time_series[350:]), expected, equal_nan=True)
+
+
+def test_streaming_kalman_initial_state(time_series, tmp_path):
+    detector = kalman_detector()
+    checkpoint = str(tmp_path / 'state.npz')
+    detector.save_state(checkpoint)
+    expected = detector.update(time_series)
+
+    restored = StreamingKalmanDetector(n_channels=1).load_state(checkpoint)
+    assert set(detector.get_state()) == set(restored.get_state())
+    assert np.allclose(restored.update(time_series), expected)
+
+
+def test_streaming_fpca_finds_anomaly(time_series):
+    scores = stream_scores(fpca_detector(), time_series, chunk_size=50)
+    assert 400 <= np.nanargmax(scores[300:]) + 300 < 440
+
+
+def test_streaming_detector_is_abstract():
+    with pytest.raises(TypeError):
+        StreamingDetector()
@@ -0,0 +1,23 @@
+import numpy as np
+
+from fedot_ind.core.operation.filtration.feature_filtration import FeatureFilter
+
+
+def test_group_components():
+    feature_filter = FeatureFilter()
+    feature_filter._init_params()
+    time = np.linspace(0, 10, 200)
+    trend, harmonic, noise = time, np.sin(5 * time), np.random.normal(size=200)
+    # two noisy copies of the harmonic must be merged into one group
+    sample = np.stack([trend,
+                       harmonic + np.random.normal(scale=0.1, size=200),
+                       noise,
+                       harmonic + np.random.normal(scale=0.1, size=200)])
+    grouped = feature_filter._group_components(np.stack([sample, sample]))
+
+    assert len(grouped) == 2
+    assert grouped[0].shape == (3, 200)
+    assert np.allclose(grouped[0][0], trend)
+    assert np.allclose(grouped[0][1], sample[1] + sample[3])
+    assert np.allclose(grouped[0][2], noise)
+    assert np.allclose(feature_filter._compute_component_corr(sample), grouped[1])
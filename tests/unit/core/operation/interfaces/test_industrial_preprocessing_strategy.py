@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from fedot.core.data.data import InputData
+from fedot.core.operations.operation_parameters import OperationParameters
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+from fedot_ind.core.operation.interfaces.industrial_preprocessing_strategy import MultiDimPreprocessingStrategy
+from fedot_ind.core.operation.transformation.basis.fourier import FourierBasisImplementation
+from fedot_ind.core.operation.transformation.basis.wavelet import WaveletBasisImplementation
+
+
+class ChannelCenteringOperation:
+    def __init__(self, params=None):
+        self.mean = None
+
+    def fit(self, input_data):
+        self.mean = input_data.features.mean()
+        return self
+
+    def transform(self, input_data):
+        return input_data.features - self.mean
+
+
+class FusableCenteringOperation(ChannelCenteringOperation):
+    channel_fusable = True
+    n_calls = 0
+
+    def fit(self, input_data):
+        return None
+
+    def transform(self, input_data):
+        FusableCenteringOperation.n_calls += 1
+        return input_data.features - input_data.features.mean(axis=1, keepdims=True)
+
+
+@pytest.fixture
+def channel_data():
+    features = np.random.rand(12, 4, 30)
+    return [InputData(idx=np.arange(features.shape[0]),
+                      features=channel,
+                      target=np.random.randint(2, size=features.shape[0]),
+                      task=Task(TaskTypesEnum.classification),
+                      data_type=DataTypesEnum.table) for channel in features.swapaxes(1, 0)]
+
+
+@pytest.mark.parametrize('n_jobs', [1, 4])
+def test_channel_independent_fit_predict(channel_data, n_jobs):
+    strategy = MultiDimPreprocessingStrategy(ChannelCenteringOperation, 'scaling',
+                                             mode='channel_independent', n_jobs=n_jobs)
+    trained_operation = strategy.fit(channel_data)
+    prediction = strategy._predict_for_ndim(channel_data, trained_operation)
+
+    assert len(trained_operation) == len(channel_data)
+    expected = np.hstack([data.features - data.features.mean() for data in channel_data])
+    assert np.allclose(np.ravel(prediction), np.ravel(expected))
+
+
+def test_channel_fused_predict(channel_data):
+    strategy = MultiDimPreprocessingStrategy(ChannelCenteringOperation, 'scaling', mode='channel_independent')
+    trained_operation = [FusableCenteringOperation() for _ in channel_data]
+    FusableCenteringOperation.n_calls = 0
+    prediction = strategy._predict_for_ndim(channel_data, trained_operation)
+
+    assert FusableCenteringOperation.n_calls == 1
+    expected = np.hstack([data.features - data.features.mean(axis=1, keepdims=True) for data in channel_data])
+    assert np.allclose(np.ravel(prediction), np.ravel(expected))
+
+
+@pytest.mark.parametrize('operation_impl, operation_type, params', [
+    (FourierBasisImplementation, 'fourier_basis', {'threshold': 20000}),
+    (WaveletBasisImplementation, 'wavelet_basis', {'n_components': 2, 'wavelet': 'mexh'}),
+    (WaveletBasisImplementation, 'wavelet_basis', {'n_components': 2, 'wavelet': 'db5'})
+])
+def test_channel_fused_basis(channel_data, operation_impl, operation_type, params, monkeypatch):
+    strategy = MultiDimPreprocessingStrategy(operation_impl, operation_type, OperationParameters(**params),
+                                             mode='channel_independent')
+    fused_calls = []
+    original_fit_fused = strategy._fit_fused
+
+    def fit_fused(*args):
+        fused_calls.append(args)
+        return original_fit_fused(*args)
+
+    monkeypatch.setattr(strategy, '_fit_fused', fit_fused)
+    fused_output = strategy.fit(channel_data)
+    channel_output = [operation_impl(OperationParameters(**params)).transform_for_fit(data) for data in channel_data]
+
+    assert len(fused_calls) == 1
+    assert len(fused_output) == len(channel_data)
+    for fused, channel in zip(fused_output, channel_output):
+        assert fused.predict.shape == channel.predict.shape
+        assert np.allclose(fused.predict, channel.predict)
+
+    fused_prediction = strategy._predict_for_ndim(channel_data, [operation_impl(OperationParameters(**params))])
+    channel_prediction = np.hstack([operation_impl(OperationParameters(**params)).transform(data).predict
+                                    for data in channel_data])
+    assert np.allclose(np.ravel(fused_prediction), np.ravel(channel_prediction))
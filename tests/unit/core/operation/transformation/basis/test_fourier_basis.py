@@ -44,3 +44,14 @@ def test_decompose_signal(input_train):
     transformed_sample = basis._decompose_signal(sample)
     assert isinstance(transformed_sample, np.ndarray)
     assert transformed_sample.shape[1] == len(sample)
+
+
+@pytest.mark.parametrize('approximation', ['smooth', 'exact'])
+def test_transform_batch(approximation):
+    basis = FourierBasisImplementation({"threshold": 20000, 'approximation': approximation})
+    features = np.random.rand(5, 3, 40)
+    batched = basis._transform_batch(features)
+    per_sample = np.array([[basis._decompose_signal(channel)[0] for channel in sample] for sample in features])
+    assert batched.shape == per_sample.shape
+    assert np.allclose(batched, per_sample)
+    assert basis.threshold == 20000
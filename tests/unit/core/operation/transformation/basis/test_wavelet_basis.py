@@ -78,3 +78,14 @@ def test_get_1d_bassis(input_train, wavelet, n_components):
     sample = input_train.features[0]
     extracted_basis = basis._get_1d_basis(sample)
     assert isinstance(extracted_basis, np.ndarray)
+
+
+@pytest.mark.parametrize('wavelet, n_components', [('mexh', 2), ('cmor', 4), ('db5', 2)])
+def test_transform_batch(wavelet, n_components):
+    basis = WaveletBasisImplementation({"wavelet": wavelet,
+                                        "n_components": n_components})
+    features = np.random.rand(5, 40)
+    batched = basis._transform_batch(features)
+    per_sample = np.array([basis._get_1d_basis(sample) for sample in features])
+    assert batched.shape[0] == features.shape[0]
+    assert np.allclose(batched.reshape(per_sample.shape), per_sample)
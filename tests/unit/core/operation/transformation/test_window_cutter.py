@@ -25,3 +25,27 @@ def test_WindowCutting(basic_periodic_data):
     windows_list = cutter.get_windows()
     assert len(windows_list) != 0
     assert list(windows_list[0].keys())[0] == "ts_1"
+
+
+def test_window_cutting_views(basic_periodic_data):
+    cutter = WindowCutter(window_len=100, window_step=10)
+    windows = cutter.cut({"ts_1": basic_periodic_data})["ts_1"]
+    assert windows.shape == ((basic_periodic_data.size - 100) // 10 + 1, 100)
+    assert np.array_equal(windows[3], basic_periodic_data[30:130])
+    assert np.shares_memory(windows, basic_periodic_data)
+
+
+def test_window_cutting_padding_and_labels():
+    series, labels = np.arange(25, dtype=float), np.arange(25)
+    cutter = WindowCutter(window_len=10, window_step=4, padding='pad', label_key='labels', label_alignment='last')
+    windows = cutter.cut({"data": series, "labels": labels})
+    assert windows["data"].shape == (5, 10)
+    assert np.isnan(windows["data"][-1, -1])
+    assert np.array_equal(windows["labels"], [9, 13, 17, 21, 24])
+
+
+def test_window_cutting_batch():
+    cutter = WindowCutter(window_len=4, window_step=2)
+    windows, groups = cutter.cut_batch([{"data": np.random.rand(10, 3)}, {"data": np.random.rand(7, 3)}])
+    assert windows["data"].shape == (6, 4, 3)
+    assert np.array_equal(groups, [0, 0, 0, 0, 1, 1])
@@ -101,3 +101,12 @@ def test_summary_statistics_subsequence_multiple(multiple_ts_data, selector_sss)
     selected_window = selector_sss.apply(time_series=ts)
     assert selected_window > 0
     assert selected_window < 100
+
+
+@pytest.mark.parametrize('method', ['dff', 'hac', 'mwf'])
+def test_batch_selection_matches_single(multiple_ts_data, method):
+    selector = WindowSizeSelector(method=method)
+    single_windows = [selector.get_window_size(time_series=ts) for ts in multiple_ts_data]
+    batch_windows = selector.apply_batch(time_series=multiple_ts_data, average=None)
+    assert batch_windows.shape == (multiple_ts_data.shape[0],)
+    assert np.array_equal(batch_windows, single_windows)
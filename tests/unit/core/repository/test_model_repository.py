@@ -0,0 +1,29 @@
+from sklearn.linear_model import LogisticRegression
+
+from fedot_ind.core.repository.model_repository import AtomizedModel, LazyOperationRegistry, \
+    default_industrial_availiable_operation
+
+
+def test_lazy_registry_imports_on_access():
+    registry = LazyOperationRegistry({'logit': 'sklearn.linear_model.LogisticRegression'})
+    assert 'logit' in registry
+    assert 'rf' not in registry
+    assert list(registry.keys()) == ['logit']
+    assert registry._loaded == {}
+    assert registry['logit'] is LogisticRegression
+    assert dict(registry) == {'logit': LogisticRegression}
+
+
+def test_atomized_models_are_lazy():
+    operations = default_industrial_availiable_operation('classification')
+    assert 'inception_model' in operations
+    for model_group in AtomizedModel:
+        assert isinstance(model_group.value, LazyOperationRegistry)
+
+
+def test_lazy_constants():
+    from fedot_ind.core.repository import constanst_repository
+
+    rmse = constanst_repository.RMSE
+    assert rmse is constanst_repository.TorchLossesConstant.RMSE.value
+    assert 'RMSE' in vars(constanst_repository)
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fedot_ind.tools.dataset_cache import DatasetCache
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    file_path = tmp_path / 'Dataset_TRAIN.ts'
+    file_path.write_text('@data\n1,2,3:a\n')
+    return str(file_path)
+
+
+def test_cache_array(tmp_path, source_file):
+    cache = DatasetCache(str(tmp_path / 'cache'))
+    checksum = cache.checksum([source_file])
+    features, target = np.random.rand(10, 20), np.arange(10)
+    cache.save('TRAIN', features, target, checksum)
+    cached_features, cached_target = cache.load('TRAIN', checksum)
+
+    assert np.array_equal(cached_features, features)
+    assert np.array_equal(cached_target, target)
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_cache_nested_unequal_length(tmp_path, source_file, mmap):
+    cache = DatasetCache(str(tmp_path / 'cache'), mmap=mmap)
+    checksum = cache.checksum([source_file])
+    features = pd.DataFrame({'dim_0': [pd.Series(np.random.rand(length)) for length in (5, 7, 3)],
+                             'dim_1': [pd.Series(np.random.rand(length)) for length in (5, 7, 3)]})
+    target = np.array(['a', 'b', 'a'], dtype=object)
+    cache.save('TRAIN', features, target, checksum)
+    cached_features, cached_target = cache.load('TRAIN', checksum)
+
+    assert list(cached_features.columns) == ['dim_0', 'dim_1']
+    for column in features.columns:
+        for cell, cached_cell in zip(features[column], cached_features[column]):
+            assert np.array_equal(cell.values, cached_cell.values)
+    assert cached_target.dtype == object
+    assert list(cached_target) == list(target)
+
+
+def test_cache_invalidated_by_source_change(tmp_path, source_file):
+    cache = DatasetCache(str(tmp_path / 'cache'))
+    cache.save('TRAIN', np.random.rand(3, 4), np.arange(3), cache.checksum([source_file]))
+    with open(source_file, 'a') as file:
+        file.write('4,5,6:b\n')
+
+    assert cache.load('TRAIN', cache.checksum([source_file])) is None
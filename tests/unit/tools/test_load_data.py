@@ -1,4 +1,5 @@
 import os
+import shutil
 
 import numpy as np
 import pandas as pd
@@ -18,6 +19,11 @@ def test_init_loader():
     assert loader.folder == path
 
 
+def test_default_cache_out_of_project():
+    loader = DataLoader(dataset_name='name')
+    assert not os.path.abspath(loader.cache_folder).startswith(PROJECT_PATH)
+
+
 def test_load_multivariate_data():
     train_data, test_data = DataLoader('Epilepsy').load_data()
     x_train, y_train = train_data
@@ -135,3 +141,53 @@ def test_read_train_test_files():
 
     for i in [x_train, y_train, x_test, y_test, is_multi]:
         assert i is not None
+
+
+def test_read_train_test_files_from_cache(tmp_path):
+    shutil.copytree(os.path.join(PROJECT_PATH, 'examples', 'data', 'ItalyPowerDemand_fake'),
+                    tmp_path / 'ItalyPowerDemand_fake')
+    loader = DataLoader(dataset_name='ItalyPowerDemand_fake', folder=str(tmp_path),
+                        cache_folder=str(tmp_path / 'cache'))
+    _, (x_train, y_train), (x_test, y_test) = loader.read_train_test_files(dataset_name='ItalyPowerDemand_fake',
+                                                                          data_path=str(tmp_path),
+                                                                          shuffle=False)
+    assert len(os.listdir(tmp_path / 'cache')) == 1
+    # data folder is left untouched
+    assert sorted(os.listdir(tmp_path / 'ItalyPowerDemand_fake')) == \
+        sorted(os.listdir(os.path.join(PROJECT_PATH, 'examples', 'data', 'ItalyPowerDemand_fake')))
+
+    _, (cached_x_train, cached_y_train), _ = loader.read_train_test_files(dataset_name='ItalyPowerDemand_fake',
+                                                                          data_path=str(tmp_path),
+                                                                          shuffle=False)
+    assert np.array_equal(np.asarray(cached_x_train), np.asarray(x_train))
+    assert np.array_equal(cached_y_train, y_train)
+
+
+def test__fast_load_from_tsfile():
+    loader = DataLoader(dataset_name='name', folder='.')
+    full_path = os.path.join(
+        PROJECT_PATH, 'examples/data/BitcoinSentiment/BitcoinSentiment_TEST.ts')
+    x, y = loader._fast_load_from_tsfile(full_file_path_and_name=full_path)
+    expected_x, expected_y = loader._load_from_tsfile_to_dataframe(full_file_path_and_name=full_path,
+                                                                   return_separate_X_and_y=True)
+    dense_x, _ = loader._fast_load_from_tsfile(full_file_path_and_name=full_path, return_dense=True)
+
+    assert x.shape == expected_x.shape
+    assert np.allclose(y, expected_y)
+    assert dense_x.shape == (x.shape[0], x.shape[1], x.iloc[0, 0].shape[0])
+    for dim, column in enumerate(expected_x.columns):
+        assert np.allclose(np.stack(expected_x[column].values), dense_x[:, dim])
+
+
+def test__fast_load_from_tsfile_unequal_length(tmp_path):
+    loader = DataLoader(dataset_name='name', folder='.')
+    full_path = tmp_path / 'Unequal_TRAIN.ts'
+    full_path.write_text('@problemName unequal\n@classLabel true a b\n@data\n1,2,3:4,?:a\n1,2:3,4,5,6:b\n')
+    x, y = loader._fast_load_from_tsfile(full_file_path_and_name=str(full_path), return_dense=True)
+    nested_x, _ = loader._fast_load_from_tsfile(full_file_path_and_name=str(full_path))
+
+    assert x.shape == (2, 2, 4)
+    assert np.isnan(x[0, 1, 1:]).all()
+    assert np.array_equal(x[1, 1], [3, 4, 5, 6])
+    assert list(y) == ['a', 'b']
+    assert nested_x.iloc[1, 0].shape[0] == 2
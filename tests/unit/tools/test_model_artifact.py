@@ -0,0 +1,109 @@
+import mmap
+
+import numpy as np
+import pytest
+import torch
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+
+from fedot_ind.api.utils.checkers_collections import DataCheck
+from fedot_ind.tools.model_artifact import ModelArtifact
+
+
+@pytest.fixture
+def data(industrial_models):
+    features = np.random.rand(40, 50)
+    return DataCheck(input_data=(features, (features[:, 0] > 0.5).astype(int)),
+                     task='classification').check_input_data()
+
+
+def test_artifact_pipeline(tmp_path, data):
+    pipeline = PipelineBuilder().add_node('quantile_extractor').add_node('logit').build()
+    pipeline.fit(data)
+    artifact = ModelArtifact(str(tmp_path / 'model.fedotind'))
+    artifact.save({'best': pipeline}, metadata={'problem': 'classification'})
+    loaded = artifact.load()['best']
+
+    assert ModelArtifact.is_artifact(artifact.path)
+    assert artifact.read_manifest()['metadata'] == {'problem': 'classification'}
+    # fitted operations are restored only when they are used
+    assert all(node._pending_record is not None for node in loaded.nodes)
+    assert [node.name for node in loaded.nodes] == [node.name for node in pipeline.nodes]
+    assert np.allclose(loaded.predict(data, output_mode='probs').predict,
+                       pipeline.predict(data, output_mode='probs').predict)
+
+
+def test_artifact_blobs(tmp_path):
+    weights = torch.nn.Parameter(torch.rand(64, 64))
+    obj = {'array': np.random.rand(100, 100), 'small': np.arange(3), 'weights': weights, 'tied': weights}
+    artifact = ModelArtifact(str(tmp_path / 'model.fedotind'))
+    with open(artifact.path, 'wb') as file:
+        record = artifact._write_record(file, obj)
+    restored = artifact.read_record(record)
+
+    assert len(record['arrays']) == 2
+    assert all(array['offset'] % 64 == 0 for array in record['arrays'])
+    assert np.array_equal(restored['array'], obj['array'])
+    assert np.array_equal(restored['small'], obj['small'])
+    assert isinstance(restored['weights'], torch.nn.Parameter)
+    assert torch.equal(restored['weights'], weights)
+    assert restored['tied'] is restored['weights']
+
+
+def test_artifact_torch_module(tmp_path):
+    head = torch.nn.Linear(32, 32)
+    network = torch.nn.Sequential(torch.nn.Linear(32, 32), torch.nn.BatchNorm1d(32), torch.nn.ReLU(), head)
+    network[1].register_buffer('scratch', torch.rand(512), persistent=False)
+    obj = {'network': network.eval(), 'head': head, 'parameter': head.weight}
+    artifact = ModelArtifact(str(tmp_path / 'model.fedotind'))
+    with open(artifact.path, 'wb') as file:
+        record = artifact._write_record(file, obj)
+    restored = artifact.read_record(record)
+    buffer = np.frombuffer(artifact._buffer, dtype=np.uint8)
+    features = torch.rand(4, 32)
+
+    assert torch.allclose(restored['network'](features), network(features))
+    assert restored['head'] is restored['network'][3]
+    assert restored['parameter'] is restored['head'].weight
+    assert restored['network'].state_dict().keys() == network.state_dict().keys()
+    assert torch.equal(restored['network'][1].scratch, network[1].scratch)
+    for name, tensor in restored['network'].state_dict(keep_vars=True).items():
+        assert type(tensor) is type(network.state_dict(keep_vars=True)[name])
+        assert not tensor.is_meta
+    # weights are views of the mapped file
+    weights = restored['network'][0].weight
+    assert buffer.ctypes.data <= weights.data_ptr() < buffer.ctypes.data + buffer.size
+
+
+def test_artifact_mapped_once(tmp_path, data, monkeypatch):
+    pipeline = PipelineBuilder().add_node('quantile_extractor').add_node('logit').build()
+    pipeline.fit(data)
+    artifact = ModelArtifact(str(tmp_path / 'model.fedotind'))
+    artifact.save(pipeline)
+    mappings = []
+    original_mmap = mmap.mmap
+
+    def mapping(*args, **kwargs):
+        mappings.append(args)
+        return original_mmap(*args, **kwargs)
+
+    monkeypatch.setattr(mmap, 'mmap', mapping)
+    loaded = artifact.load()['pipeline']
+    loaded.predict(data)
+
+    assert len(mappings) == 1
+    assert all(node._artifact is artifact for node in loaded.nodes)
+
+
+def test_not_artifact(tmp_path):
+    path = tmp_path / 'model.fedotind'
+    path.write_bytes(b'\0' * 64)
+    assert not ModelArtifact.is_artifact(str(path))
+    with pytest.raises(ValueError):
+        ModelArtifact(str(path)).load()
+
+
+def test_truncated_artifact(tmp_path):
+    path = tmp_path / 'model.fedotind'
+    path.write_bytes(b'\0' * 4)
+    with pytest.raises(ValueError):
+        ModelArtifact(str(path)).read_manifest()
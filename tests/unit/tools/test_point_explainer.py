@@ -1,6 +1,7 @@
 import math
 import warnings
 
+import numpy as np
 import pytest
 from matplotlib import get_backend, pyplot as plt
 
@@ -64,3 +65,50 @@ def test_explain(data, model, distance, window):
     expected_n_parts = math.ceil(
         ts_len / (window * ts_len // 100)) if window != 0 else ts_len
     assert explainer.scaled_vector.shape[0] == expected_n_parts
+
+
+class WindowMeanModel:
+    def __init__(self):
+        self.n_calls = 0
+
+    def predict_proba(self, X):
+        self.n_calls += 1
+        # doesn't saturate for large values, so perturbation of any point in the window changes probabilities
+        proba = 1 / (1 + np.abs(np.asarray(X, dtype=float)[:, 10:20].mean(axis=1)))
+        return np.stack([1 - proba, proba], axis=1)
+
+
+@pytest.mark.parametrize('window', [0, 30])
+def test_explain_batched(data, window):
+    _, _, X_test, y_test = data
+    model = WindowMeanModel()
+    explainer = PointExplainer(model, X_test, y_test)
+    explainer.explain(n_samples=1, window=window, batched=True, batch_size=16)
+
+    ts_len = X_test.shape[1]
+    expected_n_parts = math.ceil(
+        ts_len / (window * ts_len // 100)) if window != 0 else ts_len
+    assert explainer.scaled_vector.shape[0] == expected_n_parts
+    # one call for base probabilities and one call per chunk of perturbed variants
+    assert model.n_calls <= 1 + math.ceil(2 * expected_n_parts / 16)
+    if window == 0:
+        # only the points the model looks at are important
+        for cls in explainer.scaled_vector.columns:
+            assert explainer.scaled_vector[cls].values.argmax() in range(10, 20)
+
+
+def test_explain_batched_budget(data):
+    _, _, X_test, y_test = data
+    explainer = PointExplainer(WindowMeanModel(), X_test, y_test)
+    explainer.explain(n_samples=1, window=0, batched=True, max_evaluations=20)
+    assert explainer.scaled_vector.shape[0] * 2 <= 20
+
+
+def test_explain_batched_skips_unchanged_variants(data):
+    _, _, X_test, y_test = data
+    model = WindowMeanModel()
+    # perturbation of constant series with their mean doesn't change them
+    explainer = PointExplainer(model, np.ones_like(np.asarray(X_test, dtype=float)), y_test)
+    explainer.explain(n_samples=1, window=10, batched=True)
+    assert model.n_calls == 1
+    assert np.allclose(explainer.scaled_vector.values, 0)